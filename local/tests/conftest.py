@@ -2,6 +2,8 @@ from typing import Iterator
 
 import pytest
 
+from cuid2 import DEFAULT_LENGTH
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add a command line option to pytest to run slow tests.
@@ -12,6 +14,18 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         Used to define and parse command-line arguments for the pytest test runner.
     """
     parser.addoption("--runslow", action="store_true", default=False, help="run slow tests")
+    parser.addoption(
+        "--collision-ids",
+        type=int,
+        default=0,
+        help="total number of CUIDs checked for collisions by the scalable collision test, with --runslow",
+    )
+    parser.addoption(
+        "--collision-length",
+        type=int,
+        default=DEFAULT_LENGTH,
+        help="length of the CUIDs checked for collisions by the scalable collision test (default: %(default)s)",
+    )
 
 
 def pytest_configure(config: pytest.Config) -> None:
@@ -0,0 +1,176 @@
+import asyncio
+import gc
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cuid2 import DEFAULT_LENGTH, Cuid
+from cuid2.aio import AsyncCuid
+
+if TYPE_CHECKING:
+    from typing import Awaitable, Callable
+    from unittest.mock import Mock
+
+
+class TestAsyncCuid:
+    #  Tests that the constructor raises a ValueError when the chunk size is less than 1
+    def test_invalid_chunk_size(self: "TestAsyncCuid") -> None:
+        with pytest.raises(ValueError, match="Cannot generate CUIDs asynchronously without a chunk size >= 1."):
+            AsyncCuid(chunk_size=0)
+
+    #  Tests that agenerate() returns CUIDs with the default length, starting with a letter
+    def test_agenerate_format(self: "TestAsyncCuid") -> None:
+        async def main() -> list[str]:
+            async_cuid = AsyncCuid(chunk_size=16)
+            cuids = [await async_cuid.agenerate() for _ in range(100)]
+            await async_cuid.aclose()
+            return cuids
+
+        cuids = asyncio.run(main())
+        assert len(set(cuids)) == 100
+        assert all(len(cuid) == DEFAULT_LENGTH and cuid[0] in string.ascii_lowercase for cuid in cuids)
+
+    #  Tests that agenerate() generates chunks in the executor rather than on the event loop
+    def test_agenerate_uses_executor(self: "TestAsyncCuid", mocker: "Mock") -> None:
+        cuid = Cuid()
+        spy = mocker.spy(cuid, "generate_many")
+
+        async def main() -> None:
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="cuid2-test") as executor:
+                async_cuid = AsyncCuid(cuid=cuid, chunk_size=64, executor=executor)
+                await async_cuid.agenerate()
+                await async_cuid.aclose()
+
+        asyncio.run(main())
+        spy.assert_called_with(64)
+
+    #  Tests that concurrent awaits never receive the same CUID
+    def test_concurrent_agenerate_unique_ids(self: "TestAsyncCuid") -> None:
+        async def main() -> list[str]:
+            async_cuid = AsyncCuid(chunk_size=32)
+            cuids = await asyncio.gather(*(async_cuid.agenerate() for _ in range(1_000)))
+            await async_cuid.aclose()
+            return list(cuids)
+
+        cuids = asyncio.run(main())
+        assert len(set(cuids)) == len(cuids)
+
+    #  Tests that concurrent awaits on an empty queue all wait on a single refill
+    def test_concurrent_agenerate_single_refill(self: "TestAsyncCuid", mocker: "Mock") -> None:
+        cuid = Cuid()
+        spy = mocker.spy(cuid, "generate_many")
+
+        async def main() -> None:
+            async_cuid = AsyncCuid(cuid=cuid, chunk_size=64)
+            await asyncio.gather(*(async_cuid.agenerate() for _ in range(10)))
+            await async_cuid.aclose()
+
+        asyncio.run(main())
+        spy.assert_called_once_with(64)
+
+    #  Tests that the exception of a failed background refill is raised to the next caller, and never left unretrieved
+    def test_failed_refill_is_raised(self: "TestAsyncCuid", mocker: "Mock") -> None:
+        cuid = Cuid()
+        mocker.patch.object(
+            cuid,
+            "generate_many",
+            side_effect=[cuid.generate_many(8), RuntimeError("refill failed"), cuid.generate_many(8)],
+        )
+
+        async def main() -> list[dict[str, object]]:
+            unhandled: list[dict[str, object]] = []
+            asyncio.get_running_loop().set_exception_handler(lambda _, context: unhandled.append(context))
+            async_cuid = AsyncCuid(cuid=cuid, chunk_size=8)
+            # The seventh string leaves 1 in the queue, below the low watermark of 2, after starting a refill.
+            for _ in range(7):
+                await async_cuid.agenerate()
+            refill_task = async_cuid._refill_task
+            assert refill_task is not None
+            await asyncio.wait([refill_task])
+            with pytest.raises(RuntimeError, match="refill failed"):
+                await async_cuid.agenerate()
+            # The string left in the queue is not lost, and the next refill succeeds.
+            await async_cuid.agenerate()
+            assert len(await async_cuid.agenerate_many(8)) == 8
+            await async_cuid.aclose()
+            del refill_task
+            gc.collect()
+            return unhandled
+
+        assert asyncio.run(main()) == []
+
+    #  Tests that agenerate_many() starts a refill once it drains the queue below the low watermark
+    def test_agenerate_many_refills(self: "TestAsyncCuid") -> None:
+        async def main() -> int:
+            async_cuid = AsyncCuid(chunk_size=64)
+            await async_cuid.agenerate()
+            await async_cuid.agenerate_many(60)
+            assert async_cuid._refill_task is not None
+            await async_cuid._refill_task
+            queued = len(async_cuid._queue)
+            await async_cuid.aclose()
+            return queued
+
+        assert asyncio.run(main()) == 3 + 64
+
+    #  Tests that agenerate_many() returns the requested number of CUIDs, from the queue or the executor
+    @pytest.mark.parametrize("count", [0, 1, 10, 5_000])
+    def test_agenerate_many(self: "TestAsyncCuid", count: int) -> None:
+        async def main() -> list[str]:
+            async_cuid = AsyncCuid(chunk_size=64)
+            await async_cuid.agenerate()
+            cuids = await async_cuid.agenerate_many(count)
+            await async_cuid.aclose()
+            return cuids
+
+        cuids = asyncio.run(main())
+        assert len(cuids) == count
+        assert len(set(cuids)) == count
+
+    #  Tests that agenerate_many() raises a ValueError when count is negative
+    def test_agenerate_many_negative_count(self: "TestAsyncCuid") -> None:
+        with pytest.raises(ValueError, match="Cannot generate a negative number of CUIDs."):
+            asyncio.run(AsyncCuid().agenerate_many(-1))
+
+    #  Benchmarks the event loop lag while minting CUIDs, against calling Cuid.generate() on the event loop.
+    @pytest.mark.slow()
+    def test_event_loop_lag(self: "TestAsyncCuid") -> None:
+        bursts, burst_size = 50, 1_000
+
+        async def measure_lag(workload: "Callable[[], Awaitable[None]]") -> float:
+            lags: list[float] = []
+            done = False
+
+            async def ticker() -> None:
+                while not done:
+                    start = time.perf_counter()
+                    await asyncio.sleep(0.001)
+                    lags.append(time.perf_counter() - start - 0.001)
+
+            ticker_task = asyncio.ensure_future(ticker())
+            await workload()
+            done = True
+            await ticker_task
+            return max(lags)
+
+        async def synchronous() -> None:
+            cuid = Cuid()
+            for _ in range(bursts):
+                [cuid.generate() for _ in range(burst_size)]
+                await asyncio.sleep(0)
+
+        async def asynchronous() -> None:
+            async_cuid = AsyncCuid(chunk_size=burst_size)
+            for _ in range(bursts):
+                await async_cuid.agenerate_many(burst_size)
+            await async_cuid.aclose()
+
+        synchronous_lag = asyncio.run(measure_lag(synchronous))
+        asynchronous_lag = asyncio.run(measure_lag(asynchronous))
+        print(  # noqa: T201
+            f"max event loop lag: {synchronous_lag * 1000:.1f}ms sync, {asynchronous_lag * 1000:.1f}ms async",
+        )
+        assert asynchronous_lag < synchronous_lag
@@ -0,0 +1,41 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from cuid2 import bench
+
+
+class TestBench:
+    #  Tests that run() returns metadata and a positive rate for every benchmark of every section
+    def test_run_all_sections(self: "TestBench") -> None:
+        results = bench.run(iterations=10, repeat=1)
+        assert results["metadata"]["iterations"] == 10
+        assert set(results["results"]) == set(bench.BENCHMARKS)
+        assert all(rate > 0 for section in results["results"].values() for rate in section.values())
+
+    #  Tests that run() only runs the requested sections
+    def test_run_selected_sections(self: "TestBench") -> None:
+        results = bench.run(["baselines"], iterations=10, repeat=1)
+        assert set(results["results"]) == {"baselines"}
+
+    #  Tests that compare() reports benchmarks slower than the tolerance, and ignores missing benchmarks
+    def test_compare(self: "TestBench") -> None:
+        baseline = {"results": {"generate": {"fast": 100.0, "slow": 100.0, "removed": 100.0}}}
+        current = {"results": {"generate": {"fast": 95.0, "slow": 80.0, "added": 1.0}}}
+        regressions = bench.compare(baseline, current, tolerance=0.1)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("generate/slow:")
+
+    #  Tests that main() writes JSON results, and exits with an error when a regression is detected
+    def test_main(self: "TestBench", tmp_path: Path) -> None:
+        output = tmp_path / "results.json"
+        bench.main(["-s", "baselines", "-i", "10", "-r", "1", "-o", str(output)])
+        results = json.loads(output.read_text())
+        assert set(results["results"]) == {"baselines"}
+
+        results["results"]["baselines"] = {name: rate * 1000 for name, rate in results["results"]["baselines"].items()}
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(results))
+        with pytest.raises(SystemExit):
+            bench.main(["-s", "baselines", "-i", "10", "-r", "1", "-o", str(output), "-c", str(baseline)])
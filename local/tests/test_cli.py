@@ -0,0 +1,54 @@
+import string
+from pathlib import Path
+
+import pytest
+
+from cuid2 import DEFAULT_LENGTH, cli
+
+
+def assert_cuids(lines: list[str], count: int, length: int) -> None:
+    """Assert that `lines` holds `count` unique CUIDs of the given length."""
+    assert len(lines) == count
+    assert len(set(lines)) == count
+    assert all(len(line) == length and line[0] in string.ascii_lowercase for line in lines)
+
+
+class TestMain:
+    #  Tests that main() prints a single CUID by default
+    def test_default_prints_one_cuid(self: "TestMain", capsys: pytest.CaptureFixture[str]) -> None:
+        cli.main([])
+        assert_cuids(capsys.readouterr().out.splitlines(), 1, DEFAULT_LENGTH)
+
+    #  Tests that main() prints the requested number of CUIDs of the requested length, across chunks
+    @pytest.mark.parametrize(("count", "length"), [(0, 10), (3, 10), (cli.CHUNK_SIZE * 2 + 5, DEFAULT_LENGTH)])
+    def test_count_and_length(
+        self: "TestMain",
+        capsysbinary: pytest.CaptureFixture[bytes],
+        count: int,
+        length: int,
+    ) -> None:
+        cli.main(["--count", str(count), "--length", str(length)])
+        assert_cuids(capsysbinary.readouterr().out.decode().splitlines(), count, length)
+
+    #  Tests that main() writes the CUIDs to an output file
+    def test_output_file(self: "TestMain", tmp_path: Path, capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+        output = tmp_path / "cuids.txt"
+        cli.main(["-n", "100", "-o", str(output)])
+        assert capsysbinary.readouterr().out == b""
+        assert_cuids(output.read_text().splitlines(), 100, DEFAULT_LENGTH)
+
+    #  Tests that main() generates unique CUIDs across worker processes
+    def test_workers(self: "TestMain", tmp_path: Path) -> None:
+        output = tmp_path / "cuids.txt"
+        cli.main(["-n", str(cli.CHUNK_SIZE * 3), "-w", "2", "-o", str(output)])
+        assert_cuids(output.read_text().splitlines(), cli.CHUNK_SIZE * 3, DEFAULT_LENGTH)
+
+    #  Tests that main() exits with an error when given invalid arguments
+    @pytest.mark.parametrize(
+        "argv",
+        [["-n", "-1"], ["-l", "0"], ["-l", "99"], ["-w", "0"], ["-n", "ten"]],
+    )
+    def test_invalid_arguments(self: "TestMain", argv: list[str], capsys: pytest.CaptureFixture[str]) -> None:
+        with pytest.raises(SystemExit):
+            cli.main(argv)
+        assert "error" in capsys.readouterr().err
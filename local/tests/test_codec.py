@@ -0,0 +1,140 @@
+import sys
+import uuid
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cuid2 import DEFAULT_LENGTH, Cuid, codec
+from cuid2.generator import MAXIMUM_LENGTH
+
+if TYPE_CHECKING:
+    from unittest.mock import Mock
+
+INVALID_CUIDS = [
+    "",
+    "1abc",
+    "Abc",
+    "aBc",
+    "a-bc",
+    " abc",
+    "abc\n",
+    "a_bc",
+    "+abc",
+    "ａbc",  # noqa: RUF001 (fullwidth letter on purpose)
+    "a٣",
+    "a" * 99,
+]
+
+
+class TestCodec:
+    #  Tests that byte_size() returns the smallest size that holds every CUID of a length
+    @pytest.mark.parametrize(("length", "size"), [(1, 1), (3, 2), (DEFAULT_LENGTH, 16), (25, 17), (MAXIMUM_LENGTH, 64)])
+    def test_byte_size(self: "TestCodec", length: int, size: int) -> None:
+        assert codec.byte_size(length) == size
+        assert (36**length - 1).bit_length() <= size * 8 < (36**length - 1).bit_length() + 8
+
+    #  Tests that byte_size() raises a ValueError when the length is out of range
+    @pytest.mark.parametrize("length", [0, MAXIMUM_LENGTH + 1])
+    def test_byte_size_invalid_length(self: "TestCodec", length: int) -> None:
+        with pytest.raises(ValueError, match="Length must be between 1 and 98 characters."):
+            codec.byte_size(length)
+
+    #  Tests that CUIDs of every length round-trip through integers and fixed-width bytes without a length tag
+    @pytest.mark.parametrize("length", [2, 10, DEFAULT_LENGTH, 25, 64, MAXIMUM_LENGTH])
+    def test_round_trip(self: "TestCodec", length: int) -> None:
+        for cuid in Cuid(length=length).generate_many(100):
+            size = codec.byte_size(length)
+            assert codec.decode_int(codec.encode_int(cuid)) == cuid
+            assert len(codec.encode_bytes(cuid, size)) == size
+            assert codec.decode_bytes(codec.encode_bytes(cuid, size)) == cuid
+
+    #  Tests that CUIDs of different lengths, including shorter CUIDs than the size holds, never decode to each other
+    def test_length_is_implicit(self: "TestCodec") -> None:
+        cuids = ["a", "a0", "a00", "z", "za", "b0000000000000000000000", "zzzzzzzzzzzzzzzzzzzzzzzz"]
+        encoded = [codec.encode_bytes(cuid) for cuid in cuids]
+        assert len(set(encoded)) == len(cuids)
+        assert [codec.decode_bytes(data) for data in encoded] == cuids
+
+    #  Tests that fixed-width encodings sort in the same order as CUIDs of the same length
+    def test_order_is_preserved(self: "TestCodec") -> None:
+        cuids = Cuid().generate_many(1000)
+        assert sorted(cuids, key=codec.encode_bytes) == sorted(cuids)
+
+    #  Tests that CUIDs of up to 24 characters round-trip through UUIDs
+    def test_uuid_round_trip(self: "TestCodec") -> None:
+        for cuid in [*Cuid().generate_many(100), "zzzzzzzzzzzzzzzzzzzzzzzz", "a"]:
+            value = codec.encode_uuid(cuid)
+            assert isinstance(value, uuid.UUID)
+            assert codec.decode_uuid(uuid.UUID(str(value))) == cuid
+
+    #  Tests that encode_uuid() raises a ValueError when the CUID is longer than 24 characters
+    def test_uuid_too_long(self: "TestCodec") -> None:
+        with pytest.raises(ValueError, match="Cannot encode a CUID longer than 24 characters in a UUID."):
+            codec.encode_uuid(Cuid(length=25).generate())
+
+    #  Tests that encode_bytes() raises a ValueError when the CUID does not fit in the size
+    def test_encode_bytes_overflow(self: "TestCodec") -> None:
+        with pytest.raises(ValueError, match="Cannot encode a CUID of 25 characters in 16 bytes."):
+            codec.encode_bytes("z" * 25)
+
+    #  Tests that the encoders raise a ValueError for values that are not CUIDs, even if int() accepts them
+    @pytest.mark.parametrize("value", INVALID_CUIDS)
+    def test_encode_invalid(self: "TestCodec", value: str) -> None:
+        with pytest.raises(ValueError, match="Cannot encode a value that is not a CUID"):
+            codec.encode_int(value)
+        with pytest.raises(ValueError, match="Cannot encode a value that is not a CUID"):
+            codec.encode_many(["abc", value, "def"])
+
+    #  Tests that the decoders raise a ValueError for values that are not encoded CUIDs
+    @pytest.mark.parametrize("number", [-1, 0, 9, 36, 36**23, 36**MAXIMUM_LENGTH])
+    def test_decode_invalid(self: "TestCodec", number: int) -> None:
+        with pytest.raises(ValueError, match="Cannot decode a value that is not an encoded CUID"):
+            codec.decode_int(number)
+
+    #  Tests that encode_many() and decode_many() round-trip, with and without NumPy
+    @pytest.mark.parametrize("numpy", [True, False])
+    @pytest.mark.parametrize("length", [1, 7, DEFAULT_LENGTH, MAXIMUM_LENGTH])
+    def test_many_round_trip(self: "TestCodec", mocker: "Mock", numpy: bool, length: int) -> None:
+        if numpy:
+            pytest.importorskip("numpy")
+            mocker.patch.object(codec, "NUMPY_THRESHOLD", 1)
+        else:
+            mocker.patch.dict(sys.modules, {"numpy": None})
+
+        cuids = [Cuid(length=max(length, 2)).generate()[:length] for _ in range(500)]
+        size = codec.byte_size(length)
+        buffer = codec.encode_many(iter(cuids), size)
+        assert buffer == b"".join(codec.encode_bytes(cuid, size) for cuid in cuids)
+        assert codec.decode_many(buffer, size) == cuids
+        assert codec.decode_many(memoryview(bytearray(buffer)), size) == cuids
+
+    #  Tests that encode_many() and decode_many() accept empty inputs
+    def test_many_empty(self: "TestCodec") -> None:
+        assert codec.encode_many([]) == b""
+        assert codec.decode_many(b"") == []
+
+    #  Tests that encode_many() falls back to checking each CUID when some are longer than the size always holds
+    def test_encode_many_long_cuids(self: "TestCodec") -> None:
+        assert codec.decode_many(codec.encode_many(["a" * 25], size=16)) == ["a" * 25]
+        with pytest.raises(ValueError, match="Cannot encode a CUID of 25 characters in 16 bytes."):
+            codec.encode_many(["abc", "z" * 25])
+
+    #  Tests that decode_many() raises a ValueError when the buffer is not made of whole records
+    def test_decode_many_partial_record(self: "TestCodec") -> None:
+        with pytest.raises(ValueError, match="Cannot decode a buffer of 17 bytes into records of 16 bytes."):
+            codec.decode_many(bytes(17))
+
+    #  Tests that decode_many() raises a ValueError when any record is not an encoded CUID, with and without NumPy
+    @pytest.mark.parametrize("numpy", [True, False])
+    @pytest.mark.parametrize("record", [bytes(16), (36).to_bytes(16, "big"), b"\xff" * 64])
+    def test_decode_many_invalid(self: "TestCodec", mocker: "Mock", numpy: bool, record: bytes) -> None:
+        if numpy:
+            pytest.importorskip("numpy")
+            mocker.patch.object(codec, "NUMPY_THRESHOLD", 1)
+        else:
+            mocker.patch.dict(sys.modules, {"numpy": None})
+
+        size = len(record)
+        buffer = codec.encode_many(["abc"] * 10, size) + record + codec.encode_many(["def"], size)
+        with pytest.raises(ValueError, match="Cannot decode a value that is not an encoded CUID"):
+            codec.decode_many(buffer, size)
@@ -1,59 +1,228 @@
 from __future__ import annotations
 
+import heapq
+import os
+from bisect import bisect_left, bisect_right
 from collections import Counter
-from functools import reduce
+from functools import partial
+from itertools import repeat
 from math import ceil, floor
 from multiprocessing import Pool
-from typing import Any, Callable, Dict, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Tuple
 
 import pytest
 
-from cuid2 import Cuid
+from cuid2 import DEFAULT_LENGTH, Cuid
+from cuid2.utils import base36_encode
 
+if TYPE_CHECKING:
+    from unittest.mock import Mock
 
-def cuid_generator(max_ids: int) -> Dict[str, Any]:
-    """Generate a specified number of unique IDs using the CUID library and return a dictionary containing
-    information about the generated IDs.
+# The number of CUIDs generated with each call to `Cuid.generate_many`.
+BATCH_SIZE: int = 10_000
+# The number of CUIDs a worker holds in memory before sorting them and spilling them to disk, which bounds the memory
+# used by each worker to roughly 150 bytes per CUID.
+RUN_SIZE: int = 1_000_000
+# The number of records read at a time from a run while merging.
+READ_SIZE: int = 65_536
+BUCKET_COUNT: int = 20
+
+# A sorted run spilled to disk by a worker: its path, and the index of the first record of every partition.
+Run = Tuple[str, List[int]]
+
+
+def record_size(length: int) -> int:
+    """Return the number of bytes of a CUID of `length` characters packed as a fixed-width, big-endian integer.
+
+    Parameters
+    ----------
+    length : int
+        The length of the CUIDs.
+
+    Returns
+    -------
+    int
+        The size of each packed record, in bytes.
+    """
+    return ceil((36**length - 1).bit_length() / 8)
+
+
+def partition_bounds(length: int, partitions: int) -> List[int]:
+    """Split the packed values of CUIDs of `length` characters into `partitions` contiguous ranges.
+
+    CUIDs start with a letter, so the packed values of full length CUIDs are in `[10 * 36**(length - 1), 36**length)`.
+    The rare CUIDs that are shorter than `length` (see `Cuid.generate`) have lower values, and fall in the first range.
+
+    Parameters
+    ----------
+    length : int
+        The length of the CUIDs.
+    partitions : int
+        The number of ranges.
+
+    Returns
+    -------
+    list[int]
+        The lowest value of every range but the first.
+    """
+    low: int = 10 * 36 ** (length - 1)
+    width: int = ceil((36**length - low) / partitions)
+    return [low + width * index for index in range(1, partitions)]
+
+
+def spill_run(values: List[int], path: Path, length: int, bounds: List[int]) -> Run:
+    """Sort packed CUIDs, and write them to `path` as fixed-width records.
+
+    Parameters
+    ----------
+    values : list[int]
+        The packed CUIDs, which are sorted in place.
+    path : Path
+        The file the sorted records are written to.
+    length : int
+        The length of the CUIDs.
+    bounds : list[int]
+        The partition bounds, as returned by `partition_bounds`.
+
+    Returns
+    -------
+    Run
+        The path of the run, and the index of the first record of every partition.
+    """
+    values.sort()
+    size: int = record_size(length)
+    with path.open("wb") as run_file:
+        for start in range(0, len(values), READ_SIZE):
+            run_file.write(b"".join(value.to_bytes(size, "big") for value in values[start : start + READ_SIZE]))
+    return str(path), [0, *(bisect_left(values, bound) for bound in bounds), len(values)]
+
+
+def cuid_generator(max_ids: int, length: int, directory: str, partitions: int, method: str) -> Dict[str, Any]:
+    """Generate a specified number of unique IDs using the CUID library, and spill them to disk as sorted runs of
+    packed integers.
 
     Parameters
     ----------
     max_ids : int
         The maximum number of unique IDs to generate.
+    length : int
+        The length of the generated IDs.
+    directory : str
+        The directory the sorted runs are written to.
+    partitions : int
+        The number of partitions the runs are split into, so that they can be merged in parallel.
+    method : str
+        Either "generate", to generate the IDs one at a time, or "generate_many", to generate them in batches of
+        `BATCH_SIZE`.
 
     Returns
     -------
     dict[str, Any]
-        a dictionary containing three keys: "ids", "id_histogram", and "char_histogram".
-        The "ids" key contains a set of unique CUIDs generated by the function.
+        a dictionary containing three keys: "runs", "id_histogram", and "char_histogram".
+        The "runs" key contains the sorted runs written by the function.
         The "id_histogram" and "char_histogram" keys contains a Counter object that counts the
         frequency of each bucket in which the CUIDs fall
     """
-    str_base: int = 36
-
-    def _id_to_int(value: str, radix: int = str_base) -> int:
-        return reduce(lambda r, v: r * radix + int(v, radix), value, 0)
+    cuid: Cuid = Cuid(length=length)
+    bounds: List[int] = partition_bounds(length, partitions)
+    generate: Callable[[int], List[str]] = (
+        cuid.generate_many if method == "generate_many" else lambda count: [cuid.generate() for _ in range(count)]
+    )
+    body_size: int = 36 ** (length - 1)
+    bucket_bounds: List[int] = [ceil(body_size * index / BUCKET_COUNT) for index in range(1, BUCKET_COUNT)]
 
-    cuid: Callable[[], str] = Cuid().generate
-    bucket_count: int = 20
-
-    result: dict[str, Any] = {
-        "ids": set(),
+    result: Dict[str, Any] = {
+        "runs": [],
         "id_histogram": Counter(),
         "char_histogram": Counter(),
     }
 
-    bucket_length: int = ceil(str_base**23 / bucket_count)
+    generated: int = 0
+    while generated < max_ids:
+        run_size: int = min(RUN_SIZE, max_ids - generated)
+        values: List[int] = []
+        for start in range(0, run_size, BATCH_SIZE):
+            batch: List[str] = generate(min(BATCH_SIZE, run_size - start))
+            # Letters are base36 digits, so every CUID is already a base36 numeral.
+            values.extend(map(int, batch, repeat(36)))
+            result["char_histogram"].update("".join(uid[1:] for uid in batch))
+
+        # The body of a CUID, after its letter, is the packed value modulo `36**(length - 1)`.
+        result["id_histogram"].update(bisect_right(bucket_bounds, value % body_size) for value in values)
 
-    for _ in range(max_ids):
-        uid: str = cuid()
-        result["ids"].add(uid)
-        result["id_histogram"][_id_to_int(uid[1:]) // bucket_length] += 1
-        for char in uid[1:]:
-            result["char_histogram"][char] += 1
+        path: Path = Path(directory) / f"{os.getpid()}-{generated}.run"
+        run: Run = spill_run(values, path, length, bounds)
+        result["runs"].append(run)
+        generated += run_size
 
     return result
 
 
+def read_records(path: str, start: int, stop: int, size: int) -> Iterator[bytes]:
+    """Read the records `[start, stop)` of a sorted run.
+
+    Parameters
+    ----------
+    path : str
+        The path of the run.
+    start : int
+        The index of the first record to read.
+    stop : int
+        The index after the last record to read.
+    size : int
+        The size of each record, in bytes.
+
+    Yields
+    ------
+    bytes
+        Each record, in order.
+    """
+    with open(path, "rb") as run_file:  # noqa: PTH123 (builtin open)
+        run_file.seek(start * size)
+        remaining: int = stop - start
+        while remaining > 0:
+            block: bytes = run_file.read(min(remaining, READ_SIZE) * size)
+            if not block:
+                msg = f"{path} ended before record {stop}"
+                raise EOFError(msg)
+            remaining -= len(block) // size
+            yield from (block[offset : offset + size] for offset in range(0, len(block), size))
+
+
+def merge_partition(partition: int, runs: List[Run], length: int) -> Tuple[int, List[bytes]]:
+    """Merge one partition of every sorted run, and scan the merged records for duplicates.
+
+    Parameters
+    ----------
+    partition : int
+        The index of the partition to merge.
+    runs : list[Run]
+        The sorted runs written by `cuid_generator`.
+    length : int
+        The length of the CUIDs.
+
+    Returns
+    -------
+    tuple[int, list[bytes]]
+        The number of records in the partition, and every record found more than once.
+    """
+    size: int = record_size(length)
+    records: Iterator[bytes] = heapq.merge(
+        *(read_records(path, offsets[partition], offsets[partition + 1], size) for path, offsets in runs),
+    )
+
+    count: int = 0
+    duplicates: List[bytes] = []
+    previous: bytes = b""
+    for record in records:
+        if record == previous:
+            duplicates.append(record)
+        previous = record
+        count += 1
+    return count, duplicates
+
+
 def is_histogram_evenly_distributed(
     histogram_values: Iterable[int],
     expected_bin_size: int,
@@ -83,34 +252,51 @@ def is_histogram_evenly_distributed(
     return all(min_bin_size < count < max_bin_size for count in histogram_values)
 
 
-@pytest.mark.slow()
-@pytest.mark.parametrize(
-    ("num_ids", "num_pools"),
-    [
-        (1_000_000, 1),  # 1 million total ids, distributed across a single pool (~40 seconds)
-        (100_000, 10),  # 1 million total ids, distributed across 10 pools (~10 seconds)
-        (10_000, 100),  # 1 million total ids, distributed across 100 pools (~12 seconds)
-        (10_000_000, 10),  # 100 million total ids, distributed across 10 pools (~18 minutes)
-        (1_000_000, 100),  # 100 million total ids, distributed across 100 pools (~18 minutes)
-    ],
-)
-def test_collisions(num_ids: int, num_pools: int) -> None:
+def check_collisions(  # noqa: PLR0913 (too many arguments) # pylint: disable=too-many-arguments
+    num_ids: int,
+    num_pools: int,
+    length: int,
+    directory: Path,
+    method: str = "generate_many",
+    tolerance: float = 0.04,
+) -> None:
     """Test for collisions, character representation, even character frequency, and histogram distribution
     tolerance in a CUID generator.
 
+    Every worker process spills its CUIDs to disk as sorted runs of packed integers, and only returns the paths of its
+    runs and its histograms. The runs are then merged partition by partition, in parallel, to find duplicates.
+
     Parameters
     ----------
     num_ids : int
         The number of unique IDs to generate in each pool.
     num_pools : int
         The `num_pools` parameter represents the number of worker processes to use in parallel for generating CUIDs.
+    length : int
+        The length of the generated IDs.
+    directory : Path
+        The directory the sorted runs are written to.
+    method : str, default="generate_many"
+        The method the IDs are generated with, see `cuid_generator`.
+    tolerance : float
+        The accepted relative deviation of each histogram bin, see `is_histogram_evenly_distributed`.
     """
     total_num_ids: int = num_ids * num_pools
+    partitions: int = num_pools * 4
     with Pool(num_pools) as pool:
-        result = pool.map(cuid_generator, (total_num_ids // num_pools,) * num_pools)
+        result = pool.map(
+            partial(cuid_generator, length=length, directory=str(directory), partitions=partitions, method=method),
+            (num_ids,) * num_pools,
+        )
+        runs: List[Run] = [run for r in result for run in r["runs"]]
+        merged = pool.map(partial(merge_partition, runs=runs, length=length), range(partitions))
+
+    for path, _ in runs:
+        Path(path).unlink()
 
     # should: generate no collisions
-    assert len(set.union(*[r["ids"] for r in result])) == total_num_ids
+    assert sum(count for count, _ in merged) == total_num_ids
+    assert [duplicate for _, duplicates in merged for duplicate in duplicates] == []
 
     # should: represent all 36 character values
     for r in result:
@@ -118,10 +304,111 @@ def test_collisions(num_ids: int, num_pools: int) -> None:
 
     # should: produce even character frequency
     sum_char_histograms: Counter = sum((r["char_histogram"] for r in result), Counter())
-    expected_char_bin_size: int = ceil((23 * total_num_ids) / 36)
-    assert is_histogram_evenly_distributed(sum_char_histograms.values(), expected_char_bin_size)
+    expected_char_bin_size: int = ceil(((length - 1) * total_num_ids) / 36)
+    assert is_histogram_evenly_distributed(sum_char_histograms.values(), expected_char_bin_size, tolerance)
 
     # should: produce a histogram with even distribution tolerance
     sum_id_histograms: Counter = sum((r["id_histogram"] for r in result), Counter())
     expected_id_bin_size: int = ceil(total_num_ids / len(sum_id_histograms.keys()))
-    assert is_histogram_evenly_distributed(sum_id_histograms.values(), expected_id_bin_size)
+    assert is_histogram_evenly_distributed(sum_id_histograms.values(), expected_id_bin_size, tolerance)
+
+
+class TestCollisionHarness:
+    #  Tests that a merged partition counts every record, and reports the records found in several runs
+    def test_merge_partition_finds_duplicates(self: "TestCollisionHarness", tmp_path: Path) -> None:
+        low = 10 * 36 ** (DEFAULT_LENGTH - 1)
+        bounds = partition_bounds(DEFAULT_LENGTH, 2)
+        first = spill_run([low + 5, low + 1, bounds[0] + 3], tmp_path / "first.run", DEFAULT_LENGTH, bounds)
+        second = spill_run([low + 5, bounds[0] + 2, low + 2], tmp_path / "second.run", DEFAULT_LENGTH, bounds)
+
+        assert merge_partition(0, [first, second], DEFAULT_LENGTH) == (4, [(low + 5).to_bytes(16, "big")])
+        assert merge_partition(1, [first, second], DEFAULT_LENGTH) == (2, [])
+
+    #  Tests that the packed records sort in the same order as the packed integers
+    def test_records_are_ordered(self: "TestCollisionHarness", tmp_path: Path) -> None:
+        values = Cuid().generate_many(1000)
+        run = spill_run([int(value, 36) for value in values], tmp_path / "run.run", DEFAULT_LENGTH, [])
+        records = list(read_records(run[0], 0, 1000, record_size(DEFAULT_LENGTH)))
+        assert [int.from_bytes(record, "big") for record in records] == sorted(int(value, 36) for value in values)
+
+    #  Tests that a worker spills several runs when it generates more CUIDs than fit in a single run
+    def test_cuid_generator_spills_runs(self: "TestCollisionHarness", mocker: "Mock", tmp_path: Path) -> None:
+        mocker.patch(f"{__name__}.RUN_SIZE", 400)
+        result = cuid_generator(1000, DEFAULT_LENGTH, str(tmp_path), 3, "generate_many")
+        assert [offsets[-1] for _, offsets in result["runs"]] == [400, 400, 200]
+        assert sum(merge_partition(p, result["runs"], DEFAULT_LENGTH)[0] for p in range(3)) == 1000
+        assert sum(result["id_histogram"].values()) == 1000
+
+    #  Tests that the ID histogram buckets the body of each CUID, after its letter
+    def test_id_histogram_buckets_body(self: "TestCollisionHarness", mocker: "Mock", tmp_path: Path) -> None:
+        body_size = 36 ** (DEFAULT_LENGTH - 1)
+        mocker.patch.object(
+            Cuid,
+            "generate_many",
+            return_value=[
+                "a" + "0" * (DEFAULT_LENGTH - 1),
+                "z" + "0" * (DEFAULT_LENGTH - 1),
+                "b" + "z" * (DEFAULT_LENGTH - 1),
+                "a" + base36_encode(body_size * 21 // 40).rjust(DEFAULT_LENGTH - 1, "0"),
+            ],
+        )
+        result = cuid_generator(4, DEFAULT_LENGTH, str(tmp_path), 2, "generate_many")
+        assert result["id_histogram"] == Counter({0: 2, BUCKET_COUNT // 2: 1, BUCKET_COUNT - 1: 1})
+
+    #  Tests the whole harness on a small number of CUIDs, with a tolerance wide enough for so few CUIDs per bucket
+    @pytest.mark.parametrize("method", ["generate", "generate_many"])
+    def test_small_harness(self: "TestCollisionHarness", method: str, tmp_path: Path) -> None:
+        check_collisions(10_000, 2, DEFAULT_LENGTH, tmp_path, method, tolerance=0.25)
+        assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.slow()
+@pytest.mark.parametrize(
+    ("num_ids", "num_pools"),
+    [
+        (1_000_000, 1),  # 1 million total ids, distributed across a single pool
+        (100_000, 10),  # 1 million total ids, distributed across 10 pools
+        (10_000, 100),  # 1 million total ids, distributed across 100 pools
+        (10_000_000, 10),  # 100 million total ids, distributed across 10 pools
+        (1_000_000, 100),  # 100 million total ids, distributed across 100 pools
+    ],
+)
+@pytest.mark.parametrize("method", ["generate", "generate_many"])
+def test_collisions(num_ids: int, num_pools: int, method: str, tmp_path: Path) -> None:
+    """Test for collisions in a CUID generator, see `check_collisions`.
+
+    Parameters
+    ----------
+    num_ids : int
+        The number of unique IDs to generate in each pool.
+    num_pools : int
+        The `num_pools` parameter represents the number of worker processes to use in parallel for generating CUIDs.
+    method : str
+        The method the IDs are generated with, see `cuid_generator`.
+    tmp_path : Path
+        The directory the sorted runs are written to.
+    """
+    check_collisions(num_ids, num_pools, DEFAULT_LENGTH, tmp_path, method)
+
+
+@pytest.mark.slow()
+def test_collisions_at_scale(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> None:
+    """Test for collisions with the number of IDs and the length given by the `--collision-ids` and
+    `--collision-length` options, using one worker process per CPU. For example, 1e9 IDs at the default length need
+    about 16 GB of free disk space for the sorted runs.
+
+    Parameters
+    ----------
+    request : pytest.FixtureRequest
+        Gives access to the command line options.
+    tmp_path_factory : pytest.TempPathFactory
+        Creates the directory the sorted runs are written to.
+    """
+    total_num_ids: int = request.config.getoption("--collision-ids")
+    if not total_num_ids:
+        pytest.skip("need --collision-ids option to run")
+
+    num_pools: int = os.cpu_count() or 1
+    directory: Path = tmp_path_factory.mktemp("collisions")
+    length: int = request.config.getoption("--collision-length")
+    check_collisions(ceil(total_num_ids / num_pools), num_pools, length, directory)
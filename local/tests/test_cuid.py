@@ -1,16 +1,54 @@
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import os
+import string
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from math import floor
+from random import Random
 from secrets import SystemRandom
 from timeit import repeat
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Optional
 
 import pytest
 
-from cuid2 import DEFAULT_LENGTH, INITIAL_COUNT_MAX, Cuid, cuid_wrapper
+from cuid2 import (
+    DEFAULT_LENGTH,
+    INITIAL_COUNT_MAX,
+    Cuid,
+    ShardedCuid,
+    cuid_many_wrapper,
+    cuid_wrapper,
+    generator,
+    utils,
+)
+from cuid2.entropy import EntropyPool
 
 if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
     from unittest.mock import Mock
 
 
+def report_forked_state(cuid: Cuid, queue: "Queue") -> None:
+    """Report the fingerprint, next counter value and a generated CUID of a Cuid instance inherited from a parent."""
+    queue.put((cuid._fingerprint, cuid._counter(), cuid.generate()))
+
+
+def report_forked_cuid(cuid_func: Callable[[], str], queue: "Queue") -> None:
+    """Report a CUID generated by a wrapper inherited from a parent."""
+    queue.put(cuid_func())
+
+
+def seeded_random() -> Random:
+    """Create a random generator with a fixed seed, for tests that need reproducible CUIDs."""
+    return Random(42)  # noqa: S311 (pseudo-random generator)
+
+
 class TestCuid:
     #  Tests execution time to ensure that time complexity doesn't increase.
     @pytest.mark.slow()
@@ -90,6 +128,10 @@ class TestCuid:
         assert cuid._length == DEFAULT_LENGTH
         assert isinstance(cuid._fingerprint, str)
 
+    #  Tests that the constructor uses a buffered entropy pool as the default random generator.
+    def test_constructor_default_entropy_pool(self: "TestCuid") -> None:
+        assert isinstance(Cuid()._random, EntropyPool)
+
     #  Tests that the random_generator and fingerprint functions are called correctly when mocked.
     def test_mock_random_generator_and_fingerprint(self: "TestCuid", mocker: "Mock") -> None:
         mock_random_class = mocker.Mock()
@@ -163,6 +205,459 @@ class TestCuid:
         assert len(result) == DEFAULT_LENGTH
         assert result == "l9j3ikop1bi8tcvzme3x3yv7"
 
+    #  Tests that generate_many() executes faster per CUID than generate().
+    @pytest.mark.slow()
+    def test_generate_many_performance(self: "TestCuid") -> None:
+        cuid = Cuid()
+        single_timing = min(repeat(stmt=cuid.generate, repeat=5, number=20_000))
+        batch_timing = min(repeat(stmt=lambda: cuid.generate_many(20_000), repeat=5, number=1))
+        assert single_timing / batch_timing > 3
+
+    #  Tests that generate_many() returns the requested number of CUIDs of length DEFAULT_LENGTH.
+    def test_generate_many_default_length(self: "TestCuid") -> None:
+        cuids = Cuid().generate_many(100)
+        assert len(cuids) == 100
+        assert all(len(cuid) == DEFAULT_LENGTH for cuid in cuids)
+
+    #  Tests that generate_many() returns CUIDs with the same format as generate().
+    @pytest.mark.parametrize("length", [1, 2, 10, 24, 32, 64])
+    def test_generate_many_format(self: "TestCuid", length: int) -> None:
+        for cuid in Cuid().generate_many(100, length=length):
+            assert len(cuid) == length
+            assert cuid[0] in string.ascii_lowercase
+            assert all(c in string.digits + string.ascii_lowercase for c in cuid)
+
+    #  Tests that generate_many() returns CUIDs with the same format as generate() with any random generator.
+    @pytest.mark.parametrize("length", [1, 2, 24, 64])
+    def test_generate_many_format_system_random(self: "TestCuid", length: int) -> None:
+        for cuid in Cuid(random_generator=SystemRandom).generate_many(100, length=length):
+            assert len(cuid) == length
+            assert cuid[0] in string.ascii_lowercase
+            assert all(c in string.digits + string.ascii_lowercase for c in cuid)
+
+    #  Tests that generate_many() returns unique CUIDs.
+    @pytest.mark.parametrize("random_generator", [EntropyPool, SystemRandom])
+    def test_generate_many_unique_ids(self: "TestCuid", random_generator: "Callable[[], Random]") -> None:
+        cuids = Cuid(random_generator=random_generator).generate_many(10_000)
+        assert len(set(cuids)) == len(cuids)
+
+    #  Tests that generate_many() returns an empty list when count is 0.
+    def test_generate_many_zero_count(self: "TestCuid") -> None:
+        assert Cuid().generate_many(0) == []
+
+    #  Tests that generate_many() raises a ValueError when count is negative.
+    def test_generate_many_negative_count(self: "TestCuid") -> None:
+        with pytest.raises(ValueError, match="Cannot generate a negative number of CUIDs."):
+            Cuid().generate_many(-1)
+
+    #  Tests that generate_many(), stream() and generate_into() raise a ValueError when length parameter is negative,
+    #  as generate() does, without drawing from the random generator
+    def test_negative_length(self: "TestCuid", mocker: "Mock") -> None:
+        cuid = Cuid()
+        draw = mocker.spy(cuid, "_draw_letters_and_salts")
+        with pytest.raises(ValueError, match="Cannot create entropy without a length >= 1."):
+            cuid.generate(-5)
+        with pytest.raises(ValueError, match="Cannot create entropy without a length >= 1."):
+            cuid.generate_many(10, -5)
+        with pytest.raises(ValueError, match="Cannot create entropy without a length >= 1."):
+            cuid.stream(-5)
+        with pytest.raises(ValueError, match="Cannot create entropy without a length >= 1."):
+            cuid.generate_into(bytearray(100), length=-5)
+        with pytest.raises(ValueError, match="Cannot create entropy without a length >= 1."):
+            ShardedCuid().generate_many(10, -5)
+        assert draw.call_count == 0
+
+    #  Tests that generate_many() raises a ValueError when length parameter is really long.
+    def test_generate_many_really_long_length(self: "TestCuid") -> None:
+        with pytest.raises(ValueError, match="Length must never exceed 98 characters."):
+            Cuid().generate_many(1, length=100)
+
+    #  Tests that stream() yields CUIDs of the requested length, across chunks, without repeating.
+    @pytest.mark.parametrize("length", [None, 10, 32])
+    def test_stream(self: "TestCuid", length: Optional[int]) -> None:
+        cuids = list(itertools.islice(Cuid(length=24).stream(length, chunk_size=7), 100))
+        assert len(set(cuids)) == 100
+        assert all(len(cuid) == (length or 24) and cuid[0] in string.ascii_lowercase for cuid in cuids)
+
+    #  Tests that stream() generates a chunk at a time, only when the previous chunk is consumed.
+    def test_stream_is_lazy(self: "TestCuid", mocker: "Mock") -> None:
+        cuid = Cuid()
+        generate_many = mocker.spy(cuid, "generate_many")
+        stream = cuid.stream(chunk_size=10)
+        assert generate_many.call_count == 0
+        list(itertools.islice(stream, 10))
+        assert generate_many.call_count == 1
+        next(stream)
+        assert generate_many.call_count == 2
+        generate_many.assert_called_with(10, DEFAULT_LENGTH)
+
+    #  Tests that stream() raises a ValueError on invalid arguments, before it is iterated.
+    def test_stream_invalid_arguments(self: "TestCuid") -> None:
+        with pytest.raises(ValueError, match="Length must never exceed 98 characters."):
+            Cuid().stream(length=100)
+        with pytest.raises(ValueError, match="Cannot stream CUIDs without a chunk size >= 1."):
+            Cuid().stream(chunk_size=0)
+
+    #  Tests that generate_into() fills a buffer with fixed-width records, from an offset.
+    @pytest.mark.parametrize("length", [2, 24, 64])
+    def test_generate_into(self: "TestCuid", length: int) -> None:
+        buffer = bytearray(b"-" * (3 + length * 5 + 1))
+        assert Cuid(length=length).generate_into(memoryview(buffer), offset=3) == 5
+        assert buffer[:3] == b"---"
+        assert buffer[-1:] == b"-"
+        records = [buffer[start : start + length].decode() for start in range(3, 3 + length * 5, length)]
+        assert all(record[0] in string.ascii_lowercase and record.isalnum() for record in records)
+
+    #  Tests that generate_into() writes the requested count across chunks, and leaves the rest of the buffer intact.
+    def test_generate_into_count(self: "TestCuid", mocker: "Mock") -> None:
+        mocker.patch.object(generator, "STREAM_CHUNK_SIZE", 7)
+        buffer = bytearray(10 * 30)
+        assert Cuid().generate_into(buffer, count=20, length=10) == 20
+        records = {bytes(buffer[start : start + 10]) for start in range(0, 200, 10)}
+        assert len(records) == 20
+        assert buffer[200:] == bytes(100)
+        assert Cuid().generate_into(buffer, count=0) == 0
+
+    #  Tests that generate_into() follows every record with the terminator.
+    def test_generate_into_terminator(self: "TestCuid") -> None:
+        buffer = bytearray(11 * 3 + 5)
+        assert Cuid().generate_into(buffer, length=10, terminator="\n") == 3
+        lines = buffer[:33].decode().split("\n")
+        assert lines.pop() == ""
+        assert [len(line) for line in lines] == [10, 10, 10]
+
+    #  Tests that generate_into() pads the rare CUIDs shorter than the requested length with NUL bytes.
+    def test_generate_into_padding(self: "TestCuid", mocker: "Mock") -> None:
+        cuid = Cuid()
+        mocker.patch.object(cuid, "generate_many", return_value=["abc", "de"])
+        buffer = bytearray(6)
+        cuid.generate_into(buffer, length=3)
+        assert buffer == b"abcde\0"
+        buffer = bytearray(8)
+        cuid.generate_into(buffer, length=3, terminator="\n")
+        assert buffer == b"abc\nde\0\n"
+
+    #  Tests that generate_into() raises on read-only buffers, and on records that do not fit.
+    def test_generate_into_invalid_arguments(self: "TestCuid") -> None:
+        with pytest.raises(TypeError, match="Cannot generate CUIDs into a read-only buffer."):
+            Cuid().generate_into(bytes(24))
+        with pytest.raises(ValueError, match="Cannot write 2 CUIDs of 24 characters at offset 1 of a buffer of 48"):
+            Cuid().generate_into(bytearray(48), count=2, offset=1)
+        with pytest.raises(ValueError, match="Cannot write 1 CUIDs of 24 characters at offset 49"):
+            Cuid().generate_into(bytearray(48), count=1, offset=49)
+        with pytest.raises(ValueError, match="Cannot generate a negative number of CUIDs."):
+            Cuid().generate_into(bytearray(48), count=-1)
+        with pytest.raises(ValueError, match="Length must never exceed 98 characters."):
+            Cuid().generate_into(bytearray(200), length=99)
+
+    #  Tests that the hash prefix used by generate_many() matches the slice of create_hash() used by generate().
+    @pytest.mark.parametrize("length", [1, 2, 10, 24, 97, 98])
+    def test_hash_prefix_matches_create_hash(self: "TestCuid", length: int) -> None:
+        random = Random(length)  # noqa: S311 (pseudo-random generator)
+        for bits in (1, 64, 500, 512):
+            for _ in range(200):
+                hashed_int = random.getrandbits(bits)
+                expected = utils.base36_encode(hashed_int)[1:][1:length]
+                assert generator._hash_prefix(hashed_int, length) == expected
+
+    #  Tests that generate() returns the same CUIDs with the truncated hash as with the full hash, at every length.
+    @pytest.mark.parametrize("hash_engine", [utils.sha3_512_digest, utils.shake_256_digest], ids=["sha3", "shake"])
+    def test_truncated_hash_output(self: "TestCuid", mocker: "Mock", hash_engine: "utils.HashEngine") -> None:
+        mocker.patch("time.time_ns", return_value=1627584000000000000)
+        lengths = range(1, generator.MAXIMUM_LENGTH + 1)
+
+        def create_cuid() -> Cuid:
+            return Cuid(
+                seeded_random,
+                fingerprint=lambda random_generator: "fixed",  # noqa: ARG005 (unused argument)
+                hash_engine=hash_engine,
+            )
+
+        truncated = [create_cuid().generate(length) for length in lengths]
+
+        create_hash = utils.create_hash
+        mocker.patch(
+            "cuid2.utils.create_hash",
+            side_effect=lambda data, engine, length, **_: create_hash(data, engine, length),
+        )
+        full = [create_cuid().generate(length) for length in lengths]
+        assert truncated == full
+
+    #  Tests that the hash prefix also matches for hashes larger than a SHA3-512 digest.
+    def test_hash_prefix_large_hashes(self: "TestCuid") -> None:
+        random = Random(0)  # noqa: S311 (pseudo-random generator)
+        for bits in (513, 1024):
+            hashed_int = random.getrandbits(bits)
+            assert generator._hash_prefix(hashed_int, 24) == utils.base36_encode(hashed_int)[2:25]
+
+    #  Tests that the default hash engine generates the same CUIDs as before engines were pluggable.
+    def test_default_hash_engine_output(self: "TestCuid", mocker: "Mock") -> None:
+        mock_random = mocker.Mock()
+        mock_random.random.return_value = 0.5
+        mocker.patch("time.time_ns", return_value=1627584000000000000)
+        mocker.patch("cuid2.utils.create_letter", return_value="l")
+        cuid = Cuid(
+            random_generator=lambda: mock_random,
+            counter=lambda _: lambda: 123456789,
+            fingerprint=lambda random_generator: "abcdefg",  # noqa: ARG005 (unused argument)
+            hash_engine=utils.HASH_ENGINES["sha3_512"],
+        )
+        assert cuid.generate() == "l9j3ikop1bi8tcvzme3x3yv7"
+
+    #  Tests that every built-in hash engine generates well-formed CUIDs of every length, with both methods.
+    @pytest.mark.parametrize("engine", sorted(utils.HASH_ENGINES))
+    @pytest.mark.parametrize("length", [1, 2, 24, 64])
+    def test_hash_engines_format(self: "TestCuid", engine: str, length: int) -> None:
+        cuid = Cuid(length=length, hash_engine=utils.HASH_ENGINES[engine])
+        cuids = [cuid.generate() for _ in range(50)] + cuid.generate_many(50)
+        for value in cuids:
+            assert len(value) == length
+            assert value[0] in string.ascii_lowercase
+            assert all(c in string.digits + string.ascii_lowercase for c in value)
+
+    #  Tests that SHAKE-256 digests are long enough for the longest CUIDs, which a 512-bit digest sometimes is not.
+    def test_shake_256_maximum_length(self: "TestCuid") -> None:
+        cuid = Cuid(length=generator.MAXIMUM_LENGTH, hash_engine=utils.shake_256_digest)
+        cuids = [cuid.generate() for _ in range(100)] + cuid.generate_many(100)
+        assert {len(value) for value in cuids} == {generator.MAXIMUM_LENGTH}
+
+    #  Tests that generate() and generate_many() hash with the engine, and that the fingerprint uses it too.
+    def test_hash_engine_is_used(self: "TestCuid", mocker: "Mock") -> None:
+        engine = mocker.Mock(side_effect=utils.blake2b_digest)
+        cuid = Cuid(hash_engine=engine)
+        assert engine.call_count == 1
+        cuid.generate()
+        cuid.generate_many(3)
+        assert engine.call_count == 5
+        assert [call.args[1] for call in engine.call_args_list] == [utils.BIG_LENGTH] + [DEFAULT_LENGTH] * 4
+
+
+class TestSortableCuid:
+    #  Tests that sortable CUIDs start with their creation time in milliseconds, and keep the requested length
+    @pytest.mark.parametrize("length", [16, 24, 32, 98])
+    def test_prefix(self: "TestSortableCuid", mocker: "Mock", length: int) -> None:
+        mocker.patch("time.time_ns", return_value=1627584000123456789)
+        cuid = Cuid(sortable=True)
+        prefix = utils.base36_encode(1627584000123)
+        assert len(prefix) == generator.SORTABLE_PREFIX_LENGTH
+        for value in [cuid.generate(length), *cuid.generate_many(10, length)]:
+            assert len(value) == length
+            assert value.startswith(prefix)
+            assert value[0] in string.ascii_lowercase
+            assert all(c in string.digits + string.ascii_lowercase for c in value)
+
+    #  Tests that sortable CUIDs sort by their creation time
+    def test_sorted_by_time(self: "TestSortableCuid", mocker: "Mock") -> None:
+        mocker.patch("time.time_ns", side_effect=[ms * 1_000_000 for ms in range(1627584000000, 1627584000200)])
+        cuid = Cuid(sortable=True)
+        cuids = [cuid.generate() for _ in range(100)] + cuid.generate_many(100)
+        assert sorted(cuids) == cuids
+
+    #  Tests that the body of a sortable CUID is the hash of a standard CUID, cut to fit the length
+    def test_body_matches_standard(self: "TestSortableCuid", mocker: "Mock") -> None:
+        mocker.patch("time.time_ns", return_value=1627584000000000000)
+        standard = Cuid(random_generator=seeded_random).generate()
+        sortable = Cuid(random_generator=seeded_random, sortable=True).generate()
+        assert sortable[generator.SORTABLE_PREFIX_LENGTH :] == standard[1 : DEFAULT_LENGTH - 7]
+
+        standard_many = Cuid(random_generator=seeded_random).generate_many(5)
+        sortable_many = Cuid(random_generator=seeded_random, sortable=True).generate_many(5)
+        assert [value[8:] for value in sortable_many] == [value[1:17] for value in standard_many]
+
+    #  Tests that sortable CUIDs shorter than the minimum length are rejected
+    def test_minimum_length(self: "TestSortableCuid") -> None:
+        with pytest.raises(ValueError, match="Sortable CUIDs must be at least 16 characters long."):
+            Cuid(length=15, sortable=True)
+        with pytest.raises(ValueError, match="Sortable CUIDs must be at least 16 characters long."):
+            ShardedCuid(length=15, sortable=True)
+
+        cuid = Cuid(sortable=True)
+        with pytest.raises(ValueError, match="Sortable CUIDs must be at least 16 characters long."):
+            cuid.generate(10)
+        with pytest.raises(ValueError, match="Sortable CUIDs must be at least 16 characters long."):
+            cuid.generate_many(10, 10)
+
+    #  Tests that the shards of a sortable ShardedCuid are sortable
+    def test_sharded(self: "TestSortableCuid", mocker: "Mock") -> None:
+        mocker.patch("time.time_ns", return_value=1627584000000000000)
+        prefix = utils.base36_encode(1627584000000)
+        cuid = ShardedCuid(sortable=True)
+        assert cuid.generate().startswith(prefix)
+        assert all(value.startswith(prefix) for value in cuid.generate_many(10))
+
+
+class TestShardedCuid:
+    #  Tests that the constructor raises a ValueError when length parameter is really long.
+    def test_really_long_length(self: "TestShardedCuid") -> None:
+        with pytest.raises(ValueError, match="Length must never exceed 98 characters."):
+            ShardedCuid(length=100)
+
+    #  Tests that generate() and generate_many() return CUIDs of the requested length.
+    def test_generate_length(self: "TestShardedCuid") -> None:
+        cuid = ShardedCuid(length=10)
+        assert len(cuid.generate()) == 10
+        assert len(cuid.generate(length=20)) == 20
+        assert [len(c) for c in cuid.generate_many(3)] == [10, 10, 10]
+
+    #  Tests that a thread reuses its shard across calls.
+    def test_same_thread_same_shard(self: "TestShardedCuid") -> None:
+        cuid = ShardedCuid()
+        assert cuid._shard() is cuid._shard()
+
+    #  Tests that every thread receives its own shard, with a distinct fingerprint and counter offset.
+    def test_threads_receive_distinct_shards(self: "TestShardedCuid", mocker: "Mock") -> None:
+        mock_random_class = mocker.Mock()
+        mock_random = mocker.Mock()
+        mock_random.random.return_value = 0.5
+        mock_random_class.return_value = mock_random
+        cuid = ShardedCuid(random_generator=mock_random_class)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            shards = list(executor.map(lambda _: cuid._shard(), range(4), chunksize=1))
+        shards = list({id(shard): shard for shard in shards}.values())
+
+        # A constant random generator would give every shard the same counter, if not for the offsets.
+        counters = sorted(shard._counter() for shard in shards)
+        assert len(set(counters)) == len(shards)
+        assert all(b - a == INITIAL_COUNT_MAX for a, b in zip(counters, counters[1:]))
+
+    #  Tests that every shard hashes with the hash engine of the sharded generator.
+    def test_hash_engine_is_passed_to_shards(self: "TestShardedCuid") -> None:
+        cuid = ShardedCuid(hash_engine=utils.shake_256_digest)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            shards = list(executor.map(lambda _: cuid._shard(), range(2)))
+        assert all(shard._hash_engine is utils.shake_256_digest for shard in shards)
+
+    #  Tests that the chunks of a stream are generated with the shard of the consuming thread.
+    def test_stream(self: "TestShardedCuid") -> None:
+        cuid = ShardedCuid(length=10)
+        stream = cuid.stream(chunk_size=5)
+        cuids = list(itertools.islice(stream, 12))
+        assert len(set(cuids)) == 12
+        assert all(len(c) == 10 for c in cuids)
+
+        def consume() -> int:
+            shard = cuid._shard()
+            start = shard._counter()
+            list(itertools.islice(stream, 10))
+            return shard._counter() - start
+
+        # The 3 strings left in the current chunk come from the first shard, the next 2 chunks from the new one.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(consume).result() == 11
+
+    #  Tests that generate_into() writes with the shard of the calling thread.
+    def test_generate_into(self: "TestShardedCuid", mocker: "Mock") -> None:
+        cuid = ShardedCuid(length=10)
+        spy = mocker.spy(cuid._shard(), "generate_many")
+        buffer = bytearray(30)
+        assert cuid.generate_into(buffer) == 3
+        spy.assert_called_once_with(3, 10)
+
+    #  Tests that threads sharing a sharded generator never generate the same CUID.
+    def test_threads_generate_unique_ids(self: "TestShardedCuid") -> None:
+        cuid = ShardedCuid()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            batches = list(executor.map(lambda _: cuid.generate_many(1_000), range(32)))
+        cuids = [c for batch in batches for c in batch]
+        assert len(set(cuids)) == len(cuids)
+
+    #  Tests that threads racing for their first shard receive distinct shard indexes, and never generate the same CUID.
+    def test_concurrent_shards_are_unique(self: "TestShardedCuid") -> None:
+        threads = 16
+        initial_counts: list[int] = []
+
+        def counter(count: int) -> Callable[[], int]:
+            initial_counts.append(count)
+            return utils.create_counter(count)
+
+        # Every shard draws the same initial count, so only the shard indexes keep their counters apart.
+        cuid = ShardedCuid(random_generator=seeded_random, counter=counter)
+        barrier = threading.Barrier(threads)
+
+        def generate(_: int) -> list[str]:
+            barrier.wait()
+            return cuid.generate_many(500)
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                batches = list(executor.map(generate, range(threads)))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        first_count = min(initial_counts)
+        assert sorted(initial_counts) == [first_count + index * INITIAL_COUNT_MAX for index in range(threads)]
+        cuids = [c for batch in batches for c in batch]
+        assert len(set(cuids)) == len(cuids) == threads * 500
+
+    #  Benchmarks throughput by thread count, to ensure that it grows with the thread count on free-threaded builds.
+    @pytest.mark.slow()
+    @pytest.mark.skipif(getattr(sys, "_is_gil_enabled", lambda: True)(), reason="requires a free-threaded build")
+    @pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="requires at least 4 CPUs")
+    def test_thread_scaling(self: "TestShardedCuid") -> None:
+        cuid = ShardedCuid()
+        batches_per_thread, batch_size = 20, 1_000
+
+        def throughput(threads: int) -> float:
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                start = time.perf_counter()
+                batches = [executor.submit(cuid.generate_many, batch_size) for _ in range(batches_per_thread * threads)]
+                for batch in batches:
+                    batch.result()
+                return batches_per_thread * threads * batch_size / (time.perf_counter() - start)
+
+        results = {threads: throughput(threads) for threads in (1, 2, 4)}
+        print({threads: f"{ids_per_second:,.0f} IDs/s" for threads, ids_per_second in results.items()})  # noqa: T201
+        assert results[2] > 1.5 * results[1]
+        assert results[4] > 2.5 * results[1]
+
+
+@pytest.mark.skipif(not hasattr(os, "register_at_fork"), reason="requires os.fork")
+class TestCuidFork:
+    @staticmethod
+    def _forked_states(cuid: Cuid, children: int = 4) -> list[tuple[str, int, str]]:
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        processes = [context.Process(target=report_forked_state, args=(cuid, queue)) for _ in range(children)]
+        for process in processes:
+            process.start()
+        states = [queue.get(timeout=30) for _ in processes]
+        for process in processes:
+            process.join()
+        return states
+
+    #  Tests that forked children never share a fingerprint or counter with each other or with their parent.
+    @pytest.mark.parametrize(
+        "random_generator",
+        [None, seeded_random],
+        ids=["default", "seeded"],
+    )
+    def test_children_never_share_state(self: "TestCuidFork", random_generator: "Callable[[], Random]") -> None:
+        cuid = Cuid(random_generator=random_generator) if random_generator else Cuid()
+        states = self._forked_states(cuid)
+        states.append((cuid._fingerprint, cuid._counter(), cuid.generate()))
+
+        fingerprints, counters, cuids = zip(*states)
+        assert len(set(fingerprints)) == len(states)
+        assert len(set(counters)) == len(states)
+        assert len(set(cuids)) == len(states)
+
+    #  Tests that a wrapper created before forking generates distinct CUIDs in every child.
+    def test_wrapper_created_before_fork(self: "TestCuidFork") -> None:
+        cuid_func: Callable[[], str] = cuid_wrapper()
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        processes = [context.Process(target=report_forked_cuid, args=(cuid_func, queue)) for _ in range(4)]
+        for process in processes:
+            process.start()
+        cuids = [queue.get(timeout=30) for _ in processes]
+        for process in processes:
+            process.join()
+        cuids.append(cuid_func())
+        assert len(set(cuids)) == len(cuids)
+
 
 class TestCuidWrapper:
     def test_cuid_wrapper_is_callable(self: "TestCuidWrapper") -> None:
@@ -188,3 +683,35 @@ class TestCuidWrapper:
         """Tests that the function returns a callable that generates a CUID string with the default length."""
         cuid_func: Callable[[], str] = cuid_wrapper()
         assert len(cuid_func()) == DEFAULT_LENGTH
+
+
+class TestCuidManyWrapper:
+    def test_cuid_many_wrapper_is_callable(self: "TestCuidManyWrapper") -> None:
+        """Tests that the function returns a callable."""
+        cuid_many_func: Callable[[int], list[str]] = cuid_many_wrapper()
+        assert callable(cuid_many_func)
+
+    def test_cuid_many_wrapper_return_type(self: "TestCuidManyWrapper") -> None:
+        """Tests that the function returns a callable that generates a list of CUID strings."""
+        cuid_many_func: Callable[[int], list[str]] = cuid_many_wrapper()
+        cuids = cuid_many_func(10)
+        assert len(cuids) == 10
+        assert all(isinstance(cuid, str) for cuid in cuids)
+
+    def test_cuid_many_wrapper_length(self: "TestCuidManyWrapper") -> None:
+        """Tests that the function returns a callable that generates CUID strings with the default length."""
+        cuid_many_func: Callable[[int], list[str]] = cuid_many_wrapper()
+        assert all(len(cuid) == DEFAULT_LENGTH for cuid in cuid_many_func(10))
+
+
+class TestImport:
+    #  Tests that importing cuid2 does not import the modules it only needs lazily, or only for type checking
+    def test_import_is_lazy(self: "TestImport") -> None:
+        script = "import sys; before = set(sys.modules); import cuid2; print(' '.join(set(sys.modules) - before))"
+        imported = subprocess.run(
+            [sys.executable, "-c", script],  # noqa: S603 (trusted input: sys.executable)
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        assert {"socket", "string", "typing"}.isdisjoint(imported.stdout.split())
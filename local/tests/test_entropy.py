@@ -0,0 +1,118 @@
+import os
+import string
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from secrets import SystemRandom
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cuid2 import entropy
+from cuid2.entropy import EntropyPool
+
+if TYPE_CHECKING:
+    from unittest.mock import Mock
+
+
+class TestEntropyPool:
+    #  Tests that the pool can be used wherever a SystemRandom instance is expected
+    def test_is_system_random(self: "TestEntropyPool") -> None:
+        assert isinstance(EntropyPool(), SystemRandom)
+
+    #  Tests that the pool raises a ValueError when given a chunk size less than 1
+    def test_invalid_chunk_size(self: "TestEntropyPool") -> None:
+        with pytest.raises(ValueError, match="Cannot create an entropy pool without a chunk size >= 1."):
+            EntropyPool(chunk_size=0)
+
+    #  Tests that base36_digits returns the requested number of base36 characters
+    @pytest.mark.parametrize("length", [0, 1, 24, 5000])
+    def test_base36_digits_length(self: "TestEntropyPool", length: int) -> None:
+        digits = EntropyPool(chunk_size=64).base36_digits(length)
+        assert len(digits) == length
+        assert all(c in string.digits + string.ascii_lowercase for c in digits)
+
+    #  Tests that lowercase_letters returns the requested number of lowercase letters
+    @pytest.mark.parametrize("length", [0, 1, 24, 5000])
+    def test_lowercase_letters_length(self: "TestEntropyPool", length: int) -> None:
+        letters = EntropyPool(chunk_size=64).lowercase_letters(length)
+        assert len(letters) == length
+        assert all(c in string.ascii_lowercase for c in letters)
+
+    #  Tests that every base36 digit and letter is drawn with roughly the same frequency
+    def test_even_character_frequency(self: "TestEntropyPool") -> None:
+        pool = EntropyPool()
+        digit_counts = Counter(pool.base36_digits(360_000))
+        letter_counts = Counter(pool.lowercase_letters(260_000))
+        assert len(digit_counts) == 36
+        assert len(letter_counts) == 26
+        assert all(9_500 < count < 10_500 for count in (*digit_counts.values(), *letter_counts.values()))
+
+    #  Tests that random returns floats in the range [0, 1)
+    def test_random_range(self: "TestEntropyPool") -> None:
+        pool = EntropyPool(chunk_size=16)
+        assert all(0 <= pool.random() < 1 for _ in range(1000))
+
+    #  Tests that getrandbits returns integers with at most k bits
+    @pytest.mark.parametrize("bits", [0, 1, 7, 8, 53, 512])
+    def test_getrandbits_range(self: "TestEntropyPool", bits: int) -> None:
+        pool = EntropyPool(chunk_size=16)
+        assert all(0 <= pool.getrandbits(bits) < 2**bits for _ in range(100))
+
+    #  Tests that getrandbits raises a ValueError when given a negative number of bits
+    def test_getrandbits_negative(self: "TestEntropyPool") -> None:
+        with pytest.raises(ValueError, match="number of bits must be non-negative"):
+            EntropyPool().getrandbits(-1)
+
+    #  Tests that randbytes returns the requested number of bytes, even when larger than the chunk size
+    def test_randbytes_length(self: "TestEntropyPool") -> None:
+        assert len(EntropyPool(chunk_size=16).randbytes(100)) == 100
+
+    #  Tests that negative counts are rejected, and do not rewind the pool to re-serve entropy already handed out
+    @pytest.mark.parametrize(
+        ("method", "match"),
+        [
+            ("randbytes", "Cannot draw a negative number of bytes."),
+            ("base36_digits", "Cannot draw a negative number of digits."),
+            ("lowercase_letters", "Cannot draw a negative number of letters."),
+        ],
+    )
+    def test_negative_count(self: "TestEntropyPool", method: str, match: str) -> None:
+        pool = EntropyPool()
+        draw = getattr(pool, method)
+        first = draw(8)
+        with pytest.raises(ValueError, match=match):
+            draw(-8)
+        assert draw(8) != first
+
+    #  Tests that randrange is served from the pool
+    def test_randrange_uses_pool(self: "TestEntropyPool", mocker: "Mock") -> None:
+        pool = EntropyPool()
+        spy = mocker.spy(entropy.os, "urandom")
+        for _ in range(100):
+            assert 0 <= pool.randrange(36**24) < 36**24
+        assert spy.call_count == 1
+
+    #  Tests that threads sharing a pool never receive the same entropy
+    def test_thread_safety(self: "TestEntropyPool") -> None:
+        pool = EntropyPool(chunk_size=256)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: pool.base36_digits(32), range(10_000)))
+        assert len(set(results)) == len(results)
+
+    #  Tests that a forked child process does not reuse the entropy buffered by its parent
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_fork_resets_pool(self: "TestEntropyPool") -> None:
+        pool = EntropyPool()
+        pool.base36_digits(1)
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover (child process)
+            os.close(read_fd)
+            os.write(write_fd, pool.base36_digits(32).encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        child_digits = os.read(read_fd, 32).decode()
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        assert child_digits != pool.base36_digits(32)
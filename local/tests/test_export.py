@@ -0,0 +1,138 @@
+import mmap
+import string
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cuid2 import DEFAULT_LENGTH, Cuid, ShardedCuid, export
+
+if TYPE_CHECKING:
+    from unittest.mock import Mock
+
+
+def assert_records(path: Path, count: int, length: int) -> list[str]:
+    """Assert that `path` holds `count` unique, newline-terminated CUIDs of the given length, and return them."""
+    data = path.read_bytes()
+    assert len(data) == count * (length + 1)
+    assert b"\0" not in data
+    lines = data.decode().split("\n")
+    assert lines.pop() == ""
+    assert len(lines) == len(set(lines)) == count
+    assert all(len(line) == length and line[0] in string.ascii_lowercase for line in lines)
+    return lines
+
+
+class TestExport:
+    #  Tests that export() writes the requested number of records, across chunks and memory map granularity
+    @pytest.mark.parametrize(("count", "length"), [(0, DEFAULT_LENGTH), (1, 2), (1_000, DEFAULT_LENGTH), (700, 98)])
+    def test_export(self: "TestExport", tmp_path: Path, count: int, length: int) -> None:
+        path = tmp_path / "cuids.txt"
+        assert export.export(path, count, length, chunk_size=333) == count
+        assert_records(path, count, length)
+
+    #  Tests that export() appends to a complete export, and leaves a larger one unchanged
+    def test_resume_complete(self: "TestExport", tmp_path: Path) -> None:
+        path = tmp_path / "cuids.txt"
+        export.export(path, 100)
+        first = assert_records(path, 100, DEFAULT_LENGTH)
+        assert export.export(path, 150) == 150
+        assert assert_records(path, 150, DEFAULT_LENGTH)[:100] == first
+        assert export.export(path, 10) == 150
+        assert_records(path, 150, DEFAULT_LENGTH)
+
+    #  Tests that export() resumes after the last complete record of an interrupted export
+    @pytest.mark.parametrize("complete", [0, 40, 99])
+    def test_resume_interrupted(self: "TestExport", mocker: "Mock", tmp_path: Path, complete: int) -> None:
+        path = tmp_path / "cuids.txt"
+        export.export(path, 100)
+        data = bytearray(path.read_bytes())
+        # A partial record, followed by reserved space that was never written.
+        data[complete * 25 + 10 :] = bytes(len(data) - complete * 25 - 10)
+        path.write_bytes(data)
+        mocker.patch.object(export, "CHUNK_SIZE", 16)
+
+        cuid = Cuid()
+        spy = mocker.spy(cuid, "generate_into")
+        assert export.export(path, 100, cuid=cuid) == 100
+        assert sum(call.args[1] for call in spy.call_args_list) == 100 - complete
+        lines = assert_records(path, 100, DEFAULT_LENGTH)
+        assert lines[:complete] == data.decode()[: complete * 25].split("\n")[:-1]
+
+    #  Tests that export() generates the CUIDs shorter than the length again, instead of padding them with NUL bytes
+    def test_short_cuids_generated_again(self: "TestExport", mocker: "Mock", tmp_path: Path) -> None:
+        path = tmp_path / "cuids.txt"
+        cuid = Cuid()
+        mocker.patch.object(cuid, "generate_many", side_effect=[["abc", "de", "fgh", "i"], ["jk", "lmn"]])
+        generate = mocker.patch.object(cuid, "generate", side_effect=["op", "qrs", "tuv", "wxy"])
+        assert export.export(path, 6, 3, cuid=cuid, chunk_size=4) == 6
+        assert path.read_bytes() == b"abc\nqrs\nfgh\ntuv\nwxy\nlmn\n"
+        assert generate.call_count == 4
+
+    #  Tests that export() accepts a ShardedCuid
+    def test_sharded_cuid(self: "TestExport", tmp_path: Path) -> None:
+        path = tmp_path / "cuids.txt"
+        export.export(path, 10, 10, cuid=ShardedCuid())
+        assert_records(path, 10, 10)
+
+    #  Tests that export() refuses to resume a file that is not an export of the same length
+    @pytest.mark.parametrize("data", [b"abc\n", b"a" * 25, b"x" * 24 + b"\n" + b"x" * 25])
+    def test_resume_invalid_file(self: "TestExport", tmp_path: Path, data: bytes) -> None:
+        path = tmp_path / "cuids.txt"
+        path.write_bytes(data)
+        with pytest.raises(ValueError, match="Cannot resume"):
+            export.export(path, 10)
+        assert path.read_bytes() == data
+
+    #  Tests that export() raises a ValueError on invalid arguments
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"count": -1}, "Cannot generate a negative number of CUIDs."),
+            ({"length": 0}, "Length must be between 1 and 98 characters."),
+            ({"chunk_size": 0}, "Cannot export CUIDs without a chunk size >= 1."),
+        ],
+    )
+    def test_invalid_arguments(self: "TestExport", tmp_path: Path, kwargs: dict, message: str) -> None:
+        with pytest.raises(ValueError, match=message):
+            export.export(tmp_path / "cuids.txt", **{"count": 1, **kwargs})
+
+
+class TestCuidFile:
+    #  Tests that a CuidFile reads the k-th record of an export, and iterates over every record
+    def test_read(self: "TestCuidFile", tmp_path: Path) -> None:
+        path = tmp_path / "cuids.txt"
+        export.export(path, 1_000, 10)
+        lines = assert_records(path, 1_000, 10)
+        with export.CuidFile(path, 10) as cuids:
+            assert len(cuids) == 1_000
+            assert cuids[0] == lines[0]
+            assert cuids[-1] == lines[-1]
+            assert cuids[567] == lines[567]
+            assert list(cuids) == lines
+            assert list(cuids[10:20]) == lines[10:20]
+
+    #  Tests that a CuidFile reads empty exports
+    def test_empty(self: "TestCuidFile", tmp_path: Path) -> None:
+        path = tmp_path / "cuids.txt"
+        export.export(path, 0)
+        with export.CuidFile(path) as cuids:
+            assert len(cuids) == 0
+            assert list(cuids) == []
+
+    #  Tests that a CuidFile refuses incomplete exports
+    def test_incomplete(self: "TestCuidFile", tmp_path: Path) -> None:
+        path = tmp_path / "cuids.txt"
+        path.write_bytes(b"a" * 24 + b"\n" + bytes(25))
+        with pytest.raises(ValueError, match="its export is incomplete"):
+            export.CuidFile(path)
+
+    #  Tests that closing a CuidFile closes its memory map
+    def test_close(self: "TestCuidFile", tmp_path: Path) -> None:
+        path = tmp_path / "cuids.txt"
+        export.export(path, 10)
+        cuids = export.CuidFile(path)
+        file_map = cuids._map
+        assert isinstance(file_map, mmap.mmap)
+        cuids.close()
+        assert file_map.closed
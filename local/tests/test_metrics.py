@@ -0,0 +1,160 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cuid2 import metrics
+from cuid2.entropy import EntropyPool
+from cuid2.generator import Cuid, ShardedCuid
+from cuid2.metrics import CuidStats, Metrics, prometheus_text
+
+if TYPE_CHECKING:
+    from unittest.mock import Mock
+
+
+def seeded_random() -> Random:
+    """Create a random generator with a fixed seed, for tests that need reproducible CUIDs."""
+    return Random(42)  # noqa: S311 (pseudo-random generator)
+
+
+class TestStats:
+    #  Tests that a generator created without metrics refuses to report stats
+    def test_disabled_by_default(self: "TestStats") -> None:
+        cuid = Cuid()
+        assert cuid._metrics is None
+        with pytest.raises(RuntimeError, match="Cannot report the stats of a Cuid created without metrics=True."):
+            cuid.stats()
+
+    #  Tests that the stats of a new generator are empty
+    def test_new_generator(self: "TestStats") -> None:
+        stats = Cuid(metrics=True).stats()
+        assert isinstance(stats, CuidStats)
+        assert stats.ids_generated == 0
+        assert stats.counter_advance == 0
+        assert stats.ids_per_second == 0.0
+        assert stats.generation_seconds == 0.0
+
+    #  Tests that every call generating CUIDs is counted
+    def test_ids_generated(self: "TestStats") -> None:
+        cuid = Cuid(metrics=True)
+        cuid.generate()
+        cuid.generate(10)
+        cuid.generate_many(100)
+        cuid.generate_many(0)
+        cuid.generate_into(bytearray(24 * 5))
+        stats = cuid.stats()
+        assert stats.ids_generated == 107
+        assert stats.counter_advance == 107
+        assert stats.generation_seconds > 0.0
+
+    #  Tests that the counter start is the initial value of the counter, and the advance the values used since
+    def test_counter(self: "TestStats") -> None:
+        cuid = Cuid(random_generator=seeded_random, metrics=True)
+        cuid.generate_many(9)
+        stats = cuid.stats()
+        assert stats.counter_advance == 9
+        assert cuid._counter() == stats.counter_start + stats.counter_advance + 1
+
+    #  Tests that the rate is measured over the samples of the last window
+    def test_ids_per_second(self: "TestStats", mocker: "Mock") -> None:
+        clock = mocker.patch("cuid2.metrics.time.perf_counter", return_value=100.0)
+        state = Metrics()
+        state.record(10, 99.0)
+        clock.return_value = 102.0
+        state.record(30, 101.0)
+        assert state.snapshot(None).ids_per_second == 40 / 3
+        assert state.snapshot(None).generation_seconds == 2.0
+
+        clock.return_value = 99.0 + metrics.RATE_WINDOW + 1.5
+        assert state.snapshot(None).ids_per_second == 0.0
+
+    #  Tests that the entropy read by an EntropyPool is reported, and not that of other random generators
+    def test_entropy_bytes(self: "TestStats") -> None:
+        pool = EntropyPool(chunk_size=512)
+        cuid = Cuid(random_generator=lambda: pool, metrics=True)
+        cuid.generate_many(100)
+        assert cuid.stats().entropy_bytes == pool.bytes_read > 0
+
+        assert Cuid(random_generator=seeded_random, metrics=True).stats().entropy_bytes is None
+
+    #  Tests that a forked child only reports the CUIDs it generates
+    @pytest.mark.skipif(not hasattr(os, "register_at_fork"), reason="requires os.fork")
+    def test_fork_resets_metrics(self: "TestStats") -> None:
+        cuid = Cuid(metrics=True)
+        cuid.generate_many(10)
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover (child process)
+            os.close(read_fd)
+            cuid.generate()
+            os.write(write_fd, str(cuid.stats().ids_generated).encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        child_ids = os.read(read_fd, 32).decode()
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        assert child_ids == "1"
+        assert cuid.stats().ids_generated == 10
+
+    #  Tests that a sharded generator sums the metrics of the shards of every thread, including finished ones
+    def test_sharded(self: "TestStats") -> None:
+        with pytest.raises(RuntimeError, match="Cannot report the stats of a ShardedCuid created without metrics"):
+            ShardedCuid().stats()
+
+        cuid = ShardedCuid(metrics=True)
+        assert cuid.stats() == CuidStats(0, 0, 0, 0, 0.0, 0.0)
+        cuid.generate_many(5)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(cuid.generate_many, [10, 20]))
+        stats = cuid.stats()
+        assert stats.ids_generated == stats.counter_advance == 35
+        assert stats.entropy_bytes > 0
+        assert stats.counter_start == min(shard.stats().counter_start for shard in cuid._shards)
+
+    #  Tests that the entropy of combined snapshots is left out unless every snapshot reports it
+    def test_combine_missing_entropy(self: "TestStats") -> None:
+        reported = CuidStats(1, 64, 10, 1, 0.5, 0.25)
+        missing = CuidStats(2, None, 5, 2, 1.0, 0.5)
+        assert metrics.combine_stats([reported, reported]) == CuidStats(2, 128, 10, 2, 1.0, 0.5)
+        assert metrics.combine_stats([reported, missing]) == CuidStats(3, None, 5, 3, 1.5, 0.75)
+
+
+class TestPrometheusText:
+    #  Tests that every metric is exported with its type, and one sample per generator
+    def test_format(self: "TestPrometheusText") -> None:
+        first = Cuid(metrics=True)
+        first.generate_many(3)
+        second = Cuid(metrics=True)
+        text = prometheus_text({"first": first, "second": second})
+        lines = text.splitlines()
+        assert text.endswith("\n")
+        assert "# TYPE cuid2_ids_generated_total counter" in lines
+        assert "# TYPE cuid2_ids_per_second gauge" in lines
+        assert 'cuid2_ids_generated_total{generator="first"} 3' in lines
+        assert 'cuid2_ids_generated_total{generator="second"} 0' in lines
+        assert sum(line.startswith("# HELP") for line in lines) == len(metrics._PROMETHEUS_METRICS)
+
+    #  Tests that metrics a generator does not report are left out
+    def test_missing_entropy(self: "TestPrometheusText") -> None:
+        text = prometheus_text({"seeded": Cuid(random_generator=seeded_random, metrics=True)})
+        assert "# TYPE cuid2_entropy_bytes_total counter" in text
+        assert "cuid2_entropy_bytes_total{" not in text
+
+    #  Tests that a sharded generator is exported as the sum of its shards
+    def test_sharded(self: "TestPrometheusText") -> None:
+        cuid = ShardedCuid(metrics=True)
+        cuid.generate_many(4)
+        assert 'cuid2_ids_generated_total{generator="sharded"} 4' in prometheus_text({"sharded": cuid}).splitlines()
+
+    #  Tests that label values are escaped
+    def test_label_escaping(self: "TestPrometheusText") -> None:
+        text = prometheus_text({'a"b\\c\nd': Cuid(metrics=True)})
+        assert 'cuid2_ids_generated_total{generator="a\\"b\\\\c\\nd"} 0' in text.splitlines()
+
+    #  Tests that generators without metrics are rejected
+    def test_disabled_generator(self: "TestPrometheusText") -> None:
+        with pytest.raises(RuntimeError):
+            prometheus_text({"default": Cuid()})
@@ -0,0 +1,99 @@
+import string
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cuid2 import DEFAULT_LENGTH, INITIAL_COUNT_MAX, Cuid, parallel
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from unittest.mock import Mock
+
+
+def assert_cuids(cuids: list[str], count: int, length: int) -> None:
+    """Assert that `cuids` holds `count` unique CUIDs of the given length."""
+    assert len(cuids) == count
+    assert len(set(cuids)) == count
+    assert all(len(cuid) == length and cuid[0] in string.ascii_lowercase for cuid in cuids)
+
+
+class TestParallel:
+    #  Tests that generate() returns the requested number of unique CUIDs, across chunks and workers
+    @pytest.mark.parametrize(("count", "workers"), [(0, 1), (1, 2), (2_345, 1), (10_005, 3)])
+    def test_generate(self: "TestParallel", count: int, workers: int) -> None:
+        assert_cuids(parallel.generate(count, workers, chunk_size=1_000), count, DEFAULT_LENGTH)
+
+    #  Tests that generate() honors the length
+    def test_generate_length(self: "TestParallel") -> None:
+        assert_cuids(parallel.generate(100, 2, length=10, chunk_size=30), 100, 10)
+
+    #  Tests that generate_chunks() yields newline-terminated chunks, in order and out of order
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_generate_chunks(self: "TestParallel", ordered: bool) -> None:
+        chunks = list(parallel.generate_chunks(25, 2, chunk_size=10, ordered=ordered))
+        assert sorted(chunk.count(b"\n") for chunk in chunks) == [5, 10, 10]
+        assert all(chunk.endswith(b"\n") for chunk in chunks)
+        assert_cuids(b"".join(chunks).decode().splitlines(), 25, DEFAULT_LENGTH)
+
+    #  Tests that ordered chunks are yielded in the order they were submitted
+    def test_ordered_chunks(self: "TestParallel") -> None:
+        chunks = list(parallel.generate_chunks(35, 2, chunk_size=10))
+        assert [chunk.count(b"\n") for chunk in chunks] == [10, 10, 10, 5]
+
+    #  Tests that stream() yields the CUIDs one by one
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_stream(self: "TestParallel", ordered: bool) -> None:
+        assert_cuids(list(parallel.stream(1_001, 2, chunk_size=100, ordered=ordered)), 1_001, DEFAULT_LENGTH)
+
+    #  Tests that at most TASKS_PER_WORKER chunks per worker are submitted ahead of the consumer
+    def test_bounded_submissions(self: "TestParallel", mocker: "Mock") -> None:
+        counts = []
+        chunk_counts = parallel._chunk_counts
+
+        def spy(count: int, chunk_size: int) -> "Iterator[int]":
+            for chunk_count in chunk_counts(count, chunk_size):
+                counts.append(chunk_count)
+                yield chunk_count
+
+        mocker.patch.object(parallel, "_chunk_counts", spy)
+        chunks = parallel.generate_chunks(100, 2, chunk_size=1)
+        next(chunks)
+        assert len(counts) == 2 * parallel.TASKS_PER_WORKER + 1
+        chunks.close()
+
+    #  Tests that every worker offsets its counter by a distinct multiple of INITIAL_COUNT_MAX
+    def test_worker_counter_offsets(self: "TestParallel", mocker: "Mock") -> None:
+        worker_indexes = mocker.Mock(value=0)
+        worker_indexes.get_lock.return_value = mocker.MagicMock()
+        mock_random = mocker.Mock()
+        mock_random.random.return_value = 0.5
+        mocker.patch.object(parallel, "_worker_cuid", None)
+        # A constant random generator would give every worker the same counter, if not for the offsets.
+        mocker.patch.object(
+            parallel,
+            "Cuid",
+            side_effect=lambda counter: Cuid(random_generator=lambda: mock_random, counter=counter),
+        )
+
+        counters = []
+        for _ in range(3):
+            parallel._initialize_worker(worker_indexes)
+            counters.append(parallel._worker_cuid._counter())
+        assert worker_indexes.value == 3
+        assert [b - a for a, b in zip(counters, counters[1:])] == [INITIAL_COUNT_MAX, INITIAL_COUNT_MAX]
+
+    #  Tests that the arguments are checked before any worker is started
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"count": -1}, "Cannot generate a negative number of CUIDs."),
+            ({"length": 99}, "Length must never exceed 98 characters."),
+            ({"chunk_size": 0}, "Cannot generate CUIDs in parallel without a chunk size >= 1."),
+            ({"workers": 0}, "Cannot generate CUIDs in parallel without a number of workers >= 1."),
+        ],
+    )
+    def test_invalid_arguments(self: "TestParallel", mocker: "Mock", kwargs: dict, message: str) -> None:
+        executor = mocker.patch.object(parallel, "ProcessPoolExecutor")
+        with pytest.raises(ValueError, match=message):
+            parallel.generate_chunks(**{"count": 1, **kwargs})
+        executor.assert_not_called()
@@ -0,0 +1,141 @@
+import multiprocessing
+import os
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cuid2 import DEFAULT_LENGTH, Cuid, prefetch
+from cuid2.prefetch import PrefetchingCuid
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+    from unittest.mock import Mock
+
+
+def wait_for_buffer(prefetcher: PrefetchingCuid, size: int, timeout: float = 10) -> None:
+    """Wait until the background thread has filled the buffer of a PrefetchingCuid to at least `size` strings."""
+    deadline = time.monotonic() + timeout
+    while len(prefetcher._buffer) < size:
+        assert time.monotonic() < deadline, "the buffer was not filled in time"
+        time.sleep(0.001)
+
+
+def report_forked_cuids(prefetcher: PrefetchingCuid, queue: "Queue") -> None:
+    """Report CUIDs generated by a PrefetchingCuid inherited from a parent."""
+    queue.put([prefetcher.generate() for _ in range(100)])
+
+
+class TestPrefetchingCuid:
+    #  Tests that the constructor raises a ValueError when the watermarks are invalid
+    @pytest.mark.parametrize(("high", "low"), [(10, 10), (10, 20), (10, -1)])
+    def test_invalid_watermarks(self: "TestPrefetchingCuid", high: int, low: int) -> None:
+        with pytest.raises(ValueError, match="Watermarks must satisfy 0 <= low_watermark < high_watermark."):
+            PrefetchingCuid(high_watermark=high, low_watermark=low)
+
+    #  Tests that the constructor raises a ValueError when the batch size is less than 1
+    def test_invalid_batch_size(self: "TestPrefetchingCuid") -> None:
+        with pytest.raises(ValueError, match="Cannot prefetch without a batch size >= 1."):
+            PrefetchingCuid(batch_size=0)
+
+    #  Tests that the background thread is only started by the first call to generate()
+    def test_thread_started_lazily(self: "TestPrefetchingCuid") -> None:
+        with PrefetchingCuid() as prefetcher:
+            assert prefetcher._thread is None
+            prefetcher.generate()
+            assert prefetcher._thread is not None
+
+    #  Tests that the background thread fills the buffer to the high watermark, and never past it
+    def test_fills_to_high_watermark(self: "TestPrefetchingCuid") -> None:
+        with PrefetchingCuid(high_watermark=100, low_watermark=50, batch_size=30) as prefetcher:
+            prefetcher.generate()
+            # The first string may be popped after the buffer was filled, which does not trigger a refill.
+            wait_for_buffer(prefetcher, 99)
+            time.sleep(0.05)
+            assert 99 <= len(prefetcher._buffer) <= 100
+
+    #  Tests that the background thread holds the lock of the Cuid for small calls only, whatever the batch size
+    def test_fills_in_small_locked_calls(self: "TestPrefetchingCuid", mocker: "Mock") -> None:
+        cuid = Cuid()
+        spy = mocker.spy(cuid, "generate_many")
+        with PrefetchingCuid(cuid=cuid, high_watermark=100, low_watermark=50, batch_size=100) as prefetcher:
+            prefetcher.generate()
+            wait_for_buffer(prefetcher, 99)
+        counts = [call.args[0] for call in spy.call_args_list]
+        assert max(counts) == prefetch._LOCKED_BATCH_SIZE
+        assert sum(counts) >= 100
+
+    #  Tests that the buffer is refilled once it drops below the low watermark
+    def test_refills_below_low_watermark(self: "TestPrefetchingCuid") -> None:
+        with PrefetchingCuid(high_watermark=100, low_watermark=50) as prefetcher:
+            prefetcher.generate()
+            wait_for_buffer(prefetcher, 99)
+            for _ in range(60):
+                prefetcher.generate()
+            wait_for_buffer(prefetcher, 99)
+
+    #  Tests that generate() returns CUIDs with the default length, starting with a letter
+    def test_generate_format(self: "TestPrefetchingCuid") -> None:
+        with PrefetchingCuid() as prefetcher:
+            for _ in range(100):
+                cuid = prefetcher.generate()
+                assert len(cuid) == DEFAULT_LENGTH
+                assert cuid[0] in string.ascii_lowercase
+
+    #  Tests that a length other than the default length is generated synchronously
+    def test_generate_other_length(self: "TestPrefetchingCuid", mocker: "Mock") -> None:
+        cuid = Cuid()
+        with PrefetchingCuid(cuid=cuid) as prefetcher:
+            spy = mocker.spy(cuid, "generate")
+            assert len(prefetcher.generate(length=10)) == 10
+            spy.assert_called_once_with(10)
+
+    #  Tests that generate() falls back to generating synchronously when the buffer is empty
+    def test_synchronous_fallback(self: "TestPrefetchingCuid", mocker: "Mock") -> None:
+        cuid = Cuid()
+        with PrefetchingCuid(cuid=cuid) as prefetcher:
+            mocker.patch.object(prefetcher, "_start")
+            spy = mocker.spy(cuid, "generate")
+            assert len(prefetcher.generate()) == DEFAULT_LENGTH
+            spy.assert_called_once_with(None)
+
+    #  Tests that threads sharing a PrefetchingCuid never receive the same CUID
+    def test_threads_generate_unique_ids(self: "TestPrefetchingCuid") -> None:
+        prefetcher = PrefetchingCuid(high_watermark=64, low_watermark=16, batch_size=16)
+        with prefetcher, ThreadPoolExecutor(max_workers=8) as executor:
+            batches = list(executor.map(lambda _: [prefetcher.generate() for _ in range(500)], range(16)))
+        cuids = [c for batch in batches for c in batch]
+        assert len(set(cuids)) == len(cuids)
+
+    #  Tests that close() stops the background thread and discards the buffer
+    def test_close(self: "TestPrefetchingCuid") -> None:
+        prefetcher = PrefetchingCuid()
+        prefetcher.generate()
+        thread = prefetcher._thread
+        prefetcher.close()
+        assert thread is not None
+        assert not thread.is_alive()
+        assert len(prefetcher._buffer) == 0
+        with pytest.raises(ValueError, match="Cannot generate a CUID from a closed PrefetchingCuid."):
+            prefetcher.generate()
+
+    #  Tests that forked children discard their parent's buffer and never hand out the same CUIDs
+    @pytest.mark.skipif(not hasattr(os, "register_at_fork"), reason="requires os.fork")
+    def test_fork_discards_buffer(self: "TestPrefetchingCuid") -> None:
+        with PrefetchingCuid(high_watermark=1000, low_watermark=10) as prefetcher:
+            prefetcher.generate()
+            wait_for_buffer(prefetcher, 999)
+
+            context = multiprocessing.get_context("fork")
+            queue = context.Queue()
+            processes = [context.Process(target=report_forked_cuids, args=(prefetcher, queue)) for _ in range(4)]
+            for process in processes:
+                process.start()
+            cuids = [c for _ in processes for c in queue.get(timeout=30)]
+            for process in processes:
+                process.join()
+            cuids += [prefetcher.generate() for _ in range(100)]
+
+        assert len(set(cuids)) == len(cuids)
@@ -0,0 +1,169 @@
+import asyncio
+import threading
+from random import Random
+from typing import TYPE_CHECKING
+
+import pytest
+
+import cuid2
+from cuid2 import profiling, utils
+from cuid2.generator import Cuid
+from cuid2.profiling import Profile, Stage
+
+if TYPE_CHECKING:
+    from unittest.mock import Mock
+
+
+def seeded_random() -> Random:
+    """Create a random generator with a fixed seed, for tests that need reproducible CUIDs."""
+    return Random(42)  # noqa: S311 (pseudo-random generator)
+
+
+GENERATE_STAGES = [
+    "generate.create_letter",
+    "generate.base36_encode(time_ns)",
+    "generate.counter",
+    "generate.create_entropy",
+    "generate.create_hash",
+    "generate",
+]
+
+
+class TestProfile:
+    #  Tests that every stage of generate is timed once per call
+    def test_generate_stages(self: "TestProfile") -> None:
+        cuid = Cuid()
+        with cuid2.profile() as profile:
+            for _ in range(10):
+                cuid.generate()
+        assert list(profile.stages) == GENERATE_STAGES
+        for stage in profile.stages.values():
+            assert stage.calls == 10
+            assert stage.total_ns > 0
+            assert sum(stage.histogram) == 10
+        assert profile.stages["generate"].total_ns >= sum(
+            profile.stages[name].total_ns for name in GENERATE_STAGES[:-1]
+        )
+
+    #  Tests that a profiled generate returns the same CUIDs as an unprofiled one
+    def test_generate_unchanged(self: "TestProfile", mocker: "Mock") -> None:
+        mocker.patch("time.time_ns", return_value=1_700_000_000_000_000_000)
+        expected = Cuid(random_generator=seeded_random).generate_many(1) + [
+            Cuid(random_generator=seeded_random).generate(length) for length in (10, 24, 98)
+        ]
+        with cuid2.profile():
+            profiled = Cuid(random_generator=seeded_random).generate_many(1) + [
+                Cuid(random_generator=seeded_random).generate(length) for length in (10, 24, 98)
+            ]
+        assert profiled == expected
+
+    #  Tests that the stages of create_fingerprint are timed, with the default and custom fingerprint data
+    @pytest.mark.parametrize(
+        ("fingerprint_data", "hash_engine", "stages"),
+        [
+            ("", utils.sha3_512_digest, ["process_data", "create_entropy", "hash", "base36_encode"]),
+            ("", utils.blake2b_digest, ["process_data", "create_entropy", "create_hash"]),
+            ("custom", utils.sha3_512_digest, ["create_entropy", "create_hash"]),
+        ],
+    )
+    def test_fingerprint_stages(
+        self: "TestProfile",
+        fingerprint_data: str,
+        hash_engine: "utils.HashEngine",
+        stages: list[str],
+    ) -> None:
+        with cuid2.profile() as profile:
+            utils.create_fingerprint(seeded_random(), fingerprint_data, hash_engine)
+        assert list(profile.stages) == [f"create_fingerprint.{stage}" for stage in stages] + ["create_fingerprint"]
+
+    #  Tests that generate_many is timed once per call
+    def test_generate_many_stages(self: "TestProfile") -> None:
+        cuid = Cuid()
+        with cuid2.profile() as profile:
+            cuid.generate_many(100)
+        assert list(profile.stages) == [
+            "generate_many.draw_letters_and_salts",
+            "generate_many.hash_loop",
+            "generate_many",
+        ]
+        assert profile.stages["generate_many"].calls == 1
+
+    #  Tests that nothing is recorded outside of the with block, and that nested profiles restore the outer one
+    def test_activation(self: "TestProfile") -> None:
+        cuid = Cuid()
+        outer = Profile()
+        with outer:
+            cuid.generate()
+            with cuid2.profile() as inner:
+                assert profiling.current.get() is inner
+                cuid.generate()
+            assert profiling.current.get() is outer
+            cuid.generate()
+        assert profiling.current.get() is None
+        cuid.generate()
+        assert outer.stages["generate"].calls == 2
+        assert inner.stages["generate"].calls == 1
+
+    #  Tests that a profile records the calls of its own thread and of the tasks it creates, but not of other threads
+    def test_context(self: "TestProfile") -> None:
+        cuid = Cuid()
+
+        async def generate_in_task() -> None:
+            await asyncio.create_task(asyncio.to_thread(cuid.generate))
+
+        with cuid2.profile() as profile:
+            thread = threading.Thread(target=cuid.generate)
+            thread.start()
+            thread.join()
+            asyncio.run(generate_in_task())
+        assert profile.stages["generate"].calls == 1
+
+    #  Tests that the stopwatch records nothing while no profile is active
+    def test_null_stopwatch(self: "TestProfile") -> None:
+        stopwatch = profiling.stopwatch("generate")
+        assert stopwatch is profiling._NULL_STOPWATCH
+        stopwatch.lap("create_letter")
+        stopwatch.stop()
+
+    #  Tests that the report has a line per stage, with the share of every step in its whole calls
+    def test_report(self: "TestProfile") -> None:
+        profile = Profile()
+        profile.add("generate.create_hash", 300)
+        profile.add("generate.create_hash", 500)
+        profile.add("generate", 1000)
+        lines = profile.report().splitlines()
+        assert lines[0].split() == ["stage", "calls", "total", "ms", "mean", "ns", "p50", "ns", "p99", "ns", "share"]
+        assert lines[1].split() == ["generate.create_hash", "2", "0.001", "400", "512", "512", "80.0%"]
+        assert lines[2].split() == ["generate", "1", "0.001", "1000", "1024", "1024"]
+
+
+class TestStage:
+    #  Tests that timings are counted in buckets of powers of two
+    def test_histogram(self: "TestStage") -> None:
+        stage = Stage()
+        for elapsed_ns in (0, 1, 3, 4, 1000, 2**70):
+            stage.add(elapsed_ns)
+        assert stage.calls == 6
+        assert stage.histogram[0] == 1
+        assert stage.histogram[1] == 1
+        assert stage.histogram[2] == 1
+        assert stage.histogram[3] == 1
+        assert stage.histogram[10] == 1
+        assert stage.histogram[-1] == 1
+
+    #  Tests that percentiles are bounded by the upper bound of their bucket
+    def test_percentile(self: "TestStage") -> None:
+        stage = Stage()
+        for elapsed_ns in [100] * 99 + [5000]:
+            stage.add(elapsed_ns)
+        assert stage.percentile_ns(50) == 128
+        assert stage.percentile_ns(99) == 128
+        assert stage.percentile_ns(100) == 8192
+        assert Stage().percentile_ns(50) == 0
+        assert stage.mean_ns == 149.0
+
+    #  Tests that percentiles outside of 0 to 100 are rejected
+    @pytest.mark.parametrize("percentile", [-1, 101])
+    def test_invalid_percentile(self: "TestStage", percentile: float) -> None:
+        with pytest.raises(ValueError, match="Percentile must be between 0 and 100."):
+            Stage().percentile_ns(percentile)
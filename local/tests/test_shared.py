@@ -0,0 +1,140 @@
+import multiprocessing
+import string
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cuid2 import DEFAULT_LENGTH, Cuid, shared
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+    from unittest.mock import Mock
+
+
+def read_shared_block(name: str, count: int, queue: "Queue") -> None:
+    """Attach to a shared memory block by name, and report the CUIDs it holds."""
+    block = SharedMemory(name)
+    with shared.CuidView(block, DEFAULT_LENGTH, count) as view:
+        queue.put(list(view))
+    block.close()
+
+
+class TestCuidView:
+    #  Tests that a view reads back the records written by generate_into(), by index, by slice and by iteration
+    @pytest.mark.parametrize("length", [2, DEFAULT_LENGTH, 64])
+    def test_round_trip(self: "TestCuidView", mocker: "Mock", length: int) -> None:
+        mocker.patch.object(shared, "ITERATION_CHUNK_SIZE", 7)
+        cuids = Cuid(length=length).generate_many(50)
+        view = shared.CuidView("".join(cuids).encode(), length)
+        assert len(view) == 50
+        assert list(view) == cuids
+        assert [view[index] for index in range(-50, 50)] == cuids + cuids
+        assert list(view[10:20]) == cuids[10:20]
+        assert list(view[40:10]) == []
+        assert view[::7] == cuids[::7]
+
+    #  Tests that a view returns bytes when decoding is disabled
+    def test_bytes(self: "TestCuidView") -> None:
+        view = shared.CuidView(b"abcdef", 3, decode=False)
+        assert list(view) == [b"abc", b"def"]
+        assert view[1] == b"def"
+        assert list(view[1:]) == [b"def"]
+
+    #  Tests that a view skips the terminator of every record
+    def test_terminator(self: "TestCuidView", mocker: "Mock") -> None:
+        mocker.patch.object(shared, "ITERATION_CHUNK_SIZE", 2)
+        view = shared.CuidView(b"abc\nde\0\nfgh\n", 3, terminator="\n")
+        assert len(view) == 3
+        assert list(view) == ["abc", "de", "fgh"]
+        assert [view[2], *view[1:]] == ["fgh", "de", "fgh"]
+
+    #  Tests that a view slices the buffer instead of copying it
+    def test_zero_copy(self: "TestCuidView") -> None:
+        buffer = bytearray(b"abcdef")
+        view = shared.CuidView(buffer, 3)
+        tail = view[1:]
+        buffer[3:6] = b"xyz"
+        assert view[1] == tail[0] == "xyz"
+
+    #  Tests that the NUL padding of short records is stripped
+    def test_padding(self: "TestCuidView") -> None:
+        view = shared.CuidView(b"abc\0\0defgh", 5)
+        assert list(view) == ["abc", "defgh"]
+        assert view[0] == "abc"
+
+    #  Tests that the count limits the records read, and that the trailing bytes of the buffer are ignored
+    def test_count(self: "TestCuidView") -> None:
+        assert list(shared.CuidView(b"abcdefgh", 3)) == ["abc", "def"]
+        assert list(shared.CuidView(b"abcdefgh", 3, 1)) == ["abc"]
+        with pytest.raises(ValueError, match="Cannot read 3 CUIDs of 3 characters from a buffer of 8 bytes."):
+            shared.CuidView(b"abcdefgh", 3, 3)
+
+    #  Tests that a view raises an IndexError out of range, and a ValueError for an invalid length
+    def test_errors(self: "TestCuidView") -> None:
+        view = shared.CuidView(b"abc", 3)
+        with pytest.raises(IndexError):
+            view[1]
+        with pytest.raises(IndexError):
+            view[-2]
+        with pytest.raises(ValueError, match="Length must be between 1 and 98 characters."):
+            shared.CuidView(b"abc", 0)
+
+    #  Tests that releasing a view lets a shared memory block be closed
+    def test_release(self: "TestCuidView") -> None:
+        block = shared.generate_shared(10)
+        try:
+            with shared.CuidView(block, count=10) as view:
+                assert len(set(view)) == 10
+            block.close()
+        finally:
+            block.unlink()
+
+
+class TestGenerateShared:
+    #  Tests that another process reads the CUIDs of a shared memory block, by name
+    def test_other_process(self: "TestGenerateShared") -> None:
+        block = shared.generate_shared(1_000)
+        try:
+            with shared.CuidView(block, count=1_000) as view:
+                expected = list(view)
+            context = multiprocessing.get_context("spawn")
+            queue = context.Queue()
+            process = context.Process(target=read_shared_block, args=(block.name, 1_000, queue))
+            process.start()
+            cuids = queue.get(timeout=60)
+            process.join()
+        finally:
+            block.close()
+            block.unlink()
+
+        assert cuids == expected
+        assert len(set(cuids)) == 1_000
+        assert all(len(cuid) == DEFAULT_LENGTH and cuid[0] in string.ascii_lowercase for cuid in cuids)
+
+    #  Tests that generate_shared() accepts an empty block, and a custom generator and length
+    def test_options(self: "TestGenerateShared", mocker: "Mock") -> None:
+        cuid = Cuid()
+        spy = mocker.spy(cuid, "generate_many")
+        for count in (0, 5):
+            block = shared.generate_shared(count, length=10, cuid=cuid)
+            try:
+                with shared.CuidView(block, 10, count) as view:
+                    assert len(view) == count
+                    assert all(len(item) == 10 for item in view)
+            finally:
+                block.close()
+                block.unlink()
+        spy.assert_called_once_with(5, 10)
+
+    #  Tests that generate_shared() raises a ValueError on invalid arguments
+    @pytest.mark.parametrize(
+        ("count", "length", "message"),
+        [
+            (-1, 24, "Cannot generate a negative number of CUIDs."),
+            (1, 99, "Length must be between 1 and 98 characters."),
+        ],
+    )
+    def test_invalid_arguments(self: "TestGenerateShared", count: int, length: int, message: str) -> None:
+        with pytest.raises(ValueError, match=message):
+            shared.generate_shared(count, length)
@@ -0,0 +1,126 @@
+import string
+from timeit import repeat
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cuid2 import Cuid, is_cuid
+from cuid2.testing import FIXTURE_TIME_NS, FixtureCuid, SeededEntropyPool, step_clock
+from cuid2.utils import base36_encode
+
+if TYPE_CHECKING:
+    from unittest.mock import Mock
+
+
+class TestFixtureCuid:
+    #  Tests that the strings of the default fixture are pinned, so that snapshots stay valid across runs and hosts
+    def test_pinned_output(self: "TestFixtureCuid") -> None:
+        assert FixtureCuid().generate_many(2) == ["jid4olqnw7znsi47dmnpx4b9", "sxl5ksm5g21nkckow6a8x4ba"]
+        assert FixtureCuid().generate() == "jid4olqnw7znsi47dmnpx4b9"
+
+    #  Tests that generators with the same seed and fingerprint generate the same strings
+    def test_same_seed(self: "TestFixtureCuid") -> None:
+        first, second = FixtureCuid(seed=7), FixtureCuid(seed=7)
+        assert [first.generate() for _ in range(10)] == [second.generate() for _ in range(10)]
+        assert first.generate_many(1000) == second.generate_many(1000)
+
+    #  Tests that the seed and the fingerprint both change the strings
+    def test_different_seed_or_fingerprint(self: "TestFixtureCuid") -> None:
+        default = FixtureCuid().generate_many(10)
+        assert FixtureCuid(seed=1).generate_many(10) != default
+        assert FixtureCuid(fingerprint="host-2").generate_many(10) != default
+
+    #  Tests that the strings do not depend on the time, process ID or environment
+    def test_independent_of_host(self: "TestFixtureCuid", mocker: "Mock") -> None:
+        expected = FixtureCuid().generate_many(10)
+        mocker.patch("time.time_ns", return_value=0)
+        mocker.patch("os.getpid", return_value=1)
+        mocker.patch.dict("os.environ", {"FIXTURE": "1"})
+        assert FixtureCuid().generate_many(10) == expected
+
+    #  Tests that the strings have the format of CUIDs of every length
+    @pytest.mark.parametrize("length", [1, 2, 24, 98])
+    def test_format(self: "TestFixtureCuid", length: int) -> None:
+        cuid = FixtureCuid(length=length)
+        values = [cuid.generate(), *cuid.generate_many(100)]
+        assert all(len(value) == length for value in values)
+        assert all(value[0] in string.ascii_lowercase for value in values)
+        assert all(is_cuid(value, min_length=length, max_length=length) for value in values)
+
+    #  Tests that sortable fixtures read their prefix from the clock
+    def test_sortable_clock(self: "TestFixtureCuid") -> None:
+        cuids = FixtureCuid(clock=step_clock(), sortable=True).generate_many(100)
+        assert sorted(cuids) == cuids
+        assert cuids[0].startswith(base36_encode(FIXTURE_TIME_NS // 1_000_000))
+        assert len({value[:8] for value in cuids}) == 100
+
+        fixed = FixtureCuid(sortable=True).generate_many(10, length=16)
+        assert {value[:8] for value in fixed} == {base36_encode(FIXTURE_TIME_NS // 1_000_000)}
+        assert all(len(value) == 16 for value in fixed)
+
+    #  Tests that the clock and the counter change the last digits of every string, sortable or not
+    @pytest.mark.parametrize("sortable", [False, True])
+    def test_clock_and_counter(self: "TestFixtureCuid", *, sortable: bool) -> None:
+        fixed = FixtureCuid(sortable=sortable).generate_many(100)
+        stepped = FixtureCuid(clock=step_clock(), sortable=sortable).generate_many(100)
+        assert fixed[0] == stepped[0]
+        assert all(first[-4:] != second[-4:] for first, second in zip(fixed[1:], stepped[1:]))
+        assert len({value[-4:] for value in fixed}) == 100
+
+        if not sortable:
+            assert [value[:-4] for value in fixed] == [value[:-4] for value in stepped]
+
+    #  Tests that stream and generate_into use the fixture strings
+    def test_stream_and_generate_into(self: "TestFixtureCuid") -> None:
+        expected = FixtureCuid().generate_many(10)
+        stream = FixtureCuid().stream(chunk_size=10)
+        assert [next(stream) for _ in range(10)] == expected
+
+        buffer = bytearray(24 * 10)
+        FixtureCuid().generate_into(buffer)
+        assert buffer.decode() == "".join(expected)
+
+    #  Tests that fixtures report their metrics
+    def test_metrics(self: "TestFixtureCuid") -> None:
+        cuid = FixtureCuid(metrics=True)
+        cuid.generate()
+        cuid.generate_many(9)
+        assert cuid.stats().ids_generated == 10
+
+    #  Tests that the arguments are checked as for a Cuid
+    def test_invalid_arguments(self: "TestFixtureCuid") -> None:
+        with pytest.raises(ValueError, match="Length must never exceed 98 characters."):
+            FixtureCuid().generate(99)
+        with pytest.raises(ValueError, match="Cannot create entropy without a length >= 1."):
+            FixtureCuid().generate_many(1, length=-1)
+        with pytest.raises(ValueError, match="Sortable CUIDs must be at least 16 characters long."):
+            FixtureCuid(length=10, sortable=True)
+        with pytest.raises(ValueError, match="Cannot generate a negative number of CUIDs."):
+            FixtureCuid().generate_many(-1)
+        assert FixtureCuid().generate_many(0) == []
+
+    #  Tests that fixtures are generated several times faster than secure CUIDs
+    @pytest.mark.slow()
+    def test_throughput(self: "TestFixtureCuid") -> None:
+        fixture, cuid = FixtureCuid(), Cuid()
+        fixture_time = min(repeat(lambda: fixture.generate_many(10_000), number=1, repeat=5))
+        cuid_time = min(repeat(lambda: cuid.generate_many(10_000), number=1, repeat=5))
+        assert fixture_time * 5 < cuid_time
+
+
+class TestSeededEntropyPool:
+    #  Tests that pools with the same seed return the same values, and count the bytes they draw
+    def test_deterministic(self: "TestSeededEntropyPool") -> None:
+        first, second = SeededEntropyPool(3, chunk_size=64), SeededEntropyPool(3, chunk_size=64)
+        assert first.base36_digits(500) == second.base36_digits(500)
+        assert first.lowercase_letters(500) == second.lowercase_letters(500)
+        assert first.random() == second.random()
+        assert first.bytes_read == second.bytes_read > 0
+        assert SeededEntropyPool(4).base36_digits(32) != SeededEntropyPool(3).base36_digits(32)
+
+
+class TestStepClock:
+    #  Tests that the clock starts at its start time and advances by its step
+    def test_step_clock(self: "TestStepClock") -> None:
+        clock = step_clock(10, 5)
+        assert [clock(), clock(), clock()] == [10, 15, 20]
@@ -1,10 +1,13 @@
 import os
 import string
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
 from typing import TYPE_CHECKING
 
 import pytest
 
 from cuid2 import utils
+from cuid2.entropy import EntropyPool
 
 if TYPE_CHECKING:
     from unittest.mock import Mock
@@ -52,6 +55,71 @@ class TestBase36Encode:
             == "2kqaqr9n8eopgtn6k95g23riodx51p4o3jwyma480okqkygdk2cn232qvv2svfuvbzb5dy9yeoqceom839h5k1yzf6izbx3rnrjx4pfili0r67ebjqnjhwqevgboilk8yf8ueh7pnd28hk2xttyvgmiqcew98grghfhqz4xe93yiifh69uh4kxt2ld4ba87izsm9u323ekhjh37k5tsyn9of1gds6lzq526i1r3f70gd74z9ni2b2ej456p7frfijzu9hpdkw1vpsuwds7zpbr7uwcu2qbb0o9djiehjcltlpptcqg19sxajz8vyffjeuajmdew0q9j9h7ovpgmyat92n3rx0fgfsu4kluaoi146z5v1t00q073fe6f6ijdue1g06lvqx9ijmezax2tooljo5c362eil7nkkz91d0n5ghfe1rhofsyujw4209klyhjzcu10ycc0oc19pq7sqo1ugs10ym59phjo752siiuj56z2yns5dtodwff92we0a9sgho98t2jgqtgiwilmcmksi5aighqi8h5pxsvyc6owrans06be91u2gtwi43s3i46rjkvpn85xzco0dgwfzzp8hto1axij5w3j69snadxvc0ed3971r936qzc0cyou95081lvplzcrid76kf8wbm68tj3zv4j9fj4dnl19etn1koc3hx8eixx85uda4rv92j3dl0ib8ixgeywnjmivv3kmich1balqsp1hd4b88r7aephwoc9uphu9u2eorlvjmquvqziuu7w1usbf3lmdx289lkdeyecnymd88xlb7thrlmxvzjlmnxfjzmqcnaie4sfz81mlqq6n48b4vdkh7gimhfy9rddxdy3fi2faochb1cnikvkwdz02qa5v9p3l7cnzhxqwhrqdhrcawfl2lbzvs26uzf2fyj2u5i7gv750aitt8drg8md9i551u8hpaw28r1p3qi29soq8d2iakhw2ezzeux71zlex537kgs18lgk56nw1gbrk00oqowzb5t117bvgp6221nr5slvxz3ozr2gqdzume9xuqpeeza98qd009p50qkmghyb3tqsyhmo72h9ptv98w6dh1vwrja2oa5lfi2ei234f2haziqh3jp0v8vv40tur6cydgv8dohm20yurg6gymgjgm3pb8q2hf57hxioeiyild50rersbfumcyc4ij5nhxavlg5s976mkphr0wurzuri1uk44vmrw6w3mftfozkxvo14aii0xct1t6czu9w9njatnx9igw51aqy3c7rjz7vugf0yzlo6t61a72ddp7lrd9ymgyca271cr17f16fojq5g688h6rgxg1hhb5zzedw23723s93mai3f603gd4utc7levfzpdhqt7l7t4b70efvq029zofoqrzgno8bpyg5vgz12jdun0of0ua47zzpa7wk0psnrq0yal1isbf6hbnlvfundz2hbrl4mfxnxxgobkv2jyaag9872k45x8uwau1mlzx8xhtc43829wyauwejfqifs4em5ipgih0ypn8bfjyq6b3blevcmrostiqldnqa7znph1zfm7xdjmhghmx57qit1ojxjkjliendm98redq1xtai822suagwdzhq1y8kf523m0nslhvjomttuydoqqe6pr5rf76aqe3pwx6pmcrub3gmvg6scojyjj4o429qjpzjsehoqe8y6rivp7i904dricmv1l75cfomy5x92cd34m7r8k886i7o58krwj5257b9wfq7dcj4mwq76vctcezae4v8jtz29fsjl2lbjqhxfjb8itp6x89ems9fga26i7t7zl5njmbqtp2jt9ommmhiz3ty7izh9gk5dxr26n9bz6j3swbu980hfd9v0vbdrn72ra3eiawckwkvhmdgfpi12cjamr0jf22jf268sg"  # noqa: E501
         )
 
+    #  Tests that the function matches a digit-by-digit reference encoding across chunk boundaries
+    def test_matches_reference_encoding(self: "TestBase36Encode") -> None:
+        alphabet = string.digits + string.ascii_lowercase
+
+        def reference_encode(number: int) -> str:
+            encoded_string = ""
+            while number != 0:
+                number, mod = divmod(number, 36)
+                encoded_string = alphabet[mod] + encoded_string
+            return encoded_string or "0"
+
+        random = Random(36)  # noqa: S311 (pseudo-random generator)
+        numbers = [36**exponent + offset for exponent in range(30) for offset in (-1, 0, 1)]
+        numbers += [random.getrandbits(random.randint(1, 1024)) for _ in range(2000)]
+        for number in numbers:
+            assert utils.base36_encode(number) == reference_encode(number)
+
+
+class TestCreateBase36Encoder:
+    #  Tests that the encoder returns the same strings as base36_encode, for values of every magnitude in any order
+    def test_matches_base36_encode(self: "TestCreateBase36Encoder") -> None:
+        encode = utils.create_base36_encoder()
+        random = Random(42)  # noqa: S311 (pseudo-random generator)
+        values = [0, 1, 35, 36, 36**4 - 1, 36**4, 36**4 + 1, 36**5, 2**63, *(36**4 * k for k in range(1, 5))]
+        values += [random.randrange(36 ** random.randrange(1, 30)) for _ in range(10_000)]
+        for value in values:
+            assert encode(value) == utils.base36_encode(value)
+
+    #  Tests that the encoder returns the same strings as base36_encode for consecutive values, across carries
+    @pytest.mark.parametrize("start", [0, 36**4 - 10, 476782367 - 10, 36**8 - 10, 1627584000000000000])
+    def test_consecutive_values(self: "TestCreateBase36Encoder", start: int) -> None:
+        encode = utils.create_base36_encoder()
+        for value in range(start, start + 2000):
+            assert encode(value) == utils.base36_encode(value)
+
+    #  Tests that the encoder keeps rejecting negative values
+    def test_negative(self: "TestCreateBase36Encoder") -> None:
+        encode = utils.create_base36_encoder()
+        encode(36**4 * 3)
+        with pytest.raises(ValueError, match="Cannot encode negative integers."):
+            encode(-1)
+
+    #  Tests that an encoder shared between threads returns consistent encodings
+    def test_threads(self: "TestCreateBase36Encoder") -> None:
+        encode = utils.create_base36_encoder()
+        values = [36**4 * (value % 7) + value for value in range(20_000)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            encodings = list(executor.map(encode, values))
+        assert encodings == [utils.base36_encode(value) for value in values]
+
+
+class TestBase36EncodeBytes:
+    #  Tests that the function encodes bytes as a big-endian unsigned integer
+    def test_matches_integer_encoding(self: "TestBase36EncodeBytes") -> None:
+        data = bytes(range(64))
+        assert utils.base36_encode_bytes(data) == utils.base36_encode(int.from_bytes(data, byteorder="big"))
+
+    #  Tests that the function returns "0" when given empty bytes
+    def test_empty_bytes_returns_0(self: "TestBase36EncodeBytes") -> None:
+        assert utils.base36_encode_bytes(b"") == "0"
+
+    #  Tests that the function ignores leading zero bytes
+    def test_leading_zero_bytes(self: "TestBase36EncodeBytes") -> None:
+        assert utils.base36_encode_bytes(b"\x00\x00\x01\x00") == "74"
+
 
 class TestCreateLetter:
     #  Tests that create_letter function returns a lowercase letter
@@ -72,6 +140,13 @@ class TestCreateLetter:
         mock_random.random.return_value = 0.999
         assert utils.create_letter(random_generator=mock_random) in string.ascii_lowercase
 
+    #  Tests that create_letter function draws the letter from an entropy pool
+    def test_create_letter_entropy_pool(self: "TestCreateLetter", mocker: "Mock") -> None:
+        pool = EntropyPool()
+        spy = mocker.spy(pool, "lowercase_letters")
+        assert utils.create_letter(random_generator=pool) in string.ascii_lowercase
+        spy.assert_called_once_with(1)
+
 
 class TestCreateHash:
     #  Tests that the output of create_hash() is always a string of length 98
@@ -115,6 +190,71 @@ class TestCreateHash:
         with pytest.raises(AttributeError):
             utils.create_hash(12345)  # type: ignore[arg-type]
 
+    #  Tests that the truncated hash is the same as the prefix of the full hash, for random inputs of every engine
+    @pytest.mark.parametrize("engine", sorted(utils.HASH_ENGINES))
+    def test_truncate_matches_full_hash(self: "TestCreateHash", engine: str) -> None:
+        random = Random(engine)  # noqa: S311 (pseudo-random generator)
+        hash_engine = utils.HASH_ENGINES[engine]
+        for length in range(1, 99):
+            for _ in range(20):
+                data = utils.base36_encode(random.getrandbits(random.randrange(1, 400)))
+                full = utils.create_hash(data, hash_engine, length)
+                assert utils.create_hash(data, hash_engine, length, truncate=True) == full[:length]
+
+
+class TestBase36EncodePrefix:
+    #  Tests that the leading digits are the same as those of the full encoding, for integers of every size
+    def test_matches_base36_encode(self: "TestBase36EncodePrefix") -> None:
+        random = Random(0)  # noqa: S311 (pseudo-random generator)
+        for _ in range(20_000):
+            number = random.getrandbits(random.randrange(0, 600))
+            digits = random.randrange(0, 105)
+            assert utils.base36_encode_prefix(number, digits) == utils.base36_encode(number)[:digits]
+
+    #  Tests the boundaries of the digit count, at every power of 36
+    @pytest.mark.parametrize("digits", [0, 1, 2, 24, 98, 99, 100])
+    def test_powers_of_36(self: "TestBase36EncodePrefix", digits: int) -> None:
+        for exponent in range(101):
+            for number in (36**exponent - 1, 36**exponent, 36**exponent + 1):
+                assert utils.base36_encode_prefix(number, digits) == utils.base36_encode(number)[:digits]
+
+    #  Tests that negative integers are rejected, as by base36_encode
+    def test_negative(self: "TestBase36EncodePrefix") -> None:
+        with pytest.raises(ValueError, match="Cannot encode negative integers."):
+            utils.base36_encode_prefix(-1, 10)
+
+
+class TestHashEngines:
+    #  Tests that the default engine hashes with SHA3-512, so that create_hash() is unchanged
+    def test_default_engine_is_sha3_512(self: "TestHashEngines") -> None:
+        assert utils.create_hash("test") == utils.base36_encode_bytes(utils.sha512(b"test").digest())[1:]
+        assert utils.HASH_ENGINES["sha3_512"] is utils.sha3_512_digest
+
+    #  Tests that create_hash() hashes the encoded data with the engine, and passes the length to it
+    def test_create_hash_uses_engine(self: "TestHashEngines", mocker: "Mock") -> None:
+        engine = mocker.Mock(return_value=b"\xff" * 8)
+        assert utils.create_hash("data", engine, 10) == utils.base36_encode(2**64 - 1)[1:]
+        engine.assert_called_once_with(b"data", 10)
+
+    #  Tests that the engines with a fixed output size return 512-bit digests
+    @pytest.mark.parametrize("engine", [utils.sha3_512_digest, utils.blake2b_digest])
+    def test_fixed_size_digests(self: "TestHashEngines", engine: "utils.HashEngine") -> None:
+        assert len(engine(b"data", 1)) == len(engine(b"data", 98)) == 64
+
+    #  Tests that SHAKE-256 digests hold 64 bits more than the base36 digits used, for every length
+    @pytest.mark.parametrize("length", [0, 1, 24, 98, 150])
+    def test_shake_256_size(self: "TestHashEngines", length: int) -> None:
+        digest = utils.shake_256_digest(b"data", length)
+        assert len(digest) == utils.shake_256_size(length)
+        assert len(digest) * 8 >= (36 ** (length + 1) - 1).bit_length() + 64
+        assert digest == utils.shake_256_digest(b"data", 98)[: len(digest)] or length > 98
+
+    #  Tests that every engine returns enough base36 characters for the length used
+    @pytest.mark.parametrize("engine", sorted(utils.HASH_ENGINES))
+    def test_create_hash_length(self: "TestHashEngines", engine: str) -> None:
+        for length in range(1, 99):
+            assert len(utils.create_hash("data", utils.HASH_ENGINES[engine], length)) >= length
+
 
 class TestCreateEntropy:
     #  Tests that create_entropy returns a string of expected length and only contains characters
@@ -199,6 +339,20 @@ class TestCreateEntropy:
         assert len(result) == 10
         assert all(c in string.digits + string.ascii_lowercase for c in result)
 
+    #  Tests that create_entropy draws all characters from an entropy pool in a single call
+    def test_create_entropy_entropy_pool(self: "TestCreateEntropy", mocker: "Mock") -> None:
+        pool = EntropyPool()
+        spy = mocker.spy(pool, "base36_digits")
+        result = utils.create_entropy(pool, length=24)
+        assert len(result) == 24
+        assert all(c in string.digits + string.ascii_lowercase for c in result)
+        spy.assert_called_once_with(24)
+
+    #  Tests that create_entropy raises a ValueError when given an entropy pool and a length of 0
+    def test_create_entropy_entropy_pool_zero_length(self: "TestCreateEntropy") -> None:
+        with pytest.raises(ValueError, match="Cannot create entropy without a length >= 1."):
+            utils.create_entropy(EntropyPool(), length=0)
+
 
 class TestCreateFingerprint:
     #  Tests that create_fingerprint returns a string of length BIG_LENGTH when valid fingerprint data is provided
@@ -255,6 +409,44 @@ class TestCreateFingerprint:
 
         assert len(result) == expected_length
 
+    #  Tests that the default fingerprint is the hash of the process data followed by the entropy
+    def test_create_fingerprint_matches_create_hash(self: "TestCreateFingerprint", mocker: "Mock") -> None:
+        mock_random = mocker.Mock()
+        mock_random.random.return_value = 0.5
+        mocker.patch("socket.gethostname", return_value="host")
+        mocker.patch.dict(os.environ, {"A": "1", "B": "2"}, clear=True)
+        mocker.patch.object(utils, "_process_fingerprint", None)
+
+        fingerprint_data = str(os.getpid()) + "host" + "AB" + utils.create_entropy(mock_random, utils.BIG_LENGTH)
+        assert utils.create_fingerprint(random_generator=mock_random) == utils.create_hash(fingerprint_data)[0:32]
+
+    #  Tests that the process data is only read once per process ID, and read again in a new process
+    def test_create_fingerprint_caches_process_data(self: "TestCreateFingerprint", mocker: "Mock") -> None:
+        mocker.patch.object(utils, "_process_fingerprint", None)
+        gethostname = mocker.patch("socket.gethostname", return_value="host")
+        pool = EntropyPool()
+
+        fingerprints = {utils.create_fingerprint(random_generator=pool) for _ in range(10)}
+        assert len(fingerprints) == 10
+        assert gethostname.call_count == 1
+
+        mocker.patch.object(utils.os, "getpid", return_value=os.getpid() + 1)
+        utils.create_fingerprint(random_generator=pool)
+        assert gethostname.call_count == 2
+
+    #  Tests that the fingerprint is hashed with the hash engine, including the default fingerprint data
+    def test_create_fingerprint_with_hash_engine(self: "TestCreateFingerprint", mocker: "Mock") -> None:
+        mock_random = mocker.Mock()
+        mock_random.random.return_value = 0.5
+        mocker.patch("socket.gethostname", return_value="host")
+        mocker.patch.dict(os.environ, {"A": "1"}, clear=True)
+        mocker.patch.object(utils, "_process_fingerprint", None)
+
+        entropy = utils.create_entropy(mock_random, utils.BIG_LENGTH)
+        expected = utils.create_hash(str(os.getpid()) + "hostA" + entropy, utils.blake2b_digest)[0:32]
+        assert utils.create_fingerprint(mock_random, hash_engine=utils.blake2b_digest) == expected
+        assert utils.create_fingerprint(mock_random) != expected
+
     #  Tests that create_fingerprint ignores invalid data types are provided as input
     def test_create_fingerprint_with_invalid_data_types(self: "TestCreateFingerprint", mocker: "Mock") -> None:
         mock_random = mocker.Mock()
@@ -365,6 +557,14 @@ class TestCreateCounter:
         counter2 = utils.create_counter(0)
         assert counter1 != counter2
 
+    #  Tests that threads sharing a counter never receive the same value
+    def test_counter_thread_safety(self: "TestCreateCounter") -> None:
+        counter = utils.create_counter(0)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            batches = list(executor.map(lambda _: [counter() for _ in range(1_000)], range(64)))
+        values = [value for batch in batches for value in batch]
+        assert sorted(values) == list(range(1, 64_001))
+
     #  Tests that the count variable is not accessed outside the counter function
     def test_count_variable_not_accessed_outside_function(self: "TestCreateCounter") -> None:
         counter = utils.create_counter(0)
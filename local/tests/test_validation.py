@@ -0,0 +1,92 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cuid2 import DEFAULT_LENGTH, Cuid, is_cuid, validate_many, validation
+from cuid2.generator import MAXIMUM_LENGTH
+
+if TYPE_CHECKING:
+    from unittest.mock import Mock
+
+INVALID_CUIDS = [
+    "",
+    "a",
+    "1abc",
+    "Abc",
+    "aBc",
+    "a-bc",
+    " abc",
+    "abc\n",
+    "abc\r",
+    "a_bc",
+    "+abc",
+    "ａbc",  # noqa: RUF001 (fullwidth letter on purpose)
+    "a٣",
+    "a" * 99,
+]
+
+
+class TestIsCuid:
+    #  Tests that is_cuid() accepts generated CUIDs of every length
+    @pytest.mark.parametrize("length", [2, 10, DEFAULT_LENGTH, MAXIMUM_LENGTH])
+    def test_generated(self: "TestIsCuid", length: int) -> None:
+        assert all(map(is_cuid, Cuid(length=length).generate_many(100)))
+
+    #  Tests that is_cuid() rejects malformed values
+    @pytest.mark.parametrize("value", INVALID_CUIDS)
+    def test_malformed(self: "TestIsCuid", value: str) -> None:
+        assert not is_cuid(value)
+        assert not is_cuid(value.encode())
+
+    #  Tests that is_cuid() checks bytes like strings, and rejects any other type
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(b"abc", True), (bytearray(b"abc"), False), (None, False), (1, False)],
+    )
+    def test_types(self: "TestIsCuid", value: object, expected: bool) -> None:
+        assert is_cuid(value) is expected
+
+    #  Tests that is_cuid() honors the minimum and maximum lengths
+    def test_lengths(self: "TestIsCuid") -> None:
+        assert is_cuid("a", min_length=1)
+        assert not is_cuid("abc", max_length=2)
+        assert is_cuid("abc", min_length=3, max_length=3)
+        assert not is_cuid("a" * 25, max_length=DEFAULT_LENGTH)
+
+
+class TestValidateMany:
+    #  Tests that validate_many() returns no failures for generated CUIDs, and for an empty input
+    def test_valid(self: "TestValidateMany") -> None:
+        cuids = Cuid().generate_many(10_000)
+        assert validate_many(cuids) == []
+        assert validate_many(iter(cuids)) == []
+        assert validate_many([]) == []
+        assert validate_many(b"") == []
+
+    #  Tests that validate_many() returns the index of every malformed value, in order, across chunks
+    @pytest.mark.parametrize("value", INVALID_CUIDS)
+    def test_failure_indexes(self: "TestValidateMany", mocker: "Mock", value: str) -> None:
+        mocker.patch.object(validation, "CHUNK_SIZE", 7)
+        values = Cuid().generate_many(30)
+        for index in (0, 8, 29):
+            values[index] = value
+        assert validate_many(values) == [0, 8, 29]
+        assert validate_many([item.encode() for item in values]) == [0, 8, 29]
+
+    #  Tests that validate_many() reports values that are neither str nor bytes, and mixed types
+    def test_mixed_types(self: "TestValidateMany") -> None:
+        assert validate_many(["abc", b"def", None, 1, "ghi"]) == [2, 3]
+
+    #  Tests that validate_many() checks the lines of a newline-delimited buffer
+    def test_buffer(self: "TestValidateMany") -> None:
+        cuids = Cuid().generate_many(100)
+        buffer = ("\n".join(cuids) + "\n").encode()
+        assert validate_many(buffer) == []
+        assert validate_many(memoryview(buffer)) == []
+        assert validate_many(bytearray(buffer[:-1])) == []
+        assert validate_many(b"abc\n\nABC\r\nabc\r\ndef") == [1, 2, 3]
+
+    #  Tests that validate_many() honors the minimum and maximum lengths
+    def test_lengths(self: "TestValidateMany") -> None:
+        assert validate_many(["a", "ab", "abc", "abcd"], min_length=2, max_length=3) == [0, 3]
+        assert validate_many(["a", "ab"], min_length=0) == []
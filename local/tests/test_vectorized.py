@@ -0,0 +1,80 @@
+import string
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cuid2 import DEFAULT_LENGTH, generator, utils
+
+np = pytest.importorskip("numpy")
+
+from cuid2 import vectorized  # noqa: E402
+
+if TYPE_CHECKING:
+    from unittest.mock import Mock
+
+
+class TestGenerateArray:
+    #  Tests that generate_array() returns an array of fixed-width byte strings of the requested length
+    @pytest.mark.parametrize("length", [1, 2, 10, DEFAULT_LENGTH, 64])
+    def test_format(self: "TestGenerateArray", length: int) -> None:
+        cuids = vectorized.generate_array(1000, length)
+        assert cuids.dtype == np.dtype(f"S{length}")
+        assert cuids.shape == (1000,)
+        allowed = set((string.ascii_lowercase + string.digits).encode())
+        for cuid in cuids.tolist():
+            assert len(cuid) == length
+            assert chr(cuid[0]) in string.ascii_lowercase
+            assert set(cuid) <= allowed
+
+    #  Tests that generate_array() returns an empty array when the count is 0
+    def test_empty(self: "TestGenerateArray") -> None:
+        cuids = vectorized.generate_array(0, 10)
+        assert cuids.dtype == np.dtype("S10")
+        assert cuids.shape == (0,)
+
+    #  Tests that generate_array() raises a ValueError when the length or the count is invalid
+    @pytest.mark.parametrize(
+        ("count", "length", "message"),
+        [
+            (1, 0, "Length must be between 1 and 98 characters."),
+            (1, 99, "Length must be between 1 and 98 characters."),
+            (-1, DEFAULT_LENGTH, "Cannot generate a negative number of CUIDs."),
+        ],
+    )
+    def test_invalid_arguments(self: "TestGenerateArray", count: int, length: int, message: str) -> None:
+        with pytest.raises(ValueError, match=message):
+            vectorized.generate_array(count, length)
+
+    #  Tests that generate_array() returns unique CUIDs, across chunks and calls
+    def test_unique(self: "TestGenerateArray", mocker: "Mock") -> None:
+        mocker.patch.object(vectorized, "CHUNK_SIZE", 1000)
+        cuids = np.concatenate([vectorized.generate_array(2500), vectorized.generate_array(2500)])
+        assert len(np.unique(cuids)) == 5000
+
+    #  Tests that every CUID is the hash prefix of its hash input, exactly like generate() and generate_many()
+    @pytest.mark.parametrize("length", [1, 2, 10, DEFAULT_LENGTH, 97, 98])
+    def test_matches_hash_prefix(self: "TestGenerateArray", mocker: "Mock", length: int) -> None:
+        spy = mocker.spy(vectorized.utils, "sha512")
+        cuids = vectorized.generate_array(500, length).tolist()
+        assert spy.call_count == 500
+        for call, cuid in zip(spy.call_args_list, cuids):
+            hashed_int = int.from_bytes(utils.sha512(call.args[0]).digest(), byteorder="big")
+            assert cuid[1:].decode() == generator._hash_prefix(hashed_int, length)
+
+    #  Tests that the hash inputs stay correct when the counter gains a base36 digit in the middle of a chunk
+    def test_counter_width_change(self: "TestGenerateArray", mocker: "Mock") -> None:
+        counter = vectorized._default_cuid()._counter
+        mocker.patch.object(counter, "_count", 36**6 - 11)
+        spy = mocker.spy(vectorized.utils, "sha512")
+        vectorized.generate_array(20)
+        fingerprint = vectorized._default_cuid()._fingerprint.encode()
+        counts = [bytes(call.args[0])[: -len(fingerprint)][-7:] for call in spy.call_args_list]
+        assert counts[9].endswith(b"zzzzzz")
+        assert counts[10] == b"1000000"
+
+    #  Tests that generate_array() raises an ImportError explaining how to install NumPy when it is missing
+    def test_missing_numpy(self: "TestGenerateArray", mocker: "Mock") -> None:
+        mocker.patch.dict(sys.modules, {"numpy": None})
+        with pytest.raises(ImportError, match="requires NumPy"):
+            vectorized.generate_array(1)
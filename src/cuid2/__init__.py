@@ -1,5 +1,17 @@
 """Next generation GUIDs. Collision-resistant ids optimized for horizontal scaling and performance."""
 
-from .generator import DEFAULT_LENGTH, INITIAL_COUNT_MAX, Cuid, cuid_wrapper
+from .generator import DEFAULT_LENGTH, INITIAL_COUNT_MAX, Cuid, ShardedCuid, cuid_many_wrapper, cuid_wrapper
+from .profiling import profile
+from .validation import is_cuid, validate_many
 
-__all__ = ["Cuid", "DEFAULT_LENGTH", "INITIAL_COUNT_MAX", "cuid_wrapper"]
+__all__ = [
+    "Cuid",
+    "DEFAULT_LENGTH",
+    "INITIAL_COUNT_MAX",
+    "ShardedCuid",
+    "cuid_many_wrapper",
+    "cuid_wrapper",
+    "is_cuid",
+    "profile",
+    "validate_many",
+]
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import weakref
+from collections import deque
+
+from cuid2.generator import Cuid
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from typing import Final, Optional
+
+DEFAULT_CHUNK_SIZE: Final = 1024
+
+_LIVE_ASYNC_CUIDS: weakref.WeakSet[AsyncCuid] = weakref.WeakSet()
+
+
+class AsyncCuid:
+    def __init__(
+        self: AsyncCuid,
+        cuid: Optional[Cuid] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """Initialization function for the AsyncCuid class, an asyncio facade that keeps the CPU-bound hashing of
+        CUID strings off the event loop.
+
+        Strings are generated in chunks of `chunk_size` in an executor, and individual awaits are served from an
+        in-memory queue. Once the queue drops below a quarter of `chunk_size`, the next chunk is generated in the
+        background. Only one chunk is generated at a time, so the underlying `Cuid` is never used by two threads at
+        once. After `os.fork`, the child discards the strings queued by its parent.
+
+        Parameters
+        ----------
+        cuid : Cuid, optional
+            The generator used to fill the queue. If it is not provided, a new `Cuid` is created. It should not be
+            used elsewhere while the AsyncCuid is in use.
+        chunk_size : int, default=DEFAULT_CHUNK_SIZE (1024)
+            The number of strings generated by each call to the executor.
+        executor : Executor, optional
+            The executor used to generate strings. If it is not provided, the event loop's default executor is used.
+
+        Raises
+        ------
+        ValueError
+            If the chunk_size parameter is less than 1.
+        """
+        if chunk_size < 1:
+            msg = "Cannot generate CUIDs asynchronously without a chunk size >= 1."
+            raise ValueError(msg)
+
+        self._cuid: Cuid = cuid or Cuid()
+        self._chunk_size: int = chunk_size
+        self._low_watermark: int = chunk_size // 4
+        self._executor: Optional[Executor] = executor
+        self._reset()
+        _LIVE_ASYNC_CUIDS.add(self)
+
+    def _reset(self: AsyncCuid) -> None:
+        self._queue: deque[str] = deque()
+        # Created on first use, so that it is bound to the running event loop.
+        self._lock: Optional[asyncio.Lock] = None
+        self._refill_task: Optional[asyncio.Future[None]] = None
+
+    async def _run_in_executor(self: AsyncCuid, count: int) -> list[str]:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._cuid.generate_many, count)
+
+    async def _refill(self: AsyncCuid) -> None:
+        self._queue.extend(await self._run_in_executor(self._chunk_size))
+
+    def _schedule_refill(self: AsyncCuid) -> asyncio.Future[None]:
+        """Returns the refill task, after starting one if none is running. Every caller goes through this single task,
+        so a single chunk is generated at a time, and `aclose` can cancel it.
+
+        Raises
+        ------
+        Exception
+            The exception of the previous refill task, if it failed and no caller has awaited it yet. The next call
+            starts a new refill task.
+        """
+        task: Optional[asyncio.Future[None]] = self._refill_task
+        if task is not None and task.done():
+            self._refill_task = None
+            error: Optional[BaseException] = None if task.cancelled() else task.exception()
+            if error is not None:
+                raise error
+            task = None
+
+        if task is None:
+            task = self._refill_task = asyncio.ensure_future(self._refill())
+            task.add_done_callback(_retrieve_exception)
+        return task
+
+    async def _await_refill(self: AsyncCuid) -> None:
+        task: asyncio.Future[None] = self._schedule_refill()
+        try:
+            # Shielded, so that cancelling this caller does not cancel a refill other callers are waiting on.
+            await asyncio.shield(task)
+        except Exception:
+            # Raised to the callers waiting on the refill, so it is not raised again by the next one.
+            if self._refill_task is task:
+                self._refill_task = None
+            raise
+
+    async def agenerate(self: AsyncCuid) -> str:
+        """Returns a universally unique, base36 encoded string without blocking the event loop.
+
+        Returns
+        -------
+        str
+            A string as described in `Cuid.generate()`.
+        """
+        queue: deque[str] = self._queue
+        while not queue:
+            await self._await_refill()
+
+        # Checked before popping, so that the string is not lost if the previous refill raises.
+        if len(queue) <= self._low_watermark:
+            self._schedule_refill()
+        return queue.popleft()
+
+    async def agenerate_many(self: AsyncCuid, count: int) -> list[str]:
+        """Returns a batch of universally unique, base36 encoded strings without blocking the event loop.
+
+        Parameters
+        ----------
+        count : int
+            The number of strings to generate.
+
+        Returns
+        -------
+        list[str]
+            A list of `count` strings, each as described in `Cuid.generate()`.
+
+        Raises
+        ------
+        ValueError
+            If the count parameter is negative.
+        """
+        queue: deque[str] = self._queue
+        if 0 <= count <= len(queue):
+            if count and len(queue) - count < self._low_watermark:
+                self._schedule_refill()
+            return [queue.popleft() for _ in range(count)]
+
+        return await self._run_in_executor(count)
+
+    async def aclose(self: AsyncCuid) -> None:
+        """Cancels any background generation and discards the queued strings."""
+        if self._refill_task is not None and not self._refill_task.done():
+            self._refill_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refill_task
+
+        self._queue.clear()
+
+
+def _retrieve_exception(task: asyncio.Future[None]) -> None:
+    # Marks the exception of a failed refill as retrieved, so that asyncio does not report it as never retrieved when
+    # no caller awaited the task. It is raised to the next caller instead, see `AsyncCuid._schedule_refill`.
+    if not task.cancelled():
+        task.exception()
+
+
+def _reset_async_cuids_in_child() -> None:
+    # The queued strings were generated by the parent. The underlying Cuid re-derives its own state,
+    # see `generator.Cuid._reseed`.
+    for async_cuid in _LIVE_ASYNC_CUIDS:
+        async_cuid._reset()  # noqa: SLF001 (private member accessed)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_async_cuids_in_child)
@@ -0,0 +1,533 @@
+"""Benchmark suite for cuid2. Run with `python -m cuid2.bench --help`.
+
+Every benchmark reports a rate in operations (IDs, encodings, hashes, ...) per second, so that higher is always
+better. Results are printed as JSON, and can be compared against a previous run to detect performance regressions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pickle
+import platform
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from multiprocessing import Pool
+from secrets import SystemRandom
+
+from cuid2 import codec, export, metrics, parallel, shared, utils
+from cuid2.entropy import EntropyPool
+from cuid2.generator import DEFAULT_LENGTH, INITIAL_COUNT_MAX, Cuid, ShardedCuid
+from cuid2.testing import FixtureCuid
+from cuid2.validation import is_cuid, validate_many
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any, Callable, Final, Optional
+
+LENGTHS: Final = (10, DEFAULT_LENGTH, 32, 64)
+DEFAULT_ITERATIONS: Final = 20_000
+DEFAULT_REPEAT: Final = 5
+DEFAULT_TOLERANCE: Final = 0.1
+
+Results = dict[str, float]
+
+
+def _rate(function: Callable[[], object], iterations: int, repeat: int, operations: int = 1) -> float:
+    """Returns the best rate, in operations per second, of calling `function` `iterations` times, where every call
+    performs `operations` operations.
+    """
+    best: float = min(timeit.repeat(function, number=iterations, repeat=repeat))
+    return iterations * operations / best
+
+
+def bench_generate(iterations: int, repeat: int) -> Results:
+    """IDs per second of `Cuid.generate`, `Cuid.generate_many` and `Cuid.stream` at several lengths."""
+    results: Results = {}
+    for length in LENGTHS:
+        cuid: Cuid = Cuid(length=length)
+        results[f"generate[length={length}]"] = _rate(cuid.generate, iterations, repeat)
+        results[f"generate_many[length={length}]"] = _rate(
+            lambda cuid=cuid: cuid.generate_many(iterations),  # type: ignore[misc]
+            1,
+            repeat,
+            operations=iterations,
+        )
+        results[f"stream[length={length}]"] = _rate(
+            lambda cuid=cuid: deque(islice(cuid.stream(), iterations), maxlen=0),  # type: ignore[misc]
+            1,
+            repeat,
+            operations=iterations,
+        )
+    return results
+
+
+def _import_time() -> float:
+    """Returns the time, in seconds, that a fresh interpreter takes to import cuid2, as reported by `-X importtime`."""
+    output: str = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import cuid2"],  # noqa: S603 (trusted input: sys.executable)
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+    # The last line reports the cumulative time of the top-level import, in microseconds.
+    return int(output.strip().splitlines()[-1].split("|")[1]) / 1_000_000
+
+
+def bench_startup(iterations: int, repeat: int) -> Results:
+    """Imports per second of cuid2 in a fresh interpreter, and `Cuid` instances constructed per second."""
+    return {
+        "import": 1 / min(_import_time() for _ in range(repeat)),
+        "Cuid()": _rate(Cuid, max(iterations // 10, 1), repeat),
+        "Cuid().generate()": _rate(lambda: Cuid().generate(), max(iterations // 10, 1), repeat),
+    }
+
+
+def bench_hash_engines(iterations: int, repeat: int) -> Results:
+    """IDs per second of `Cuid.generate_many` with every built-in hash engine, and hashes per second of each engine."""
+    results: Results = {}
+    hash_input: bytes = utils.create_entropy(EntropyPool(), 80).encode()
+    for name, hash_engine in utils.HASH_ENGINES.items():
+        results[f"{name}[digest]"] = _rate(
+            lambda hash_engine=hash_engine: hash_engine(hash_input, DEFAULT_LENGTH),  # type: ignore[misc]
+            iterations,
+            repeat,
+        )
+        for length in LENGTHS:
+            cuid: Cuid = Cuid(length=length, hash_engine=hash_engine)
+            results[f"{name}[length={length}]"] = _rate(
+                lambda cuid=cuid: cuid.generate_many(iterations),  # type: ignore[misc]
+                1,
+                repeat,
+                operations=iterations,
+            )
+    return results
+
+
+def bench_shared(iterations: int, repeat: int) -> Results:
+    """IDs per second written into a buffer by `Cuid.generate_into` and read back by a `shared.CuidView`, and of
+    pickling the same IDs as a list, for context.
+    """
+    cuid: Cuid = Cuid()
+    buffer: bytearray = bytearray(iterations * DEFAULT_LENGTH)
+    cuid.generate_into(buffer)
+    cuids: list[str] = cuid.generate_many(iterations)
+    view: shared.CuidView = shared.CuidView(buffer)
+    return {
+        "generate_into": _rate(lambda: cuid.generate_into(buffer), 1, repeat, operations=iterations),
+        "view[iterate]": _rate(lambda: deque(view, maxlen=0), 1, repeat, operations=iterations),
+        "view[index]": _rate(lambda: view[iterations // 2], iterations, repeat),
+        "pickle[round_trip]": _rate(
+            lambda: pickle.loads(pickle.dumps(cuids)),  # noqa: S301 (pickle)
+            1,
+            repeat,
+            operations=iterations,
+        ),
+    }
+
+
+def bench_export(iterations: int, repeat: int) -> Results:
+    """IDs per second written to a file by `export.export`, and by a loop printing one ID per line, for context, and
+    IDs per second read back at random positions by an `export.CuidFile`.
+    """
+    cuid: Cuid = Cuid()
+    results: Results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "cuids.txt")  # noqa: PTH118 (os.path.join)
+
+        def export_file() -> None:
+            os.remove(path)  # noqa: PTH107 (os.remove)
+            export.export(path, iterations, cuid=cuid)
+
+        export.export(path, iterations, cuid=cuid)
+        results["export"] = _rate(export_file, 1, repeat, operations=iterations)
+
+        def print_lines() -> None:
+            with open(path, "w") as file:  # noqa: PTH123 (builtin open)
+                for _ in range(iterations):
+                    print(cuid.generate(), file=file)
+
+        results["print"] = _rate(print_lines, 1, repeat, operations=iterations)
+
+        export.export(path, iterations, cuid=cuid)
+        with export.CuidFile(path) as cuids:
+            positions: list[int] = [(index * 7919) % iterations for index in range(iterations)]
+            results["read[random]"] = _rate(
+                lambda: deque(map(cuids.__getitem__, positions), maxlen=0),
+                1,
+                repeat,
+                operations=iterations,
+            )
+    return results
+
+
+def bench_metrics(iterations: int, repeat: int) -> Results:
+    """IDs per second of `Cuid.generate` and `Cuid.generate_many` with and without metrics, and snapshots per second
+    of `Cuid.stats` and `metrics.prometheus_text`.
+    """
+    results: Results = {}
+    for enabled in (False, True):
+        cuid: Cuid = Cuid(metrics=enabled)
+        results[f"generate[metrics={enabled}]"] = _rate(cuid.generate, iterations, repeat)
+        results[f"generate_many[metrics={enabled}]"] = _rate(
+            lambda cuid=cuid: cuid.generate_many(iterations),  # type: ignore[misc]
+            1,
+            repeat,
+            operations=iterations,
+        )
+    results["stats"] = _rate(cuid.stats, iterations, repeat)
+    results["prometheus_text"] = _rate(lambda: metrics.prometheus_text({"default": cuid}), iterations, repeat)
+    return results
+
+
+def _sqlite_insert(rows: list[tuple[str]], directory: str) -> int:
+    """Inserts `rows` as the primary keys of a new SQLite table, in transactions of 1000 rows, with a cache too small
+    to hold the table, and returns the number of pages of the table.
+    """
+    path: str = os.path.join(directory, "ids.sqlite")  # noqa: PTH118 (os.path.join)
+    connection: sqlite3.Connection = sqlite3.connect(path, isolation_level=None)
+    try:
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.execute("PRAGMA cache_size = 64")
+        connection.execute("CREATE TABLE ids (id TEXT PRIMARY KEY) WITHOUT ROWID")
+        for start in range(0, len(rows), 1000):
+            connection.execute("BEGIN")
+            connection.executemany("INSERT INTO ids VALUES (?)", rows[start : start + 1000])
+            connection.execute("COMMIT")
+        return connection.execute("PRAGMA page_count").fetchone()[0]
+    finally:
+        connection.close()
+        os.remove(path)  # noqa: PTH107 (os.remove)
+
+
+def bench_sortable(iterations: int, repeat: int) -> Results:
+    """IDs per second of `Cuid.generate_many`, with and without the sortable prefix, and rows per second inserted and
+    rows per page stored with them as the primary key of a SQLite table, whose B-tree rewards nearby inserts.
+    """
+    results: Results = {}
+    count: int = iterations * 10
+    with tempfile.TemporaryDirectory() as directory:
+        for sortable in (False, True):
+            cuid: Cuid = Cuid(sortable=sortable)
+            results[f"generate_many[sortable={sortable}]"] = _rate(
+                lambda cuid=cuid: cuid.generate_many(iterations),  # type: ignore[misc]
+                1,
+                repeat,
+                operations=iterations,
+            )
+            rows: list[tuple[str]] = [(value,) for value in cuid.generate_many(count)]
+            results[f"sqlite_insert[sortable={sortable}]"] = _rate(
+                lambda rows=rows: _sqlite_insert(rows, directory),  # type: ignore[misc]
+                1,
+                repeat,
+                operations=count,
+            )
+            results[f"sqlite_rows_per_page[sortable={sortable}]"] = count / _sqlite_insert(rows, directory)
+    return results
+
+
+def bench_fixtures(iterations: int, repeat: int) -> Results:
+    """IDs per second of the deterministic `testing.FixtureCuid`, to compare with the `generate` section."""
+    fixture: FixtureCuid = FixtureCuid()
+    return {
+        "generate": _rate(fixture.generate, iterations, repeat),
+        "generate_many": _rate(lambda: fixture.generate_many(iterations), 1, repeat, operations=iterations),
+    }
+
+
+def bench_baselines(iterations: int, repeat: int) -> Results:
+    """IDs per second of the standard library's `uuid.uuid4`, for context."""
+    return {
+        "uuid4": _rate(uuid.uuid4, iterations, repeat),
+        "str(uuid4)": _rate(lambda: str(uuid.uuid4()), iterations, repeat),
+    }
+
+
+def bench_utils(iterations: int, repeat: int) -> Results:
+    """Calls per second of the building blocks of `Cuid.generate`."""
+    pool: EntropyPool = EntropyPool()
+    system_random: SystemRandom = SystemRandom()
+    hash_input: str = utils.create_entropy(pool, 64)
+    hashed_int: int = int.from_bytes(os.urandom(64), byteorder="big")
+    encode_time: Callable[[int], str] = utils.create_base36_encoder()
+    encode_count: Callable[[int], str] = utils.create_base36_encoder()
+    counter: Callable[[], int] = utils.create_counter(INITIAL_COUNT_MAX // 2)
+    return {
+        "base36_encode[512 bits]": _rate(lambda: utils.base36_encode(hashed_int), iterations, repeat),
+        "base36_encode[time_ns]": _rate(lambda: utils.base36_encode(time.time_ns()), iterations, repeat),
+        "create_base36_encoder[time_ns]": _rate(lambda: encode_time(time.time_ns()), iterations, repeat),
+        "create_base36_encoder[counter]": _rate(lambda: encode_count(counter()), iterations, repeat),
+        "create_hash": _rate(lambda: utils.create_hash(hash_input), iterations, repeat),
+        "create_hash[truncate, length=24]": _rate(
+            lambda: utils.create_hash(hash_input, length=DEFAULT_LENGTH, truncate=True),
+            iterations,
+            repeat,
+        ),
+        "create_entropy[EntropyPool]": _rate(lambda: utils.create_entropy(pool, DEFAULT_LENGTH), iterations, repeat),
+        "create_entropy[SystemRandom]": _rate(
+            lambda: utils.create_entropy(system_random, DEFAULT_LENGTH),
+            iterations,
+            repeat,
+        ),
+        "create_letter[EntropyPool]": _rate(lambda: utils.create_letter(pool), iterations, repeat),
+        "create_fingerprint": _rate(lambda: utils.create_fingerprint(pool), max(iterations // 10, 1), repeat),
+    }
+
+
+def bench_vectorized(iterations: int, repeat: int) -> Results:
+    """IDs per second of `vectorized.generate_array` at several lengths, if NumPy is installed."""
+    try:
+        import numpy as np  # noqa: F401 (unused import) # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        return {}
+
+    from cuid2.vectorized import generate_array  # pylint: disable=import-outside-toplevel
+
+    return {
+        f"generate_array[length={length}]": _rate(
+            lambda length=length: generate_array(iterations, length),  # type: ignore[misc]
+            1,
+            repeat,
+            operations=iterations,
+        )
+        for length in LENGTHS
+    }
+
+
+def bench_codec(iterations: int, repeat: int) -> Results:
+    """CUIDs per second converted to and from their binary encodings, one by one and in bulk."""
+    cuids: list[str] = Cuid().generate_many(iterations)
+    buffer: bytes = codec.encode_many(cuids)
+    cuid: str = cuids[0]
+    number: int = codec.encode_int(cuid)
+    return {
+        "encode_int": _rate(lambda: codec.encode_int(cuid), iterations, repeat),
+        "decode_int": _rate(lambda: codec.decode_int(number), iterations, repeat),
+        "encode_many": _rate(lambda: codec.encode_many(cuids), 1, repeat, operations=iterations),
+        "decode_many": _rate(lambda: codec.decode_many(buffer), 1, repeat, operations=iterations),
+    }
+
+
+def bench_validation(iterations: int, repeat: int) -> Results:
+    """Values per second checked by `is_cuid` and `validate_many`."""
+    cuids: list[str] = Cuid().generate_many(iterations)
+    buffer: bytes = ("\n".join(cuids) + "\n").encode("ascii")
+    cuid: str = cuids[0]
+    return {
+        "is_cuid": _rate(lambda: is_cuid(cuid), iterations, repeat),
+        "validate_many[list]": _rate(lambda: validate_many(cuids), 1, repeat, operations=iterations),
+        "validate_many[buffer]": _rate(lambda: validate_many(buffer), 1, repeat, operations=iterations),
+    }
+
+
+def _worker_counts() -> list[int]:
+    cpu_count: int = os.cpu_count() or 1
+    counts: list[int] = [1]
+    while counts[-1] * 2 <= max(cpu_count, 4):
+        counts.append(counts[-1] * 2)
+    return counts
+
+
+def bench_threads(iterations: int, repeat: int) -> Results:
+    """IDs per second of a `ShardedCuid` shared by an increasing number of threads."""
+    results: Results = {}
+    for threads in _worker_counts():
+        cuid: ShardedCuid = ShardedCuid()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+
+            def run(cuid: ShardedCuid = cuid, executor: ThreadPoolExecutor = executor, threads: int = threads) -> None:
+                for _ in executor.map(cuid.generate_many, (iterations,) * threads):
+                    pass
+
+            results[f"threads={threads}"] = _rate(run, 1, repeat, operations=iterations * threads)
+    return results
+
+
+def _mint(count: int) -> int:
+    return len(Cuid().generate_many(count))
+
+
+def bench_processes(iterations: int, repeat: int) -> Results:
+    """IDs per second of an increasing number of processes, each with its own `Cuid`."""
+    results: Results = {}
+    for processes in _worker_counts():
+        with Pool(processes) as pool:
+            pool.map(_mint, (1,) * processes)  # Start every worker before timing.
+            results[f"processes={processes}"] = _rate(
+                lambda pool=pool, processes=processes: pool.map(_mint, (iterations,) * processes),  # type: ignore[misc]
+                1,
+                repeat,
+                operations=iterations * processes,
+            )
+    return results
+
+
+def bench_parallel(iterations: int, repeat: int) -> Results:
+    """IDs per second of `parallel.generate` with an increasing number of worker processes, including the start of
+    the pool.
+    """
+    results: Results = {}
+    for workers in _worker_counts():
+        count: int = iterations * workers
+        results[f"workers={workers}"] = _rate(
+            lambda count=count, workers=workers: parallel.generate(count, workers),  # type: ignore[misc]
+            1,
+            repeat,
+            operations=count,
+        )
+    return results
+
+
+BENCHMARKS: Final[dict[str, Callable[[int, int], Results]]] = {
+    "generate": bench_generate,
+    "startup": bench_startup,
+    "hash_engines": bench_hash_engines,
+    "vectorized": bench_vectorized,
+    "baselines": bench_baselines,
+    "utils": bench_utils,
+    "codec": bench_codec,
+    "validation": bench_validation,
+    "threads": bench_threads,
+    "processes": bench_processes,
+    "parallel": bench_parallel,
+    "shared": bench_shared,
+    "export": bench_export,
+    "metrics": bench_metrics,
+    "sortable": bench_sortable,
+    "fixtures": bench_fixtures,
+}
+
+
+def run(
+    sections: Optional[Sequence[str]] = None,
+    iterations: int = DEFAULT_ITERATIONS,
+    repeat: int = DEFAULT_REPEAT,
+) -> dict[str, Any]:
+    """Runs the benchmarks and returns their results, along with metadata about the environment.
+
+    Parameters
+    ----------
+    sections : Sequence[str], optional
+        The names of the benchmark sections to run, from `BENCHMARKS`. If it is not provided, every section is run.
+    iterations : int, default=DEFAULT_ITERATIONS (20000)
+        The number of operations timed by each measurement.
+    repeat : int, default=DEFAULT_REPEAT (5)
+        The number of times each measurement is repeated. The best measurement is reported.
+
+    Returns
+    -------
+    dict[str, Any]
+        A JSON-serializable dictionary with "metadata" and "results" keys. The results map each section name to a
+        mapping of benchmark names to rates, in operations per second.
+    """
+    try:
+        from importlib.metadata import version  # pylint: disable=import-outside-toplevel
+
+        cuid2_version: str = version("cuid2")
+    except Exception:  # noqa: BLE001 (blind exception) # pylint: disable=broad-exception-caught
+        cuid2_version = "unknown"
+
+    return {
+        "metadata": {
+            "cuid2": cuid2_version,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "iterations": iterations,
+            "repeat": repeat,
+            "timestamp": time.time(),
+        },
+        "results": {section: BENCHMARKS[section](iterations, repeat) for section in sections or BENCHMARKS},
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """Compares two benchmark runs and describes every benchmark that regressed by more than `tolerance`.
+
+    Parameters
+    ----------
+    baseline : dict[str, Any]
+        The results of a previous run, as returned by `run()`.
+    current : dict[str, Any]
+        The results of the current run, as returned by `run()`.
+    tolerance : float, default=DEFAULT_TOLERANCE (0.1)
+        The accepted relative slowdown before a benchmark is reported as a regression.
+
+    Returns
+    -------
+    list[str]
+        A description of every regression. Benchmarks missing from either run are ignored.
+    """
+    regressions: list[str] = []
+    for section, results in current["results"].items():
+        for name, rate in results.items():
+            baseline_rate: Optional[float] = baseline["results"].get(section, {}).get(name)
+            if baseline_rate and rate < baseline_rate * (1 - tolerance):
+                slowdown: float = 1 - rate / baseline_rate
+                regressions.append(
+                    f"{section}/{name}: {rate:,.0f}/s is {slowdown:.1%} slower than {baseline_rate:,.0f}/s",
+                )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Runs the benchmark suite from the command line.
+
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        The command line arguments, without the program name. If it is not provided, `sys.argv` is used.
+    """
+    parser = argparse.ArgumentParser(prog="python -m cuid2.bench", description=__doc__)
+    parser.add_argument(
+        "-s",
+        "--section",
+        action="append",
+        choices=list(BENCHMARKS),
+        help="benchmark section to run, may be repeated (default: all sections)",
+    )
+    parser.add_argument("-i", "--iterations", type=int, default=DEFAULT_ITERATIONS, help="(default: %(default)s)")
+    parser.add_argument("-r", "--repeat", type=int, default=DEFAULT_REPEAT, help="(default: %(default)s)")
+    parser.add_argument("-o", "--output", help="file to write the JSON results to (default: standard output)")
+    parser.add_argument("-c", "--compare", help="JSON results of a previous run to check for regressions")
+    parser.add_argument(
+        "-t",
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="relative slowdown reported as a regression (default: %(default)s)",
+    )
+    arguments: argparse.Namespace = parser.parse_args(argv)
+
+    results: dict[str, Any] = run(arguments.section, arguments.iterations, arguments.repeat)
+    serialized: str = json.dumps(results, indent=2)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output:  # noqa: PTH123 (builtin open)
+            output.write(serialized + "\n")
+    else:
+        print(serialized)  # noqa: T201 (print statement)
+
+    if arguments.compare:
+        with open(arguments.compare, encoding="utf-8") as baseline_file:  # noqa: PTH123 (builtin open)
+            regressions: list[str] = compare(json.load(baseline_file), results, arguments.tolerance)
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)  # noqa: T201 (print statement)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
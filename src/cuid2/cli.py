@@ -1,8 +1,131 @@
-from cuid2.generator import cuid_wrapper
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+from cuid2.generator import DEFAULT_LENGTH, MAXIMUM_LENGTH, Cuid, cuid_wrapper
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import IO, Final, Iterator, Optional
 
 generate_cuid = cuid_wrapper()
 
+# The number of CUIDs generated, joined and written at a time.
+CHUNK_SIZE: Final = 10_000
+
+_worker_cuid: Optional[Cuid] = None
+
+
+def _generate_chunk(count: int, length: int) -> bytes:
+    global _worker_cuid  # noqa: PLW0603 (global statement) # pylint: disable=global-statement
+    if _worker_cuid is None:
+        _worker_cuid = Cuid()
+
+    return ("\n".join(_worker_cuid.generate_many(count, length)) + "\n").encode("ascii")
+
+
+def _chunk_counts(count: int) -> Iterator[int]:
+    full_chunks, remainder = divmod(count, CHUNK_SIZE)
+    yield from (CHUNK_SIZE,) * full_chunks
+    if remainder:
+        yield remainder
+
+
+def _positive_int(value: str) -> int:
+    number: int = int(value)
+    if number < 1:
+        msg = f"must be at least 1, got {number}"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
+def _non_negative_int(value: str) -> int:
+    number: int = int(value)
+    if number < 0:
+        msg = f"must not be negative, got {number}"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
+def _parse_arguments(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="cuid2", description="Generate CUIDs, one per line.")
+    parser.add_argument(
+        "-n",
+        "--count",
+        type=_non_negative_int,
+        default=1,
+        help="number of CUIDs to generate (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-l",
+        "--length",
+        type=_positive_int,
+        default=DEFAULT_LENGTH,
+        help=f"length of each CUID, at most {MAXIMUM_LENGTH} (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="file to write the CUIDs to, or - for standard output (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="number of processes generating CUIDs in parallel (default: %(default)s)",
+    )
+    arguments: argparse.Namespace = parser.parse_args(argv)
+
+    if arguments.length > MAXIMUM_LENGTH:
+        parser.error(f"argument -l/--length: must not exceed {MAXIMUM_LENGTH}, got {arguments.length}")
+
+    return arguments
+
+
+def _write_cuids(output: IO[bytes], count: int, length: int, workers: int) -> None:
+    if workers == 1:
+        for chunk_count in _chunk_counts(count):
+            output.write(_generate_chunk(chunk_count, length))
+        return
+
+    from cuid2 import parallel  # pylint: disable=import-outside-toplevel
+
+    # Chunks are written in order, as they are received from the worker processes.
+    for chunk in parallel.generate_chunks(count, workers, length, CHUNK_SIZE):
+        output.write(chunk)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Print out CUID generated strings, one per line. Used by the CLI console script.
+
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        The command line arguments, without the program name. If it is not provided, `sys.argv` is used.
+    """
+    arguments: argparse.Namespace = _parse_arguments(argv)
+
+    if arguments.count == 1 and arguments.length == DEFAULT_LENGTH and arguments.output == "-":
+        print(generate_cuid())  # noqa: T201 (print statement)
+        return
 
-def main() -> None:
-    """Print out a CUID generated string. Used by the CLI console script."""
-    print(generate_cuid())  # noqa: T201 (print statement)
+    try:
+        if arguments.output == "-":
+            sys.stdout.flush()
+            _write_cuids(sys.stdout.buffer, arguments.count, arguments.length, arguments.workers)
+            sys.stdout.buffer.flush()
+        else:
+            with open(arguments.output, "wb") as output:  # noqa: PTH123 (builtin open)
+                _write_cuids(output, arguments.count, arguments.length, arguments.workers)
+    except BrokenPipeError:
+        # The reader of the pipe exited early, for example `cuid2 -n 1000000 | head`. Python would otherwise report
+        # the error again while flushing standard output on exit.
+        devnull: int = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
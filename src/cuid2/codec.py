@@ -0,0 +1,314 @@
+"""Compact binary encodings of CUIDs, as integers, fixed-width bytes, or UUIDs.
+
+A CUID is a lowercase letter followed by base36 digits, so it is also a base36 numeral, and `int(cuid, 36)` packs it
+into an integer. The leading letter is a non-zero base36 digit, so the packed value of a CUID of `n` characters lies
+in `[10 * 36**(n - 1), 36**n)`. Those ranges do not overlap, which makes the length implicit: every CUID up to
+`MAXIMUM_LENGTH` characters decodes losslessly without a length tag, even from zero-padded fixed-width bytes.
+"""
+
+from __future__ import annotations
+
+import uuid
+from itertools import repeat
+from operator import itemgetter
+
+from cuid2.generator import DEFAULT_LENGTH, MAXIMUM_LENGTH
+from cuid2.utils import base36_encode
+from cuid2.validation import _are_cuids, is_cuid
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Final, Optional
+
+    import numpy as np
+    import numpy.typing as npt
+
+
+def byte_size(length: int) -> int:
+    """Returns the number of bytes needed to encode any CUID of up to `length` characters.
+
+    Parameters
+    ----------
+    length : int
+        The maximum length of the CUIDs to encode.
+
+    Returns
+    -------
+    int
+        The size of the fixed-width encoding, 16 bytes for the default length of 24 characters.
+
+    Raises
+    ------
+    ValueError
+        If the length parameter is less than 1, or greater than `MAXIMUM_LENGTH` (98 characters).
+    """
+    if not 1 <= length <= MAXIMUM_LENGTH:
+        msg = "Length must be between 1 and 98 characters."
+        raise ValueError(msg)
+
+    return -(-(36**length - 1).bit_length() // 8)
+
+
+DEFAULT_SIZE: Final = byte_size(DEFAULT_LENGTH)
+# The number of records from which `decode_many` uses NumPy, if it is installed.
+NUMPY_THRESHOLD: Final = 1024
+_BASE36_ALPHABET: Final = b"0123456789abcdefghijklmnopqrstuvwxyz"
+# The longest CUIDs that fit in a UUID, whose 128 bits hold any 24 character CUID.
+UUID_MAXIMUM_LENGTH: Final = 24
+
+
+def _max_length(size: int) -> int:
+    """Returns the length of the longest CUIDs that always fit in `size` bytes."""
+    length: int = 0
+    while length < MAXIMUM_LENGTH and 36 ** (length + 1) <= 256**size:
+        length += 1
+    return length
+
+
+def _not_a_cuid(value: object) -> ValueError:
+    return ValueError(f"Cannot encode a value that is not a CUID: {value!r}.")
+
+
+def encode_int(cuid: str) -> int:
+    """Encodes a CUID into a non-negative integer.
+
+    Parameters
+    ----------
+    cuid : str
+        The CUID to encode, a lowercase letter followed by up to 97 lowercase base36 digits.
+
+    Returns
+    -------
+    int
+        The CUID read as a base36 numeral, with less than 125 bits for the default length of 24 characters.
+
+    Raises
+    ------
+    ValueError
+        If the cuid parameter is not a CUID.
+    """
+    if not is_cuid(cuid, min_length=1):
+        raise _not_a_cuid(cuid)
+
+    return int(cuid, 36)
+
+
+def decode_int(number: int) -> str:
+    """Decodes an integer returned by `encode_int` into its CUID.
+
+    Parameters
+    ----------
+    number : int
+        The encoded CUID.
+
+    Returns
+    -------
+    str
+        The CUID.
+
+    Raises
+    ------
+    ValueError
+        If the number parameter is not an encoded CUID.
+    """
+    cuid: str = base36_encode(number) if 0 <= number < 36**MAXIMUM_LENGTH else ""
+    if not cuid[:1].isalpha():
+        msg = f"Cannot decode a value that is not an encoded CUID: {number}."
+        raise ValueError(msg)
+
+    return cuid
+
+
+def encode_bytes(cuid: str, size: int = DEFAULT_SIZE) -> bytes:
+    """Encodes a CUID into fixed-width, big-endian bytes.
+
+    Parameters
+    ----------
+    cuid : str
+        The CUID to encode.
+    size : int, default=DEFAULT_SIZE (16)
+        The number of bytes of the encoding. `byte_size(length)` bytes hold any CUID of up to `length` characters.
+
+    Returns
+    -------
+    bytes
+        The `size` bytes of the encoded CUID. Fixed-width encodings sort in the same order as the CUIDs of a given
+        length.
+
+    Raises
+    ------
+    ValueError
+        If the cuid parameter is not a CUID, or does not fit in `size` bytes.
+    """
+    number: int = encode_int(cuid)
+    try:
+        return number.to_bytes(size, byteorder="big")
+    except OverflowError as error:
+        msg = f"Cannot encode a CUID of {len(cuid)} characters in {size} bytes."
+        raise ValueError(msg) from error
+
+
+def decode_bytes(data: bytes) -> str:
+    """Decodes bytes returned by `encode_bytes` into their CUID.
+
+    Parameters
+    ----------
+    data : bytes
+        The encoded CUID, of any width.
+
+    Returns
+    -------
+    str
+        The CUID.
+
+    Raises
+    ------
+    ValueError
+        If the data parameter is not an encoded CUID.
+    """
+    return decode_int(int.from_bytes(data, byteorder="big"))
+
+
+def encode_uuid(cuid: str) -> uuid.UUID:
+    """Encodes a CUID of up to 24 characters into a UUID-shaped value, for databases with a native UUID type.
+
+    The version and variant bits of the UUID are not set, they hold part of the CUID.
+
+    Parameters
+    ----------
+    cuid : str
+        The CUID to encode.
+
+    Returns
+    -------
+    uuid.UUID
+        The 128 bits of the encoded CUID.
+
+    Raises
+    ------
+    ValueError
+        If the cuid parameter is not a CUID, or is longer than `UUID_MAXIMUM_LENGTH` (24 characters).
+    """
+    if len(cuid) > UUID_MAXIMUM_LENGTH:
+        msg = f"Cannot encode a CUID longer than {UUID_MAXIMUM_LENGTH} characters in a UUID."
+        raise ValueError(msg)
+
+    return uuid.UUID(int=encode_int(cuid))
+
+
+def decode_uuid(value: uuid.UUID) -> str:
+    """Decodes a UUID returned by `encode_uuid` into its CUID.
+
+    Parameters
+    ----------
+    value : uuid.UUID
+        The encoded CUID.
+
+    Returns
+    -------
+    str
+        The CUID.
+
+    Raises
+    ------
+    ValueError
+        If the value parameter is not an encoded CUID.
+    """
+    return decode_int(value.int)
+
+
+def encode_many(cuids: Iterable[str], size: int = DEFAULT_SIZE) -> bytes:
+    """Encodes CUIDs into a single buffer of fixed-width, big-endian records, for example to bulk load a column.
+
+    The CUIDs are validated and converted with a constant number of passes over the whole batch, so the per-CUID
+    cost is only that of the C conversions.
+
+    Parameters
+    ----------
+    cuids : Iterable[str]
+        The CUIDs to encode.
+    size : int, default=DEFAULT_SIZE (16)
+        The number of bytes of each record, see `encode_bytes`.
+
+    Returns
+    -------
+    bytes
+        The concatenated records, `size` bytes per CUID, in order.
+
+    Raises
+    ------
+    ValueError
+        If any of the values is not a CUID, or does not fit in `size` bytes.
+    """
+    values: list[str] = cuids if isinstance(cuids, list) else list(cuids)
+    if values and (set(map(type, values)) != {str} or not _are_cuids(values, 1, MAXIMUM_LENGTH)):
+        raise _not_a_cuid(next(value for value in values if not is_cuid(value, min_length=1)))
+
+    if values and max(map(len, values)) > _max_length(size):
+        # A longer CUID may still fit, if its leading digits are low enough.
+        return b"".join(encode_bytes(value, size) for value in values)
+
+    return b"".join(map(int.to_bytes, map(int, values, repeat(36)), repeat(size), repeat("big")))
+
+
+def decode_many(buffer: bytes | bytearray | memoryview, size: int = DEFAULT_SIZE) -> list[str]:
+    """Decodes a buffer returned by `encode_many` into its CUIDs.
+
+    Parameters
+    ----------
+    buffer : bytes | bytearray | memoryview
+        The concatenated records. Any object supporting the buffer protocol, such as a memory-mapped file, can be
+        wrapped in a memoryview and decoded without copying it. Large buffers are decoded with NumPy, if it is
+        installed.
+    size : int, default=DEFAULT_SIZE (16)
+        The number of bytes of each record.
+
+    Returns
+    -------
+    list[str]
+        The CUIDs, in order.
+
+    Raises
+    ------
+    ValueError
+        If the size of the buffer is not a multiple of `size`, or any of its records is not an encoded CUID.
+    """
+    view: memoryview = memoryview(buffer).cast("B")
+    if size < 1 or len(view) % size:
+        msg = f"Cannot decode a buffer of {len(view)} bytes into records of {size} bytes."
+        raise ValueError(msg)
+
+    cuids: Optional[list[str]] = _decode_many_with_numpy(view, size) if len(view) >= NUMPY_THRESHOLD * size else None
+    if cuids is None:
+        records = (view[offset : offset + size] for offset in range(0, len(view), size))
+        cuids = list(map(base36_encode, map(int.from_bytes, records, repeat("big"))))
+
+    letters: str = "".join(map(itemgetter(slice(1)), cuids))
+    if cuids and not (len(letters) == len(cuids) and letters.isalpha() and max(map(len, cuids)) <= MAXIMUM_LENGTH):
+        for offset in range(0, len(view), size):
+            decode_bytes(view[offset : offset + size])
+    return cuids
+
+
+def _decode_many_with_numpy(view: memoryview, size: int) -> Optional[list[str]]:
+    # The base36 digits of every record are extracted at once, with a long division vectorized across records, and
+    # the zero padding before the leading letter is stripped. Returns None if NumPy is not installed.
+    try:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+
+    from cuid2.vectorized import _leading_digits  # pylint: disable=import-outside-toplevel
+
+    count: int = len(view) // size
+    padding: int = -size % 4
+    records: npt.NDArray[np.uint8] = np.frombuffer(view, dtype=np.uint8).reshape(count, size)
+    if padding:
+        records = np.concatenate([np.zeros((count, padding), dtype=np.uint8), records], axis=1)
+
+    width: int = len(base36_encode(256**size - 1))
+    digits: npt.NDArray[np.uint8] = _leading_digits(np, records.tobytes(), count, size + padding, width)
+    text: str = np.frombuffer(_BASE36_ALPHABET, dtype=np.uint8)[digits].tobytes().decode("ascii")
+    return list(map(str.lstrip, (text[offset : offset + width] for offset in range(0, len(text), width)), repeat("0")))
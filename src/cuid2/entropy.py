@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import os
+import threading
+import weakref
+from random import SystemRandom
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Final
+
+DEFAULT_CHUNK_SIZE: Final = 4096
+
+_BASE36_ALPHABET: Final = b"0123456789abcdefghijklmnopqrstuvwxyz"
+_LETTER_ALPHABET: Final = b"abcdefghijklmnopqrstuvwxyz"
+
+# Bytes at or above the largest multiple of the alphabet size are rejected, so that every
+# remaining byte maps onto the alphabet without modulo bias.
+_BASE36_LIMIT: Final = 256 - 256 % len(_BASE36_ALPHABET)
+_LETTER_LIMIT: Final = 256 - 256 % len(_LETTER_ALPHABET)
+_BASE36_TABLE: Final = bytes(_BASE36_ALPHABET[byte % len(_BASE36_ALPHABET)] for byte in range(256))
+_LETTER_TABLE: Final = bytes(_LETTER_ALPHABET[byte % len(_LETTER_ALPHABET)] for byte in range(256))
+_BASE36_REJECTED: Final = bytes(range(_BASE36_LIMIT, 256))
+_LETTER_REJECTED: Final = bytes(range(_LETTER_LIMIT, 256))
+
+_RECIPROCAL_BPF: Final = 2**-53
+
+_POOLS: weakref.WeakSet[EntropyPool] = weakref.WeakSet()
+
+
+class EntropyPool(SystemRandom):
+    """A cryptographically secure random generator that reads from `os.urandom` in large chunks.
+
+    `secrets.SystemRandom` issues a `getrandom`/`urandom` system call for every value it returns. This pool reads
+    `chunk_size` bytes per system call and hands them out from memory instead. Base36 digits and lowercase letters are
+    produced by rejection sampling, so they are unbiased. The pool is safe to share between threads, and every pool is
+    emptied in the child process after `os.fork`, so a parent and its children never share buffered entropy.
+
+    The `bytes_read` attribute holds the number of bytes read from `os.urandom` by the pool in the current process.
+    """
+
+    def __init__(self: EntropyPool, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Initialization function for the EntropyPool class.
+
+        Parameters
+        ----------
+        chunk_size : int, default=DEFAULT_CHUNK_SIZE (4096)
+            The number of bytes read from `os.urandom` each time one of the buffers runs out.
+
+        Raises
+        ------
+        ValueError
+            If the chunk_size parameter is less than 1.
+        """
+        if chunk_size < 1:
+            msg = "Cannot create an entropy pool without a chunk size >= 1."
+            raise ValueError(msg)
+
+        super().__init__()
+        self._chunk_size: int = chunk_size
+        self._reset()
+        _POOLS.add(self)
+
+    def _reset(self: EntropyPool) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._bytes: bytes = b""
+        self._bytes_position: int = 0
+        self._digits: str = ""
+        self._digits_position: int = 0
+        self._letters: str = ""
+        self._letters_position: int = 0
+        self.bytes_read: int = 0
+
+    def _read(self: EntropyPool, count: int) -> bytes:
+        """Reads `count` bytes from the operating system. Called with the lock held, whenever a buffer runs out."""
+        self.bytes_read += count
+        return os.urandom(count)
+
+    def _take_bytes(self: EntropyPool, count: int) -> bytes:
+        if count < 0:
+            msg = "Cannot draw a negative number of bytes."
+            raise ValueError(msg)
+
+        with self._lock:
+            start: int = self._bytes_position
+            end: int = start + count
+            if end > len(self._bytes):
+                chunk: bytes = self._read(max(self._chunk_size, count))
+                self._bytes = self._bytes[start:] + chunk
+                start, end = 0, count
+
+            self._bytes_position = end
+            return self._bytes[start:end]
+
+    def random(self: EntropyPool) -> float:
+        """Get the next random number in the range 0.0 <= X < 1.0."""
+        return (int.from_bytes(self._take_bytes(7), byteorder="big") >> 3) * _RECIPROCAL_BPF
+
+    def getrandbits(self: EntropyPool, k: int) -> int:
+        """Generates an int with k random bits."""
+        if k < 0:
+            msg = "number of bits must be non-negative"
+            raise ValueError(msg)
+
+        byte_count: int = (k + 7) // 8
+        return int.from_bytes(self._take_bytes(byte_count), byteorder="big") >> (byte_count * 8 - k)
+
+    def randbytes(self: EntropyPool, n: int) -> bytes:
+        """Generate n random bytes. Raises a ValueError if n is negative."""
+        return self._take_bytes(n)
+
+    def base36_digits(self: EntropyPool, length: int) -> str:
+        """Returns a string of unbiased, random base36 digits.
+
+        Parameters
+        ----------
+        length : int
+            The number of digits to return.
+
+        Returns
+        -------
+        str
+            Random characters drawn uniformly from `0-9a-z`.
+
+        Raises
+        ------
+        ValueError
+            If the length parameter is negative.
+        """
+        if length < 0:
+            msg = "Cannot draw a negative number of digits."
+            raise ValueError(msg)
+
+        with self._lock:
+            start: int = self._digits_position
+            end: int = start + length
+            while end > len(self._digits):
+                chunk: bytes = self._read(max(self._chunk_size, length))
+                self._digits = self._digits[start:] + chunk.translate(_BASE36_TABLE, _BASE36_REJECTED).decode("ascii")
+                start, end = 0, length
+
+            self._digits_position = end
+            return self._digits[start:end]
+
+    def lowercase_letters(self: EntropyPool, length: int) -> str:
+        """Returns a string of unbiased, random lowercase letters.
+
+        Parameters
+        ----------
+        length : int
+            The number of letters to return.
+
+        Returns
+        -------
+        str
+            Random characters drawn uniformly from `a-z`.
+
+        Raises
+        ------
+        ValueError
+            If the length parameter is negative.
+        """
+        if length < 0:
+            msg = "Cannot draw a negative number of letters."
+            raise ValueError(msg)
+
+        with self._lock:
+            start: int = self._letters_position
+            end: int = start + length
+            while end > len(self._letters):
+                chunk: bytes = self._read(max(self._chunk_size, length))
+                self._letters = self._letters[start:] + chunk.translate(_LETTER_TABLE, _LETTER_REJECTED).decode("ascii")
+                start, end = 0, length
+
+            self._letters_position = end
+            return self._letters[start:end]
+
+
+def _reset_pools_in_child() -> None:
+    for pool in _POOLS:
+        pool._reset()  # noqa: SLF001 (private member accessed)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_in_child)
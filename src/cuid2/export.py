@@ -0,0 +1,202 @@
+"""Bulk export of CUIDs to files of fixed-width, newline-terminated records, for database bulk loads.
+
+Every record is a CUID of `length` characters followed by a newline, so the file can be loaded as is with
+`COPY ... FROM` or `LOAD DATA INFILE`, and the k-th CUID starts at byte `k * (length + 1)`. Records are minted
+straight into a memory map of the file, a chunk at a time, and an interrupted export resumes after its last complete
+record. The rare CUIDs shorter than `length` (see `Cuid.generate`) are generated again, since `generate_into` pads them
+with NUL bytes, which bulk loads reject in text columns.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+
+from cuid2.generator import DEFAULT_LENGTH, MAXIMUM_LENGTH, Cuid
+from cuid2.shared import CuidView
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Final, Optional
+
+    from cuid2.generator import ShardedCuid
+
+# The number of records minted into the memory map of the file at a time.
+CHUNK_SIZE: Final = 65_536
+TERMINATOR: Final = "\n"
+
+
+def _check_length(length: int) -> None:
+    if not 1 <= length <= MAXIMUM_LENGTH:
+        msg = "Length must be between 1 and 98 characters."
+        raise ValueError(msg)
+
+
+def _complete_records(file_descriptor: int, size: int, record_size: int, path: str) -> int:
+    """Returns the number of complete records at the start of an export file.
+
+    Records are written in order, and the file is extended a chunk at a time before the chunk is written, so an
+    interrupted export leaves complete records followed by unwritten, NUL-filled space. The last complete record is
+    the last newline at the end of a record.
+    """
+    if size % record_size:
+        msg = f"Cannot resume {path}, its size is not a multiple of the record size {record_size}."
+        raise ValueError(msg)
+
+    if not size:
+        return 0
+
+    with mmap.mmap(file_descriptor, size, access=mmap.ACCESS_READ) as file_map:
+        # Check the terminators a chunk at a time from the end, instead of every record. The terminators of the
+        # records that were not written are NUL bytes, any other byte means that the file holds other records.
+        end: int = size // record_size
+        while end:
+            start: int = max(end - CHUNK_SIZE, 0)
+            terminators: bytes = file_map[start * record_size + record_size - 1 : end * record_size : record_size]
+            last: int = terminators.rfind(TERMINATOR.encode())
+            if terminators[last + 1 :].strip(b"\0"):
+                msg = f"Cannot resume {path}, it does not hold records of {record_size} bytes."
+                raise ValueError(msg)
+            if last >= 0:
+                return start + last + 1
+            end = start
+    return 0
+
+
+def _replace_short_records(
+    file_map: mmap.mmap,
+    generator: Cuid | ShardedCuid,
+    start: int,
+    end: int,
+    length: int,
+) -> None:
+    """Generates the records between `start` and `end` that `generate_into` padded with NUL bytes again, until they
+    are `length` characters long.
+    """
+    record_size: int = length + len(TERMINATOR)
+    position: int = file_map.find(b"\0", start, end)
+    while position >= 0:
+        record_start: int = position - (position - start) % record_size
+        replacement: str = generator.generate(length)
+        while len(replacement) < length:
+            replacement = generator.generate(length)
+        file_map[record_start : record_start + length] = replacement.encode("ascii")
+        position = file_map.find(b"\0", record_start + record_size, end)
+
+
+def export(
+    path: str | os.PathLike[str],
+    count: int,
+    length: int = DEFAULT_LENGTH,
+    cuid: Optional[Cuid | ShardedCuid] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """Mints CUIDs into a file of fixed-width, newline-terminated records, until it holds `count` records.
+
+    The file is created if it does not exist. Otherwise, the export resumes after its last complete record, so
+    running an interrupted export again completes it, and running a complete export again does nothing. The file is
+    grown a chunk at a time, and every chunk is written through a memory map, without a write call or a string
+    object per CUID. Every record holds a CUID of exactly `length` characters: the rare shorter ones are generated
+    again.
+
+    Parameters
+    ----------
+    path : str | os.PathLike[str]
+        The file to export to.
+    count : int
+        The number of records the file holds once the export completes.
+    length : int, default=DEFAULT_LENGTH (24)
+        The length of the CUIDs. Every record is `length + 1` bytes, including its newline.
+    cuid : Cuid | ShardedCuid, optional
+        The generator of the CUIDs. If it is not provided, a new `Cuid` is created.
+    chunk_size : int, default=CHUNK_SIZE (65536)
+        The number of records minted and written at a time.
+
+    Returns
+    -------
+    int
+        The number of records in the file, at least `count`. An existing file with more records is left unchanged.
+
+    Raises
+    ------
+    ValueError
+        If the count parameter is negative, or the chunk_size parameter is less than 1.
+        If the length parameter is less than 1 or greater than `MAXIMUM_LENGTH` (98 characters).
+        If the file exists, but does not hold records of `length + 1` bytes.
+    """
+    _check_length(length)
+    if count < 0:
+        msg = "Cannot generate a negative number of CUIDs."
+        raise ValueError(msg)
+
+    if chunk_size < 1:
+        msg = "Cannot export CUIDs without a chunk size >= 1."
+        raise ValueError(msg)
+
+    generator: Cuid | ShardedCuid = cuid or Cuid()
+    record_size: int = length + len(TERMINATOR)
+    with open(path, "a+b") as file:  # noqa: PTH123 (builtin open)
+        file_descriptor: int = file.fileno()
+        written: int = _complete_records(file_descriptor, os.fstat(file_descriptor).st_size, record_size, str(path))
+        # Drop the space reserved for the records that an interrupted export did not write.
+        file.truncate(written * record_size)
+
+        for start in range(written, count, chunk_size):
+            records: int = min(chunk_size, count - start)
+            # Memory maps start at a multiple of the allocation granularity.
+            map_start: int = start * record_size // mmap.ALLOCATIONGRANULARITY * mmap.ALLOCATIONGRANULARITY
+            map_end: int = (start + records) * record_size
+            file.truncate(map_end)
+            with mmap.mmap(file_descriptor, map_end - map_start, offset=map_start) as file_map:
+                offset: int = start * record_size - map_start
+                generator.generate_into(file_map, records, length, offset, TERMINATOR)
+                _replace_short_records(file_map, generator, offset, map_end - map_start, length)
+        return max(written, count)
+
+
+class CuidFile(CuidView):
+    def __init__(self: CuidFile, path: str | os.PathLike[str], length: int = DEFAULT_LENGTH) -> None:
+        """Initialization function for the CuidFile class, a read-only sequence over the records of a file written
+        by `export`, which reads the k-th CUID in constant time through a memory map of the file.
+
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            The export file.
+        length : int, default=DEFAULT_LENGTH (24)
+            The length of the CUIDs of the file.
+
+        Raises
+        ------
+        ValueError
+            If the length parameter is less than 1 or greater than `MAXIMUM_LENGTH` (98 characters).
+            If the file does not hold complete records of `length + 1` bytes.
+        """
+        _check_length(length)
+        record_size: int = length + len(TERMINATOR)
+        with open(path, "rb") as file:  # noqa: PTH123 (builtin open)
+            size: int = os.fstat(file.fileno()).st_size
+            complete: int = _complete_records(file.fileno(), size, record_size, str(path))
+            if complete * record_size != size:
+                msg = f"Cannot read {path}, its export is incomplete."
+                raise ValueError(msg)
+            # Empty files cannot be mapped.
+            self._map: Optional[mmap.mmap] = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+        super().__init__(self._map if self._map is not None else b"", length, terminator=TERMINATOR)
+
+    def close(self: CuidFile) -> None:
+        """Releases the view of the file, and closes its memory map."""
+        self.release()
+        if self._map is not None:
+            self._map.close()
+
+    def __exit__(
+        self: CuidFile,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
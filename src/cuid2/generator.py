@@ -1,15 +1,32 @@
 from __future__ import annotations
 
+import functools
+import itertools
+import os
+import threading
 import time
+import weakref
 from math import floor
-from secrets import SystemRandom
-from typing import TYPE_CHECKING, Callable, Final, Optional, Protocol
 
-from cuid2 import utils
+from cuid2 import profiling, utils
+from cuid2.entropy import EntropyPool
+
+# `typing` and the modules it imports take about a third of the time of `import cuid2`, and every name used from
+# it is only needed by type checkers.
+TYPE_CHECKING = False
 
 if TYPE_CHECKING:
+    from mmap import mmap
+    from typing import Callable, Final, Iterator, Optional, Protocol, Sequence, Union
+
     from _random import Random
 
+    from cuid2.metrics import CuidStats, Metrics
+    from cuid2.utils import HashEngine
+
+    # Any object supporting the writable buffer protocol, such as `bytearray`, `memoryview` or `mmap`.
+    WritableBuffer = Union[bytearray, memoryview, mmap]
+
     class FingerprintCallable(Protocol):  # pylint: disable=too-few-public-methods
         def __call__(self: FingerprintCallable, random_generator: Random) -> str: ...
 
@@ -19,24 +36,39 @@ if TYPE_CHECKING:
 INITIAL_COUNT_MAX: Final[int] = 476782367
 DEFAULT_LENGTH: Final = 24
 MAXIMUM_LENGTH: Final = 98
+# The number of CUIDs that `stream` generates at a time.
+STREAM_CHUNK_SIZE: Final = 1024
+# The number of base36 digits of the millisecond timestamp that starts a sortable CUID, enough until the year 2059,
+# and the length under which a sortable CUID keeps too few hashed characters.
+SORTABLE_PREFIX_LENGTH: Final = 8
+SORTABLE_MINIMUM_LENGTH: Final = 16
+
+
+# Every live Cuid instance, so that their state can be derived again after `os.fork`.
+_LIVE_CUIDS: weakref.WeakSet[Cuid] = weakref.WeakSet()
 
 
 class Cuid:  # pylint: disable=too-few-public-methods
-    def __init__(
+    def __init__(  # noqa: PLR0913 (too many arguments) # pylint: disable=too-many-arguments
         self: Cuid,
-        random_generator: Callable[[], Random] = SystemRandom,
+        random_generator: Callable[[], Random] = EntropyPool,
         counter: Callable[[int], Callable[[], int]] = utils.create_counter,
         length: int = DEFAULT_LENGTH,
         fingerprint: FingerprintCallable = utils.create_fingerprint,
+        hash_engine: HashEngine = utils.sha3_512_digest,
+        *,
+        metrics: bool = False,
+        sortable: bool = False,
     ) -> None:
         """Initialization function for the Cuid class that generates a universally unique,
         base36 encoded string.
 
         Parameters
         ----------
-        random_generator : Callable[[], "Random"], default=SystemRandom
-            Used as the base random generator. The default value is `secrets.SystemRandom`, which is a
-            cryptographically secure random number generator provided by the Python standard library.
+        random_generator : Callable[[], "Random"], default=EntropyPool
+            Used as the base random generator. The default value is `entropy.EntropyPool`, a subclass of
+            `secrets.SystemRandom` that reads cryptographically secure bytes from the operating system in large chunks
+            instead of issuing a system call for every random value.
         counter : Callable[[int], Callable[[], int]], default=utils.create_counter
             The `counter` parameter is a callable that creates a counter returning an incremented value each time it
             is called. The `create_counter` function from the `utils` module is used by default.
@@ -46,20 +78,69 @@ class Cuid:  # pylint: disable=too-few-public-methods
             A length value greater than `MAXIMUM_LENGTH` (98 characters) will raise a ValueError.
         fingerprint : "FingerprintCallable", default=utils.create_fingerprint
             The "fingerprint" parameter is a callable function that generates a unique identifier.
+        hash_engine : "HashEngine", default=utils.sha3_512_digest
+            The hash function of the generated strings, and of the default fingerprint. See `utils.HASH_ENGINES` for
+            the built-in engines, and their security trade-offs. Only the default SHA3-512 engine generates the same
+            strings as the reference implementation for the same inputs.
+        metrics : bool, default=False
+            Whether to collect the metrics reported by `stats()`. Generators without metrics only check that they
+            are disabled once per call.
+        sortable : bool, default=False
+            Whether to start every string with its creation time, `SORTABLE_PREFIX_LENGTH` (8) base36 digits of
+            milliseconds since the epoch, instead of a random letter, so that strings sort roughly by creation time.
+            The rest of the string is the same hash as in a standard string, cut to fit the length. Sortable strings
+            reveal when they were created, and are only ordered up to the millisecond and to the clock skew between
+            hosts. See the README for their trade-offs.
+
+        Notes
+        -----
+        The counter and fingerprint are derived again in the child process whenever the process forks (for example,
+        under gunicorn, Celery or `multiprocessing` prefork workers). The default fingerprint includes the process ID,
+        so children never share a fingerprint, even when `random_generator` is a seeded `random.Random`. A custom
+        `fingerprint` callable should also include process-specific data to keep this guarantee.
 
         Raises
         ------
         ValueError
             If the length parameter is greater than `MAXIMUM_LENGTH` (98 characters).
+            If the generator is sortable, and the length parameter is less than `SORTABLE_MINIMUM_LENGTH` (16).
         """
         if length > MAXIMUM_LENGTH:
             msg = "Length must never exceed 98 characters."
             raise ValueError(msg)
 
+        if sortable:
+            check_sortable_length(length)
+
+        if fingerprint is utils.create_fingerprint and hash_engine is not utils.sha3_512_digest:
+            fingerprint = functools.partial(utils.create_fingerprint, hash_engine=hash_engine)
+
         self._random: Random = random_generator()
-        self._counter: Callable[[], int] = counter(floor(self._random.random() * INITIAL_COUNT_MAX))
+        self._create_counter: Callable[[int], Callable[[], int]] = counter
+        self._create_fingerprint: FingerprintCallable = fingerprint
+        self._hash_engine: HashEngine = hash_engine
         self._length: int = length
-        self._fingerprint: str = fingerprint(random_generator=self._random)
+        self._sortable: bool = sortable
+        # The time and the counter change slowly, so their high digits are only encoded again when they change.
+        self._encode_time: Callable[[int], str] = utils.create_base36_encoder()
+        self._encode_count: Callable[[int], str] = utils.create_base36_encoder()
+        self._metrics: Optional[Metrics] = None
+        if metrics:
+            from cuid2.metrics import Metrics  # pylint: disable=import-outside-toplevel
+
+            self._metrics = Metrics()
+        self._reseed()
+        _LIVE_CUIDS.add(self)
+
+    def _reseed(self: Cuid, counter_offset: int = 0) -> None:
+        """Derives a new counter and fingerprint. Called on initialization, and in the child process after `os.fork`
+        so that a parent and its children never share a counter start or fingerprint.
+        """
+        initial_count: int = (floor(self._random.random() * INITIAL_COUNT_MAX) + counter_offset) % INITIAL_COUNT_MAX
+        self._counter: Callable[[], int] = self._create_counter(initial_count)
+        if self._metrics is not None:
+            self._metrics.reset_counter(initial_count)
+        self._fingerprint: str = self._create_fingerprint(random_generator=self._random)
 
     def generate(self: Cuid, length: Optional[int] = None) -> str:
         """Generates a universally unique, base36 encoded string with a specified length.
@@ -81,22 +162,538 @@ class Cuid:  # pylint: disable=too-few-public-methods
         Raises
         ------
         ValueError
-            If the length parameter is greater than `MAXIMUM_LENGTH` (98 characters).
+            If the length parameter is less than 1, or greater than `MAXIMUM_LENGTH` (98 characters).
+            If the generator is sortable, and the length parameter is less than `SORTABLE_MINIMUM_LENGTH` (16).
         """
+        start: float = time.perf_counter() if self._metrics is not None else 0.0
         length = length or self._length
-        if length > MAXIMUM_LENGTH:
-            msg = "Length must never exceed 98 characters."
-            raise ValueError(msg)
+        check_length(length)
+
+        if self._sortable:
+            check_sortable_length(length)
 
+        # Look the profile up once, and only time the stages while one is active: this is the hot path.
+        active: Optional[profiling.Profile] = profiling.current.get()
+        stopwatch: Optional[profiling.Stopwatch] = None if active is None else profiling.Stopwatch(active, "generate")
         first_letter: str = utils.create_letter(random_generator=self._random)
+        if stopwatch is not None:
+            stopwatch.lap("create_letter")
 
-        base36_time: str = utils.base36_encode(time.time_ns())
-        base36_count: str = utils.base36_encode(self._counter())
+        time_ns: int = time.time_ns()
+        base36_time: str = self._encode_time(time_ns)
+        if stopwatch is not None:
+            stopwatch.lap("base36_encode(time_ns)")
+        base36_count: str = self._encode_count(self._counter())
+        if stopwatch is not None:
+            stopwatch.lap("counter")
 
         salt: str = utils.create_entropy(length=length, random_generator=self._random)
+        if stopwatch is not None:
+            stopwatch.lap("create_entropy")
         hash_input: str = base36_time + salt + base36_count + self._fingerprint
 
-        return first_letter + utils.create_hash(hash_input)[1 : length or self._length]
+        hashed: str = utils.create_hash(hash_input, self._hash_engine, length, truncate=True)
+        if stopwatch is not None:
+            stopwatch.lap("create_hash")
+        cuid: str
+        if self._sortable:
+            prefix: str = sortable_prefix(time_ns)
+            cuid = prefix + hashed[1 : length - len(prefix) + 1]
+        else:
+            cuid = first_letter + hashed[1:length]
+        if stopwatch is not None:
+            stopwatch.stop()
+        if self._metrics is not None:
+            self._metrics.record(1, start)
+        return cuid
+
+    def generate_many(self: Cuid, count: int, length: Optional[int] = None) -> list[str]:
+        """Generates a batch of universally unique, base36 encoded strings with a specified length.
+
+        The output of each string is format-compatible with `generate()`. The per-call overhead is amortized across
+        the batch: the length is validated once, the fingerprint is encoded once, and the random letters and salts
+        are drawn in bulk. With an `EntropyPool`, every letter and salt in the batch is drawn in two calls; with any
+        other random generator, the letter and salt of each string are drawn in a single call.
+
+        Parameters
+        ----------
+        count : int
+            The number of strings to generate.
+        length : int, optional
+            The length parameter is an optional integer value that specifies the length of the generated strings.
+            If it is not provided, the default length value provided during class initialization is used.
+            A length value greater than `MAXIMUM_LENGTH` (98 characters) will raise a ValueError.
+
+        Returns
+        -------
+        list[str]
+            A list of `count` strings, each generated as described in `generate()`.
+
+        Raises
+        ------
+        ValueError
+            If the length parameter is less than 1, or greater than `MAXIMUM_LENGTH` (98 characters).
+            If the generator is sortable, and the length parameter is less than `SORTABLE_MINIMUM_LENGTH` (16).
+            If the count parameter is negative.
+        """
+        length = length or self._length
+        check_length(length)
+
+        if self._sortable:
+            check_sortable_length(length)
+
+        if count < 0:
+            msg = "Cannot generate a negative number of CUIDs."
+            raise ValueError(msg)
+
+        start: float = time.perf_counter() if self._metrics is not None else 0.0
+        stopwatch: profiling.Stopwatch = profiling.stopwatch("generate_many")
+        letters, salts = self._draw_letters_and_salts(count, length)
+        stopwatch.lap("draw_letters_and_salts")
+
+        # Hoist every attribute and global lookup out of the loop.
+        counter: Callable[[], int] = self._counter
+        time_ns: Callable[[], int] = time.time_ns
+        encode_time: Callable[[int], str] = self._encode_time
+        encode_count: Callable[[int], str] = self._encode_count
+        hash_engine: HashEngine = self._hash_engine
+        fingerprint: bytes = self._fingerprint.encode()
+
+        cuids: list[str] = []
+        append = cuids.append
+        if self._sortable:
+            self._hash_sortable(append, salts, length)
+        else:
+            for letter, salt in zip(letters, salts):
+                hash_input: str = encode_time(time_ns()) + salt + encode_count(counter())
+
+                hashed_int: int = int.from_bytes(
+                    hash_engine(hash_input.encode() + fingerprint, length),
+                    byteorder="big",
+                )
+                append(letter + _hash_prefix(hashed_int, length))
+        stopwatch.lap("hash_loop")
+
+        stopwatch.stop()
+        if self._metrics is not None:
+            self._metrics.record(count, start)
+        return cuids
+
+    def _hash_sortable(self: Cuid, append: Callable[[str], None], salts: list[str], length: int) -> None:
+        """The loop of `generate_many` for a sortable generator, which encodes the prefix once per millisecond."""
+        counter: Callable[[], int] = self._counter
+        time_ns: Callable[[], int] = time.time_ns
+        encode_time: Callable[[int], str] = self._encode_time
+        encode_count: Callable[[int], str] = self._encode_count
+        hash_engine: HashEngine = self._hash_engine
+        fingerprint: bytes = self._fingerprint.encode()
+
+        prefix_milliseconds: int = -1
+        prefix: str = ""
+        body_length: int = 0
+        for salt in salts:
+            now: int = time_ns()
+            if now // 1_000_000 != prefix_milliseconds:
+                prefix_milliseconds = now // 1_000_000
+                prefix = sortable_prefix(now)
+                body_length = length - len(prefix) + 1
+            hash_input: str = encode_time(now) + salt + encode_count(counter())
+
+            hashed_int: int = int.from_bytes(hash_engine(hash_input.encode() + fingerprint, length), byteorder="big")
+            append(prefix + _hash_prefix(hashed_int, body_length))
+
+    def stats(self: Cuid) -> CuidStats:
+        """Returns a snapshot of the metrics of the generator, in the current process.
+
+        Returns
+        -------
+        CuidStats
+            The number of strings generated, the entropy read from the operating system, the start and advance of
+            the counter, the recent rate of generation, and the time spent generating. See `metrics.CuidStats`.
+
+        Raises
+        ------
+        RuntimeError
+            If the generator was created without `metrics=True`.
+        """
+        if self._metrics is None:
+            msg = "Cannot report the stats of a Cuid created without metrics=True."
+            raise RuntimeError(msg)
+
+        entropy_bytes: Optional[int] = self._random.bytes_read if isinstance(self._random, EntropyPool) else None
+        return self._metrics.snapshot(entropy_bytes)
+
+    def stream(self: Cuid, length: Optional[int] = None, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+        """Returns an endless iterator of universally unique, base36 encoded strings with a specified length.
+
+        The strings are generated `chunk_size` at a time with `generate_many`, and handed out by C-level iterators, so
+        that `for cuid in stream` and `itertools.islice(stream, count)` run at the throughput of `generate_many`
+        without a Python-level call per string. At most one chunk is held in memory.
+
+        Parameters
+        ----------
+        length : int, optional
+            The length of the generated strings. See `generate`.
+        chunk_size : int, default=STREAM_CHUNK_SIZE (1024)
+            The number of strings generated at a time. Larger chunks amortize more of the per-call overhead, smaller
+            chunks lower the latency of the first string and the strings lost when the iterator is dropped.
+
+        Returns
+        -------
+        Iterator[str]
+            An infinite iterator of strings, each generated as described in `generate()`.
+
+        Raises
+        ------
+        ValueError
+            If the length parameter is less than 1, or greater than `MAXIMUM_LENGTH` (98 characters).
+            If the chunk_size parameter is less than 1.
+        """
+        return _stream(self.generate_many, length or self._length, chunk_size)
+
+    def generate_into(  # noqa: PLR0913 (too many arguments) # pylint: disable=too-many-arguments
+        self: Cuid,
+        buffer: WritableBuffer,
+        count: Optional[int] = None,
+        length: Optional[int] = None,
+        offset: int = 0,
+        terminator: str = "",
+    ) -> int:
+        """Generates universally unique, base36 encoded strings directly into a writable buffer, as fixed-width ASCII
+        records of `length` bytes, each followed by an optional terminator.
+
+        The buffer can be the `buf` of a `multiprocessing.shared_memory.SharedMemory` block, a `bytearray`, an
+        `mmap`, or any other object supporting the writable buffer protocol, and is read back without copying with
+        `cuid2.shared.CuidView`. The strings are generated `STREAM_CHUNK_SIZE` at a time, so no string object
+        outlives its chunk. The rare string shorter than `length` (see `generate`) is padded with NUL bytes.
+
+        Parameters
+        ----------
+        buffer : WritableBuffer
+            The buffer to write into.
+        count : int, optional
+            The number of strings to write. If it is not provided, the buffer is filled from `offset` with as many
+            whole records as fit.
+        length : int, optional
+            The length of the generated strings, and the size of every record without its terminator. See `generate`.
+        offset : int, default=0
+            The position in bytes of the first record in the buffer.
+        terminator : str, default=""
+            The ASCII characters written after every string, such as "\\n" for a file with one string per line.
+
+        Returns
+        -------
+        int
+            The number of strings written, the records of which end at `offset + count * (length + len(terminator))`.
+
+        Raises
+        ------
+        TypeError
+            If the buffer is read-only.
+        ValueError
+            If the length parameter is less than 1, or greater than `MAXIMUM_LENGTH` (98 characters).
+            If the count parameter is negative, or the records do not fit in the buffer after `offset`.
+        """
+        return _generate_into(self.generate_many, buffer, count, length or self._length, offset, terminator)
+
+    def _draw_letters_and_salts(self: Cuid, count: int, length: int) -> tuple[Sequence[str], list[str]]:
+        """Draws the random first letter and salt of `count` strings, in bulk where the random generator allows it."""
+        if isinstance(self._random, EntropyPool):
+            digits: str = self._random.base36_digits(length * count) if count else ""
+            letters: Sequence[str] = self._random.lowercase_letters(count) if count else ""
+            return letters, [digits[start : start + length] for start in range(0, length * count, length)]
+
+        # Otherwise, a single draw per string yields both the letter and every salt character.
+        alphabet: str = utils.LOWERCASE_ALPHABET
+        salt_space: int = 36**length
+        random_below: Callable[[int], int] = self._random.randrange
+        base36_encode: Callable[[int], str] = utils.base36_encode
+
+        letter_list: list[str] = []
+        salts: list[str] = []
+        for _ in range(count):
+            letter_index, salt_value = divmod(random_below(len(alphabet) * salt_space), salt_space)
+            letter_list.append(alphabet[letter_index])
+            salts.append(base36_encode(salt_value).rjust(length, "0"))
+        return letter_list, salts
+
+
+class ShardedCuid:
+    def __init__(  # noqa: PLR0913 (too many arguments) # pylint: disable=too-many-arguments
+        self: ShardedCuid,
+        random_generator: Callable[[], Random] = EntropyPool,
+        counter: Callable[[int], Callable[[], int]] = utils.create_counter,
+        length: int = DEFAULT_LENGTH,
+        fingerprint: FingerprintCallable = utils.create_fingerprint,
+        hash_engine: HashEngine = utils.sha3_512_digest,
+        *,
+        metrics: bool = False,
+        sortable: bool = False,
+    ) -> None:
+        """Initialization function for the ShardedCuid class, a `Cuid`-compatible generator that is safe to share
+        between threads, including on free-threaded Python builds.
+
+        Every thread that uses the generator lazily receives its own `Cuid` shard, with its own random generator,
+        fingerprint and counter. Threads only take a lock once, to receive the index of their shard, and otherwise never
+        contend on a lock or share mutable state, so throughput can grow with the number of threads. Each shard's
+        counter is offset by its index times `INITIAL_COUNT_MAX`, so the initial counter ranges of the shards never
+        overlap.
+
+        Parameters
+        ----------
+        random_generator : Callable[[], "Random"], default=EntropyPool
+            Used as the base random generator of every shard. See `Cuid`.
+        counter : Callable[[int], Callable[[], int]], default=utils.create_counter
+            Creates the counter of every shard. See `Cuid`.
+        length : int, default=DEFAULT_LENGTH (24)
+            The default length of the generated strings. See `Cuid`.
+        fingerprint : "FingerprintCallable", default=utils.create_fingerprint
+            Creates the fingerprint of every shard. See `Cuid`.
+        hash_engine : "HashEngine", default=utils.sha3_512_digest
+            The hash function of every shard. See `Cuid`.
+        metrics : bool, default=False
+            Whether every shard collects metrics, which `stats()` reports summed over the shards. See `Cuid`.
+        sortable : bool, default=False
+            Whether every string starts with its creation time. See `Cuid`.
+
+        Raises
+        ------
+        ValueError
+            If the length parameter is greater than `MAXIMUM_LENGTH` (98 characters).
+            If the generator is sortable, and the length parameter is less than `SORTABLE_MINIMUM_LENGTH` (16).
+        """
+        if length > MAXIMUM_LENGTH:
+            msg = "Length must never exceed 98 characters."
+            raise ValueError(msg)
+
+        if sortable:
+            check_sortable_length(length)
+
+        self._random_generator: Callable[[], Random] = random_generator
+        self._counter: Callable[[int], Callable[[], int]] = counter
+        self._length: int = length
+        self._fingerprint: FingerprintCallable = fingerprint
+        self._hash_engine: HashEngine = hash_engine
+        self._metrics: bool = metrics
+        self._sortable: bool = sortable
+        # The shards with metrics, kept after their thread exits so that `stats()` still counts their strings.
+        self._shards: list[Cuid] = []
+        self._shard_count: int = 0
+        self._shard_lock: threading.Lock = threading.Lock()
+        self._local: threading.local = threading.local()
+
+    def _shard(self: ShardedCuid) -> Cuid:
+        try:
+            return self._local.cuid
+        except AttributeError:
+            # Incrementing a shared counter is not atomic on free-threaded builds, and two shards with the same index
+            # would share their counter offset.
+            with self._shard_lock:
+                shard_index: int = self._shard_count
+                self._shard_count += 1
+
+            def counter(count: int) -> Callable[[], int]:
+                return self._counter(count + shard_index * INITIAL_COUNT_MAX)
+
+            shard: Cuid = Cuid(
+                random_generator=self._random_generator,
+                counter=counter,
+                length=self._length,
+                fingerprint=self._fingerprint,
+                hash_engine=self._hash_engine,
+                metrics=self._metrics,
+                sortable=self._sortable,
+            )
+            if self._metrics:
+                with self._shard_lock:
+                    self._shards.append(shard)
+            self._local.cuid = shard
+            return shard
+
+    def generate(self: ShardedCuid, length: Optional[int] = None) -> str:
+        """Generates a universally unique, base36 encoded string with the shard of the calling thread.
+        See `Cuid.generate`.
+        """
+        return self._shard().generate(length)
+
+    def generate_many(self: ShardedCuid, count: int, length: Optional[int] = None) -> list[str]:
+        """Generates a batch of universally unique, base36 encoded strings with the shard of the calling thread.
+        See `Cuid.generate_many`.
+        """
+        return self._shard().generate_many(count, length)
+
+    def stats(self: ShardedCuid) -> CuidStats:
+        """Returns a snapshot of the metrics of every shard, summed, in the current process.
+
+        Returns
+        -------
+        CuidStats
+            The metrics of the shards, combined by `metrics.combine_stats`: the sums of the strings generated, the
+            entropy read, the counter advances, the rates and the times, and the lowest counter start. The shards
+            keep generating while they are read, so the sums are not an atomic snapshot.
+
+        Raises
+        ------
+        RuntimeError
+            If the generator was created without `metrics=True`.
+        """
+        if not self._metrics:
+            msg = "Cannot report the stats of a ShardedCuid created without metrics=True."
+            raise RuntimeError(msg)
+
+        from cuid2.metrics import combine_stats  # pylint: disable=import-outside-toplevel
+
+        with self._shard_lock:
+            shards: list[Cuid] = list(self._shards)
+        return combine_stats([shard.stats() for shard in shards])
+
+    def stream(self: ShardedCuid, length: Optional[int] = None, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+        """Returns an endless iterator of universally unique, base36 encoded strings, each chunk of which is generated
+        with the shard of the thread that consumes it. See `Cuid.stream`.
+        """
+        return _stream(self.generate_many, length or self._length, chunk_size)
+
+    def generate_into(  # noqa: PLR0913 (too many arguments) # pylint: disable=too-many-arguments
+        self: ShardedCuid,
+        buffer: WritableBuffer,
+        count: Optional[int] = None,
+        length: Optional[int] = None,
+        offset: int = 0,
+        terminator: str = "",
+    ) -> int:
+        """Generates universally unique, base36 encoded strings directly into a writable buffer with the shard of the
+        calling thread. See `Cuid.generate_into`.
+        """
+        return _generate_into(self.generate_many, buffer, count, length or self._length, offset, terminator)
+
+
+def _stream(generate_many: Callable[[int, int], list[str]], length: int, chunk_size: int) -> Iterator[str]:
+    """Chains endless calls of `generate_many(chunk_size, length)`, after checking the arguments eagerly."""
+    check_length(length)
+
+    if chunk_size < 1:
+        msg = "Cannot stream CUIDs without a chunk size >= 1."
+        raise ValueError(msg)
+
+    return itertools.chain.from_iterable(map(generate_many, itertools.repeat(chunk_size), itertools.repeat(length)))
+
+
+def _generate_into(  # noqa: PLR0913 (too many arguments) # pylint: disable=too-many-arguments
+    generate_many: Callable[[int, int], list[str]],
+    buffer: WritableBuffer,
+    count: Optional[int],
+    length: int,
+    offset: int,
+    terminator: str,
+) -> int:
+    """Writes `count` strings of `generate_many` into `buffer` from `offset`, see `Cuid.generate_into`."""
+    check_length(length)
+
+    view: memoryview = memoryview(buffer).cast("B")
+    if view.readonly:
+        msg = "Cannot generate CUIDs into a read-only buffer."
+        raise TypeError(msg)
+
+    record_size: int = length + len(terminator)
+    available: int = (len(view) - offset) // record_size if 0 <= offset <= len(view) else -1
+    if count is None:
+        count = max(available, 0)
+    if count < 0:
+        msg = "Cannot generate a negative number of CUIDs."
+        raise ValueError(msg)
+    if count > available:
+        msg = f"Cannot write {count} CUIDs of {length} characters at offset {offset} of a buffer of {len(view)} bytes."
+        raise ValueError(msg)
+
+    position: int = offset
+    for start in range(0, count, STREAM_CHUNK_SIZE):
+        cuids: list[str] = generate_many(min(STREAM_CHUNK_SIZE, count - start), length)
+        records: bytes = (terminator.join(cuids) + terminator).encode("ascii")
+        if len(records) != len(cuids) * record_size:
+            records = "".join(cuid.ljust(length, "\0") + terminator for cuid in cuids).encode("ascii")
+        view[position : position + len(records)] = records
+        position += len(records)
+    return count
+
+
+def check_length(length: int) -> None:
+    """Checks the length of the strings of a `Cuid`, or of a generator that mimics one.
+
+    Parameters
+    ----------
+    length : int
+        The number of characters of the strings.
+
+    Raises
+    ------
+    ValueError
+        If the length is greater than `MAXIMUM_LENGTH` (98 characters), or less than 1.
+    """
+    if length > MAXIMUM_LENGTH:
+        msg = "Length must never exceed 98 characters."
+        raise ValueError(msg)
+
+    if length < 1:
+        msg = "Cannot create entropy without a length >= 1."
+        raise ValueError(msg)
+
+
+def check_sortable_length(length: int) -> None:
+    """Checks that sortable strings of a length have room for their prefix and for some randomness after it.
+
+    Parameters
+    ----------
+    length : int
+        The number of characters of the strings.
+
+    Raises
+    ------
+    ValueError
+        If the length is less than `SORTABLE_MINIMUM_LENGTH` (16).
+    """
+    if length < SORTABLE_MINIMUM_LENGTH:
+        msg = "Sortable CUIDs must be at least 16 characters long."
+        raise ValueError(msg)
+
+
+def sortable_prefix(time_ns: int) -> str:
+    """Encodes the millisecond timestamp that starts a sortable CUID.
+
+    Parameters
+    ----------
+    time_ns : int
+        The creation time of the CUID, in nanoseconds since the epoch.
+
+    Returns
+    -------
+    str
+        The base36 milliseconds since the epoch, padded to `SORTABLE_PREFIX_LENGTH` digits so that prefixes sort as
+        their timestamps. It starts with a letter from 1994 until it grows a digit in 2059.
+    """
+    return utils.base36_encode(time_ns // 1_000_000).rjust(SORTABLE_PREFIX_LENGTH, "0")
+
+
+def _hash_prefix(hashed_int: int, length: int) -> str:
+    """Returns the same characters as `utils.create_hash(...)[1:length]`, but only encodes the leading base36
+    digits of the hash that are kept, instead of all ~99 digits.
+    """
+    # `create_hash` drops the first digit, and `generate` drops the next one.
+    return utils.base36_encode_prefix(hashed_int, length + 1)[2:]
+
+
+def _reseed_cuids_in_child() -> None:
+    # Offsetting by the process ID keeps the counters of concurrently running children apart, even when a seeded
+    # random generator makes every child draw the same value.
+    process_id: int = os.getpid()
+    for cuid in _LIVE_CUIDS:
+        if cuid._metrics is not None:  # noqa: SLF001 (private member accessed)
+            # The metrics of a child only count the strings it generates.
+            cuid._metrics = type(cuid._metrics)()  # noqa: SLF001 (private member accessed)
+        cuid._reseed(counter_offset=process_id)  # noqa: SLF001 (private member accessed)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_cuids_in_child)
 
 
 def cuid_wrapper() -> Callable[[], str]:
@@ -113,3 +710,19 @@ def cuid_wrapper() -> Callable[[], str]:
         return cuid_generator.generate()
 
     return cuid
+
+
+def cuid_many_wrapper() -> Callable[[int], list[str]]:
+    """Wrap a single Cuid class instance and return a callable that generates a batch of CUID strings.
+
+    Returns
+    -------
+    Callable[[int], list[str]]
+        A callable that takes a count and generates that many CUID strings.
+    """
+    cuid_generator: Cuid = Cuid()
+
+    def cuid_many(count: int) -> list[str]:
+        return cuid_generator.generate_many(count)
+
+    return cuid_many
@@ -0,0 +1,172 @@
+"""Opt-in runtime metrics of `Cuid` generators, and their export in the Prometheus text format.
+
+Metrics are only collected by generators created with `Cuid(metrics=True)`, which load this module. Other generators
+only pay for a check of a single attribute per call.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import NamedTuple
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from typing import Final, Optional, Union
+
+    from cuid2.generator import Cuid, ShardedCuid
+
+# The period over which `CuidStats.ids_per_second` is measured, and the interval between the samples it is measured
+# from, in seconds.
+RATE_WINDOW: Final = 60.0
+SAMPLE_INTERVAL: Final = 1.0
+
+
+class CuidStats(NamedTuple):
+    """A snapshot of the metrics of a `Cuid` generator, in the current process.
+
+    Attributes
+    ----------
+    ids_generated : int
+        The number of CUIDs generated.
+    entropy_bytes : int, optional
+        The number of bytes read from the operating system by the `EntropyPool` of the generator, including those
+        buffered but not used yet. None if the random generator is not an `EntropyPool`.
+    counter_start : int
+        The initial value of the counter, which is derived again after `os.fork`.
+    counter_advance : int
+        The number of counter values used since the counter was created.
+    ids_per_second : float
+        The rate of generation over the last `RATE_WINDOW` seconds, or since the first CUID was generated.
+    generation_seconds : float
+        The time spent generating CUIDs, in seconds.
+    """
+
+    ids_generated: int
+    entropy_bytes: Optional[int]
+    counter_start: int
+    counter_advance: int
+    ids_per_second: float
+    generation_seconds: float
+
+
+class Metrics:
+    """The mutable metrics of a single `Cuid` generator, updated after every call that generates CUIDs."""
+
+    __slots__ = ("counter_advance", "counter_start", "generation_seconds", "ids_generated", "samples")
+
+    def __init__(self: Metrics) -> None:
+        self.ids_generated: int = 0
+        self.generation_seconds: float = 0.0
+        self.counter_start: int = 0
+        self.counter_advance: int = 0
+        # Samples of `(time, ids_generated)`, at most one per `SAMPLE_INTERVAL`.
+        self.samples: deque[tuple[float, int]] = deque(maxlen=int(RATE_WINDOW / SAMPLE_INTERVAL) + 1)
+
+    def reset_counter(self: Metrics, counter_start: int) -> None:
+        """Records the initial value of a new counter."""
+        self.counter_start = counter_start
+        self.counter_advance = 0
+
+    def record(self: Metrics, count: int, start: float) -> None:
+        """Records `count` CUIDs generated since `start`, a value of `time.perf_counter`."""
+        now: float = time.perf_counter()
+        if not self.samples:
+            self.samples.append((start, self.ids_generated))
+        self.ids_generated += count
+        self.counter_advance += count
+        self.generation_seconds += now - start
+        if now - self.samples[-1][0] >= SAMPLE_INTERVAL:
+            self.samples.append((now, self.ids_generated))
+
+    def snapshot(self: Metrics, entropy_bytes: Optional[int]) -> CuidStats:
+        """Returns the current values of the metrics."""
+        now: float = time.perf_counter()
+        ids_per_second: float = 0.0
+        # The rate is measured from the oldest sample in the window, none of which is left after a long pause.
+        recent: list[tuple[float, int]] = [sample for sample in self.samples if sample[0] >= now - RATE_WINDOW]
+        if recent:
+            first_time, first_ids = recent[0]
+            ids_per_second = (self.ids_generated - first_ids) / max(now - first_time, 1e-9)
+
+        return CuidStats(
+            ids_generated=self.ids_generated,
+            entropy_bytes=entropy_bytes,
+            counter_start=self.counter_start,
+            counter_advance=self.counter_advance,
+            ids_per_second=ids_per_second,
+            generation_seconds=self.generation_seconds,
+        )
+
+
+def combine_stats(snapshots: Sequence[CuidStats]) -> CuidStats:
+    """Combines the snapshots of several generators, such as the shards of a `ShardedCuid`, into a single one.
+
+    Parameters
+    ----------
+    snapshots : Sequence[CuidStats]
+        The snapshots to combine, which may be empty.
+
+    Returns
+    -------
+    CuidStats
+        The sums of the counts, rates and times of the snapshots. The entropy is None if any of the snapshots leaves it
+        out, and the counter start is the lowest of the snapshots, or 0 if there are none.
+    """
+    entropy_bytes: list[int] = [snapshot.entropy_bytes for snapshot in snapshots if snapshot.entropy_bytes is not None]
+    return CuidStats(
+        ids_generated=sum(snapshot.ids_generated for snapshot in snapshots),
+        entropy_bytes=sum(entropy_bytes) if len(entropy_bytes) == len(snapshots) else None,
+        counter_start=min((snapshot.counter_start for snapshot in snapshots), default=0),
+        counter_advance=sum(snapshot.counter_advance for snapshot in snapshots),
+        ids_per_second=sum(snapshot.ids_per_second for snapshot in snapshots),
+        generation_seconds=sum(snapshot.generation_seconds for snapshot in snapshots),
+    )
+
+
+# The name, type and description of every exported metric, and the `CuidStats` field it is read from.
+_PROMETHEUS_METRICS: Final = (
+    ("cuid2_ids_generated_total", "counter", "CUIDs generated.", "ids_generated"),
+    ("cuid2_entropy_bytes_total", "counter", "Bytes read from the operating system for entropy.", "entropy_bytes"),
+    ("cuid2_counter_advance", "gauge", "Counter values used since the counter was created.", "counter_advance"),
+    ("cuid2_ids_per_second", "gauge", "Rate of generation over the last minute.", "ids_per_second"),
+    ("cuid2_generation_seconds_total", "counter", "Time spent generating CUIDs.", "generation_seconds"),
+)
+
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text(generators: Mapping[str, Union[Cuid, ShardedCuid]]) -> str:
+    """Exports the metrics of generators in the Prometheus text exposition format, for a `/metrics` endpoint.
+
+    Parameters
+    ----------
+    generators : Mapping[str, Cuid | ShardedCuid]
+        The generators to export, created with `metrics=True`, by the value of their `generator` label. A
+        `ShardedCuid` is exported as the sum of its shards.
+
+    Returns
+    -------
+    str
+        The metrics, one sample per generator and metric. Metrics that a generator does not report, such as the
+        entropy of a random generator that is not an `EntropyPool`, are left out.
+
+    Raises
+    ------
+    RuntimeError
+        If any of the generators was created without `metrics=True`.
+    """
+    stats: dict[str, CuidStats] = {name: generator.stats() for name, generator in generators.items()}
+    lines: list[str] = []
+    for metric, metric_type, description, field in _PROMETHEUS_METRICS:
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {metric_type}")
+        for name, snapshot in stats.items():
+            value: Optional[float] = getattr(snapshot, field)
+            if value is not None:
+                lines.append(f'{metric}{{generator="{_label_value(name)}"}} {value}')
+    return "\n".join(lines) + "\n"
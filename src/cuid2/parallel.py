@@ -0,0 +1,189 @@
+"""Parallel generation of large batches of CUIDs, across a pool of worker processes."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import chain
+
+from cuid2 import utils
+from cuid2.generator import DEFAULT_LENGTH, INITIAL_COUNT_MAX, MAXIMUM_LENGTH, Cuid
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from multiprocessing.sharedctypes import Synchronized
+    from typing import Callable, Final, Optional
+
+# The number of CUIDs generated by a worker process per task, and sent back to the parent at once.
+CHUNK_SIZE: Final = 10_000
+# The number of tasks submitted ahead of the results consumed, per worker process. This bounds the memory used by
+# chunks that are generated but not consumed yet.
+TASKS_PER_WORKER: Final = 2
+
+_worker_cuid: Optional[Cuid] = None
+
+
+def _initialize_worker(worker_indexes: Synchronized[int]) -> None:
+    """Creates the generator of a worker process, whose counter is offset by a multiple of `INITIAL_COUNT_MAX`, as
+    the shards of a `ShardedCuid` are, so that the initial counter ranges of the workers never overlap.
+    """
+    global _worker_cuid  # noqa: PLW0603 (global statement) # pylint: disable=global-statement
+    with worker_indexes.get_lock():
+        worker_index: int = worker_indexes.value
+        worker_indexes.value += 1
+
+    def counter(count: int) -> Callable[[], int]:
+        return utils.create_counter(count + worker_index * INITIAL_COUNT_MAX)
+
+    _worker_cuid = Cuid(counter=counter)
+
+
+def _generate_chunk(count: int, length: int) -> bytes:
+    """Generates `count` CUIDs in a worker process, as newline-terminated ASCII lines, so that a single bytes object
+    is pickled back to the parent instead of a list of strings.
+    """
+    cuids: list[str] = _worker_cuid.generate_many(count, length)  # type: ignore[union-attr]
+    return ("\n".join(cuids) + "\n").encode("ascii") if cuids else b""
+
+
+def _chunk_counts(count: int, chunk_size: int) -> Iterator[int]:
+    full_chunks, remainder = divmod(count, chunk_size)
+    yield from (chunk_size,) * full_chunks
+    if remainder:
+        yield remainder
+
+
+def generate_chunks(
+    count: int,
+    workers: Optional[int] = None,
+    length: int = DEFAULT_LENGTH,
+    chunk_size: int = CHUNK_SIZE,
+    *,
+    ordered: bool = True,
+) -> Iterator[bytes]:
+    """Generates CUIDs in a pool of worker processes, and yields them in chunks of newline-terminated ASCII lines.
+
+    Every worker process generates with its own `Cuid`, and so its own fingerprint, and its counter is offset so that
+    the initial counter ranges of the workers never overlap. At most `TASKS_PER_WORKER` chunks per worker are
+    generated ahead of the consumer, so the memory used does not grow with `count`. The chunks can be written to a
+    file or a pipe as they are.
+
+    Parameters
+    ----------
+    count : int
+        The number of CUIDs to generate.
+    workers : int, optional
+        The number of worker processes. If it is not provided, the number of CPUs is used.
+    length : int, default=DEFAULT_LENGTH (24)
+        The length of the generated CUIDs.
+    chunk_size : int, default=CHUNK_SIZE (10000)
+        The number of CUIDs generated per task, and per yielded chunk, except for the last chunk.
+    ordered : bool, default=True
+        Whether chunks are yielded in the order they were submitted. Unordered chunks are yielded as soon as any
+        worker finishes one, so a slow worker does not hold back the others.
+
+    Yields
+    ------
+    bytes
+        Chunks of `chunk_size` CUIDs, one per line, each followed by a newline.
+
+    Raises
+    ------
+    ValueError
+        If the count parameter is negative.
+        If the workers or chunk_size parameters are less than 1.
+        If the length parameter is greater than `MAXIMUM_LENGTH` (98 characters).
+    """
+    if count < 0:
+        msg = "Cannot generate a negative number of CUIDs."
+        raise ValueError(msg)
+
+    if length > MAXIMUM_LENGTH:
+        msg = "Length must never exceed 98 characters."
+        raise ValueError(msg)
+
+    if chunk_size < 1:
+        msg = "Cannot generate CUIDs in parallel without a chunk size >= 1."
+        raise ValueError(msg)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        msg = "Cannot generate CUIDs in parallel without a number of workers >= 1."
+        raise ValueError(msg)
+
+    return _generate_chunks(count, workers, length, chunk_size, ordered=ordered)
+
+
+def _generate_chunks(
+    count: int,
+    workers: int,
+    length: int,
+    chunk_size: int,
+    *,
+    ordered: bool,
+) -> Iterator[bytes]:
+    counts: Iterator[int] = _chunk_counts(count, chunk_size)
+    worker_indexes: Synchronized[int] = multiprocessing.Value("i", 0)
+    with ProcessPoolExecutor(workers, initializer=_initialize_worker, initargs=(worker_indexes,)) as executor:
+        pending: deque[Future[bytes]] = deque(
+            executor.submit(_generate_chunk, chunk_count, length)
+            for _, chunk_count in zip(range(workers * TASKS_PER_WORKER), counts)
+        )
+        while pending:
+            done: Future[bytes]
+            if ordered:
+                done = pending.popleft()
+            else:
+                done = next(iter(wait(pending, return_when=FIRST_COMPLETED).done))
+                pending.remove(done)
+
+            chunk_count: Optional[int] = next(counts, None)
+            if chunk_count is not None:
+                pending.append(executor.submit(_generate_chunk, chunk_count, length))
+            yield done.result()
+
+
+def stream(
+    count: int,
+    workers: Optional[int] = None,
+    length: int = DEFAULT_LENGTH,
+    chunk_size: int = CHUNK_SIZE,
+    *,
+    ordered: bool = True,
+) -> Iterator[str]:
+    """Generates CUIDs in a pool of worker processes, and yields them one by one. See `generate_chunks`.
+
+    Returns
+    -------
+    Iterator[str]
+        An iterator of `count` CUIDs.
+    """
+    chunks: Iterator[bytes] = generate_chunks(count, workers, length, chunk_size, ordered=ordered)
+    return chain.from_iterable(map(str.split, map(bytes.decode, chunks)))
+
+
+def generate(
+    count: int,
+    workers: Optional[int] = None,
+    length: int = DEFAULT_LENGTH,
+    chunk_size: int = CHUNK_SIZE,
+) -> list[str]:
+    """Generates CUIDs in a pool of worker processes, and returns them all at once. See `generate_chunks`.
+
+    For very large counts, prefer iterating over `stream` or `generate_chunks`, which do not hold every CUID in
+    memory at once.
+
+    Returns
+    -------
+    list[str]
+        A list of `count` CUIDs.
+    """
+    cuids: list[str] = []
+    for chunk in generate_chunks(count, workers, length, chunk_size, ordered=False):
+        cuids.extend(chunk.decode().split())
+    return cuids
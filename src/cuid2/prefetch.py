@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import os
+import threading
+import weakref
+from collections import deque
+
+from cuid2.generator import Cuid
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Final, Optional
+
+DEFAULT_HIGH_WATERMARK: Final = 4096
+DEFAULT_LOW_WATERMARK: Final = 1024
+DEFAULT_BATCH_SIZE: Final = 256
+# The most strings the background thread generates while holding the lock of the `Cuid`, so that a caller falling
+# back to synchronous generation waits for at most that many strings, whatever the batch size.
+_LOCKED_BATCH_SIZE: Final = 16
+
+_LIVE_PREFETCHERS: weakref.WeakSet[PrefetchingCuid] = weakref.WeakSet()
+
+
+class PrefetchingCuid:
+    def __init__(
+        self: PrefetchingCuid,
+        cuid: Optional[Cuid] = None,
+        high_watermark: int = DEFAULT_HIGH_WATERMARK,
+        low_watermark: int = DEFAULT_LOW_WATERMARK,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initialization function for the PrefetchingCuid class that serves CUID strings from a bounded buffer,
+        which a background thread keeps filled with pre-generated strings.
+
+        Callers only pop a string from the buffer, so the hashing happens off the request path. Once the buffer
+        drops below `low_watermark`, the background thread is woken up and refills it to `high_watermark`. If the
+        buffer is drained faster than it is refilled, `generate()` falls back to generating synchronously.
+
+        The background thread is started on the first call to `generate()`. After `os.fork`, the child discards the
+        strings buffered by its parent, so a parent and its children never hand out the same string.
+
+        Parameters
+        ----------
+        cuid : Cuid, optional
+            The generator used to fill the buffer. If it is not provided, a new `Cuid` is created. It should not be
+            used elsewhere while the PrefetchingCuid is open.
+        high_watermark : int, default=DEFAULT_HIGH_WATERMARK (4096)
+            The number of strings the background thread fills the buffer to.
+        low_watermark : int, default=DEFAULT_LOW_WATERMARK (1024)
+            The number of buffered strings below which the background thread is woken up.
+        batch_size : int, default=DEFAULT_BATCH_SIZE (256)
+            The number of strings the background thread adds to the buffer at a time. They are generated with calls
+            to `Cuid.generate_many` of at most 16 strings, between which a synchronous fallback can take its turn.
+
+        Raises
+        ------
+        ValueError
+            If the watermarks do not satisfy `0 <= low_watermark < high_watermark`.
+            If the batch_size parameter is less than 1.
+        """
+        if not 0 <= low_watermark < high_watermark:
+            msg = "Watermarks must satisfy 0 <= low_watermark < high_watermark."
+            raise ValueError(msg)
+
+        if batch_size < 1:
+            msg = "Cannot prefetch without a batch size >= 1."
+            raise ValueError(msg)
+
+        self._cuid: Cuid = cuid or Cuid()
+        self._length: int = self._cuid._length  # noqa: SLF001 (private member accessed)
+        self._high_watermark: int = high_watermark
+        self._low_watermark: int = low_watermark
+        self._batch_size: int = batch_size
+        self._closed: bool = False
+        self._reset()
+        _LIVE_PREFETCHERS.add(self)
+
+    def _reset(self: PrefetchingCuid) -> None:
+        # `deque.append`, `deque.extend` and `deque.popleft` are atomic, so the buffer itself needs no lock.
+        self._buffer: deque[str] = deque()
+        self._cuid_lock: threading.Lock = threading.Lock()
+        self._refill: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock: threading.Lock = threading.Lock()
+
+    def _start(self: PrefetchingCuid) -> None:
+        with self._thread_lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._fill, name="cuid2-prefetch", daemon=True)
+                self._refill.set()
+                self._thread.start()
+
+    def _fill(self: PrefetchingCuid) -> None:
+        buffer: deque[str] = self._buffer
+        refill: threading.Event = self._refill
+        while True:
+            refill.wait()
+            if self._closed:
+                return
+
+            while not self._closed and len(buffer) < self._high_watermark:
+                batch_size: int = min(self._batch_size, self._high_watermark - len(buffer))
+                batch: list[str] = []
+                for start in range(0, batch_size, _LOCKED_BATCH_SIZE):
+                    with self._cuid_lock:
+                        batch += self._cuid.generate_many(min(_LOCKED_BATCH_SIZE, batch_size - start))
+                buffer.extend(batch)
+
+            refill.clear()
+            # The PrefetchingCuid may have been closed, or a caller may have drained the buffer, after the loop
+            # ended but before the event was cleared.
+            if self._closed or len(buffer) < self._low_watermark:
+                refill.set()
+
+    def generate(self: PrefetchingCuid, length: Optional[int] = None) -> str:
+        """Returns a universally unique, base36 encoded string from the buffer.
+
+        Parameters
+        ----------
+        length : int, optional
+            The length of the generated string. Strings of a length other than the generator's default length are
+            not buffered, and are generated synchronously.
+
+        Returns
+        -------
+        str
+            A string as described in `Cuid.generate()`.
+
+        Raises
+        ------
+        ValueError
+            If the PrefetchingCuid has been closed.
+            If the length parameter is greater than `MAXIMUM_LENGTH` (98 characters).
+        """
+        if self._closed:
+            msg = "Cannot generate a CUID from a closed PrefetchingCuid."
+            raise ValueError(msg)
+
+        if self._thread is None:
+            self._start()
+
+        if length is not None and length != self._length:
+            return self._generate_synchronously(length)
+
+        try:
+            cuid: str = self._buffer.popleft()
+        except IndexError:
+            self._refill.set()
+            return self._generate_synchronously()
+
+        if len(self._buffer) < self._low_watermark and not self._refill.is_set():
+            self._refill.set()
+
+        return cuid
+
+    def _generate_synchronously(self: PrefetchingCuid, length: Optional[int] = None) -> str:
+        with self._cuid_lock:
+            return self._cuid.generate(length)
+
+    def close(self: PrefetchingCuid) -> None:
+        """Stops the background thread and discards the buffered strings."""
+        self._closed = True
+        self._refill.set()
+        thread: Optional[threading.Thread] = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._buffer.clear()
+
+    def __enter__(self: PrefetchingCuid) -> PrefetchingCuid:
+        return self
+
+    def __exit__(
+        self: PrefetchingCuid,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def _reset_prefetchers_in_child() -> None:
+    # The background thread does not survive the fork, its locks may have been held by it, and the buffered strings
+    # were generated by the parent. The underlying Cuid re-derives its own state, see `generator.Cuid._reseed`.
+    for prefetcher in _LIVE_PREFETCHERS:
+        prefetcher._reset()  # noqa: SLF001 (private member accessed)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_prefetchers_in_child)
@@ -0,0 +1,190 @@
+"""Per-stage timings of CUID generation, to find where the time of `Cuid.generate` goes under a real workload.
+
+While a `Profile` is active, `Cuid.generate`, `Cuid.generate_many` and `utils.create_fingerprint` time each of their
+stages with `time.perf_counter_ns`. The active profile is held in a context variable, so it applies to the thread or
+asyncio task that entered it, and to the tasks it creates. Otherwise, `generate` only checks that no profile is
+active, and the other functions record their laps on a stopwatch that does nothing.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextvars import ContextVar
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from contextvars import Token
+    from types import TracebackType
+    from typing import Final, Optional
+
+# Timings are counted in buckets of powers of two nanoseconds: bucket `i` holds the timings below `2**i` ns.
+HISTOGRAM_BUCKETS: Final = 64
+
+# The active profile of the current context, if any. Read by `stopwatch`, set by `Profile.__enter__`.
+current: ContextVar[Optional[Profile]] = ContextVar("current", default=None)
+
+
+class Stage:
+    """The timings of a single stage: the number of calls, their cumulative time, and a histogram of their times."""
+
+    __slots__ = ("calls", "histogram", "total_ns")
+
+    def __init__(self: Stage) -> None:
+        self.calls: int = 0
+        self.total_ns: int = 0
+        self.histogram: list[int] = [0] * HISTOGRAM_BUCKETS
+
+    def add(self: Stage, elapsed_ns: int) -> None:
+        """Records a single timing, in nanoseconds."""
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        self.histogram[min(elapsed_ns.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+    @property
+    def mean_ns(self: Stage) -> float:
+        """The mean time of a call, in nanoseconds."""
+        return self.total_ns / self.calls if self.calls else 0.0
+
+    def percentile_ns(self: Stage, percentile: float) -> int:
+        """Returns an upper bound of the given percentile of the times of a call, in nanoseconds: the upper bound of
+        the histogram bucket that holds it, within a factor of two of the exact value.
+        """
+        if not 0 <= percentile <= 100:  # noqa: PLR2004 (magic value)
+            msg = "Percentile must be between 0 and 100."
+            raise ValueError(msg)
+
+        rank: float = self.calls * percentile / 100
+        seen: int = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= rank:
+                return 2**bucket
+        return 0
+
+
+class Profile:
+    def __init__(self: Profile) -> None:
+        """Initialization function for the Profile class, which collects the timings of every stage of CUID
+        generation while it is active. Use it as a context manager, see `profile`.
+
+        Stages are named after their function and step, such as `generate.create_hash`, and the stage named after the
+        function alone, such as `generate`, times whole calls. The time spent recording the timings of a call is not
+        included in its stages, only in its whole call.
+        """
+        self.stages: dict[str, Stage] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._token: Optional[Token[Optional[Profile]]] = None
+
+    def add(self: Profile, stage: str, elapsed_ns: int) -> None:
+        """Records a single timing of a stage, in nanoseconds."""
+        with self._lock:
+            timings: Optional[Stage] = self.stages.get(stage)
+            if timings is None:
+                timings = self.stages[stage] = Stage()
+            timings.add(elapsed_ns)
+
+    def report(self: Profile) -> str:
+        """Returns a table of the timings of every stage, in the order they were first recorded.
+
+        Returns
+        -------
+        str
+            A line per stage with its number of calls, cumulative time, mean time, and the upper bounds of the median
+            and 99th percentile of its times. The share of every step in the time of its whole calls is shown as well.
+        """
+        with self._lock:
+            stages: list[tuple[str, Stage]] = list(self.stages.items())
+
+        width: int = max([len("stage"), *(len(name) for name, _ in stages)])
+        lines: list[str] = [
+            f"{'stage':<{width}} {'calls':>10} {'total ms':>10} {'mean ns':>10} {'p50 ns':>10} {'p99 ns':>10} "
+            f"{'share':>6}",
+        ]
+        totals: dict[str, int] = {name: timings.total_ns for name, timings in stages}
+        for name, timings in stages:
+            parent_ns: int = totals.get(name.rpartition(".")[0], 0)
+            share: str = f"{timings.total_ns / parent_ns:.1%}" if parent_ns else ""
+            lines.append(
+                f"{name:<{width}} {timings.calls:>10} {timings.total_ns / 1e6:>10.3f} {timings.mean_ns:>10.0f} "
+                f"{timings.percentile_ns(50):>10} {timings.percentile_ns(99):>10} {share:>6}",
+            )
+        return "\n".join(lines)
+
+    def __enter__(self: Profile) -> Profile:
+        self._token = current.set(self)
+        return self
+
+    def __exit__(
+        self: Profile,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._token is not None:
+            current.reset(self._token)
+            self._token = None
+
+
+def profile() -> Profile:
+    """Returns a new profile, which collects the timings of every stage of CUID generation inside a `with` block, in
+    the thread or asyncio task that entered it and in the tasks it creates.
+
+    Profiles can be nested, the innermost one collects the timings. Profiling slows generation down, by the cost of
+    reading the clock and recording the timings.
+
+    Returns
+    -------
+    Profile
+        The profile, whose `report()` tabulates the timings, and whose `stages` hold them.
+    """
+    return Profile()
+
+
+class Stopwatch:
+    """Records the laps of the stages of a single call on the active profile, see `stopwatch`."""
+
+    __slots__ = ("_last", "_name", "_profile", "_start")
+
+    def __init__(self: Stopwatch, active: Profile, name: str) -> None:
+        self._profile: Profile = active
+        self._name: str = name
+        self._start: int = time.perf_counter_ns()
+        self._last: int = self._start
+
+    def lap(self: Stopwatch, stage: str) -> None:
+        """Records the time since the previous lap, or the start, as the time of a stage of the call."""
+        now: int = time.perf_counter_ns()
+        self._profile.add(f"{self._name}.{stage}", now - self._last)
+        self._last = time.perf_counter_ns()
+
+    def stop(self: Stopwatch) -> None:
+        """Records the time since the start as the time of the whole call."""
+        self._profile.add(self._name, time.perf_counter_ns() - self._start)
+
+
+class _NullStopwatch(Stopwatch):
+    """A stopwatch that records nothing, used while no profile is active."""
+
+    __slots__ = ()
+
+    def __init__(self: _NullStopwatch) -> None:
+        pass
+
+    def lap(self: _NullStopwatch, stage: str) -> None:
+        pass
+
+    def stop(self: _NullStopwatch) -> None:
+        pass
+
+
+_NULL_STOPWATCH: Final = _NullStopwatch()
+
+
+def stopwatch(name: str) -> Stopwatch:
+    """Starts timing a call of the function `name` on the active profile, or returns a stopwatch that records nothing
+    if no profile is active.
+    """
+    active: Optional[Profile] = current.get()
+    return _NULL_STOPWATCH if active is None else Stopwatch(active, name)
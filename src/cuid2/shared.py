@@ -0,0 +1,199 @@
+"""Zero-copy handoff of CUIDs between processes, through fixed-width records in shared memory.
+
+A producer writes CUIDs with `Cuid.generate_into`, or `generate_shared`, as ASCII records of `length` bytes, and a
+consumer maps the same memory and reads it with a `CuidView`. No string is pickled or copied on the way, only the
+record of each CUID that is read is decoded.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from multiprocessing.shared_memory import SharedMemory
+from typing import overload
+
+from cuid2.generator import DEFAULT_LENGTH, MAXIMUM_LENGTH, Cuid
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import TracebackType
+    from typing import Final, Optional, Union
+
+# The number of records decoded at a time when iterating over a `CuidView`.
+ITERATION_CHUNK_SIZE: Final = 4096
+
+
+class CuidView(Sequence):  # type: ignore[type-arg]
+    def __init__(  # noqa: PLR0913 (too many arguments) # pylint: disable=too-many-arguments
+        self: CuidView,
+        buffer: Union[bytes, bytearray, memoryview, SharedMemory],
+        length: int = DEFAULT_LENGTH,
+        count: Optional[int] = None,
+        *,
+        decode: bool = True,
+        terminator: str = "",
+    ) -> None:
+        """Initialization function for the CuidView class, a read-only sequence over the fixed-width records written
+        by `Cuid.generate_into`, which never copies the buffer.
+
+        Every item is decoded from its record only when it is read, and slices are views of the same buffer. The NUL
+        padding of records shorter than `length` is stripped.
+
+        Parameters
+        ----------
+        buffer : bytes | bytearray | memoryview | SharedMemory
+            The records, or a shared memory block holding them. Any object supporting the buffer protocol, such as
+            an `mmap`, can be read.
+        length : int, default=DEFAULT_LENGTH (24)
+            The size of every record, the length the CUIDs were generated with.
+        count : int, optional
+            The number of records. If it is not provided, every whole record of the buffer is read. Shared memory
+            blocks can be larger than requested, as some platforms round their size up to whole pages.
+        decode : bool, default=True
+            Whether items are returned as `str`, or as `bytes`.
+        terminator : str, default=""
+            The characters that follow every record, see `Cuid.generate_into`. They are not part of the items.
+
+        Raises
+        ------
+        ValueError
+            If the length parameter is less than 1 or greater than `MAXIMUM_LENGTH` (98 characters).
+            If the count parameter is negative, or more records than the buffer holds.
+        """
+        if not 1 <= length <= MAXIMUM_LENGTH:
+            msg = "Length must be between 1 and 98 characters."
+            raise ValueError(msg)
+
+        record_size: int = length + len(terminator)
+        view: memoryview = memoryview(buffer.buf if isinstance(buffer, SharedMemory) else buffer).cast("B")
+        available: int = len(view) // record_size
+        if count is None:
+            count = available
+        if not 0 <= count <= available:
+            msg = f"Cannot read {count} CUIDs of {length} characters from a buffer of {len(view)} bytes."
+            raise ValueError(msg)
+
+        self._view: memoryview = view[: count * record_size]
+        self._length: int = length
+        self._record_size: int = record_size
+        self._decode: bool = decode
+        self._terminator: str = terminator
+
+    def __len__(self: CuidView) -> int:
+        return len(self._view) // self._record_size
+
+    @overload
+    def __getitem__(self: CuidView, index: int) -> Union[str, bytes]: ...
+
+    @overload
+    def __getitem__(self: CuidView, index: slice) -> Union[CuidView, list[Union[str, bytes]]]: ...
+
+    def __getitem__(
+        self: CuidView,
+        index: Union[int, slice],
+    ) -> Union[str, bytes, CuidView, list[Union[str, bytes]]]:
+        record_size: int = self._record_size
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[position] for position in range(start, stop, step)]
+            return CuidView(
+                self._view[start * record_size : max(start, stop) * record_size],
+                self._length,
+                decode=self._decode,
+                terminator=self._terminator,
+            )
+
+        count: int = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            msg = "CuidView index out of range"
+            raise IndexError(msg)
+
+        position: int = index * record_size
+        record: bytes = self._view[position : position + self._length].tobytes().rstrip(b"\0")
+        return record.decode("ascii") if self._decode else record
+
+    def __iter__(self: CuidView) -> Iterator[Union[str, bytes]]:
+        # Records are decoded a chunk at a time, and only chunks with padded records are stripped record by record.
+        length: int = self._length
+        record_size: int = self._record_size
+        chunk_bytes: int = ITERATION_CHUNK_SIZE * record_size
+        for start in range(0, len(self._view), chunk_bytes):
+            chunk: bytes = self._view[start : start + chunk_bytes].tobytes()
+            if b"\0" in chunk:
+                yield from (self[index] for index in range(start // record_size, (start + len(chunk)) // record_size))
+            elif self._decode:
+                text: str = chunk.decode("ascii")
+                yield from [text[offset : offset + length] for offset in range(0, len(text), record_size)]
+            else:
+                yield from [chunk[offset : offset + length] for offset in range(0, len(chunk), record_size)]
+
+    def release(self: CuidView) -> None:
+        """Releases the view of the buffer, which a shared memory block requires before it is closed."""
+        self._view.release()
+
+    def __enter__(self: CuidView) -> CuidView:
+        return self
+
+    def __exit__(
+        self: CuidView,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.release()
+
+
+def generate_shared(
+    count: int,
+    length: int = DEFAULT_LENGTH,
+    cuid: Optional[Cuid] = None,
+    name: Optional[str] = None,
+) -> SharedMemory:
+    """Creates a shared memory block, and fills it with `count` CUIDs as fixed-width records.
+
+    Another process attaches to the block with `SharedMemory(name)`, and reads it with `CuidView(block, length,
+    count)`. The caller owns the block, and must `close` it, and `unlink` it once every process is done with it.
+
+    Parameters
+    ----------
+    count : int
+        The number of CUIDs to generate.
+    length : int, default=DEFAULT_LENGTH (24)
+        The length of the generated CUIDs, and the size of every record.
+    cuid : Cuid, optional
+        The generator of the CUIDs. If it is not provided, a new `Cuid` is created.
+    name : str, optional
+        The name of the shared memory block. If it is not provided, a unique name is chosen.
+
+    Returns
+    -------
+    SharedMemory
+        The block, whose first `count * length` bytes hold the records.
+
+    Raises
+    ------
+    ValueError
+        If the count parameter is negative.
+        If the length parameter is less than 1 or greater than `MAXIMUM_LENGTH` (98 characters).
+    """
+    if count < 0:
+        msg = "Cannot generate a negative number of CUIDs."
+        raise ValueError(msg)
+
+    if not 1 <= length <= MAXIMUM_LENGTH:
+        msg = "Length must be between 1 and 98 characters."
+        raise ValueError(msg)
+
+    # Shared memory blocks cannot be empty.
+    block: SharedMemory = SharedMemory(name=name, create=True, size=max(count * length, 1))
+    try:
+        (cuid or Cuid()).generate_into(block.buf, count, length)
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    return block
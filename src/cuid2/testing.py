@@ -0,0 +1,198 @@
+"""Deterministic, fast CUIDs for test fixtures, snapshot tests and load tests. NEVER use them in production.
+
+A seeded `Cuid` still hashes the process ID, hostname and environment into its fingerprint, and the current time into
+every CUID, so it generates different strings on every run. `FixtureCuid` generates the same strings for the same
+seed, clock, fingerprint and sequence of calls, on any host. It skips hashing altogether: it draws the letter and most
+digits from a Mersenne Twister, and spells out the time plus the counter in the last digits. None of it is
+cryptographically secure: anyone who sees a few fixture CUIDs can predict the next ones, and two processes forked from
+the same generator generate the same strings.
+"""
+
+from __future__ import annotations
+
+import itertools
+import time
+from random import Random
+
+from cuid2 import utils
+from cuid2.entropy import EntropyPool
+from cuid2.generator import (
+    DEFAULT_LENGTH,
+    SORTABLE_PREFIX_LENGTH,
+    Cuid,
+    check_length,
+    check_sortable_length,
+    sortable_prefix,
+)
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Callable, Final, Optional, Union
+
+# The time of the default clock of a `FixtureCuid`, 2021-07-30 00:00:00 UTC, in nanoseconds since the epoch.
+FIXTURE_TIME_NS: Final = 1_627_584_000_000_000_000
+FIXTURE_FINGERPRINT: Final = "fixture"
+# The number of trailing digits of every fixture string that encode the time plus the counter.
+MIXED_DIGITS: Final = 4
+
+_BASE36_ALPHABET: Final = "0123456789" + utils.LOWERCASE_ALPHABET
+_BASE36_PAIRS: Final = tuple(high + low for high in _BASE36_ALPHABET for low in _BASE36_ALPHABET)
+
+
+class SeededEntropyPool(EntropyPool):
+    def __init__(self: SeededEntropyPool, seed: Union[int, str, bytes] = 0, chunk_size: int = 4096) -> None:
+        """Initialization function for the SeededEntropyPool class, an `EntropyPool` that reads its bytes from a
+        Mersenne Twister seeded with `seed` instead of the operating system, so it returns the same values for the
+        same seed and sequence of calls. It is not cryptographically secure, and must only be used in tests.
+
+        Parameters
+        ----------
+        seed : int | str | bytes, default=0
+            The seed of the Mersenne Twister, see `random.seed`.
+        chunk_size : int, default=4096
+            The number of bytes drawn each time one of the buffers runs out. See `EntropyPool`.
+        """
+        self._source: Random = Random(seed)  # noqa: S311 (deterministic by design, never used in production)
+        super().__init__(chunk_size)
+
+    def _read(self: SeededEntropyPool, count: int) -> bytes:
+        self.bytes_read += count
+        return self._source.randbytes(count)
+
+
+def step_clock(start_ns: int = FIXTURE_TIME_NS, step_ns: int = 1_000_000) -> Callable[[], int]:
+    """Creates a clock for a `FixtureCuid` that starts at `start_ns` and advances by `step_ns` on every call.
+
+    Parameters
+    ----------
+    start_ns : int, default=FIXTURE_TIME_NS
+        The first time returned, in nanoseconds since the epoch.
+    step_ns : int, default=1_000_000 (a millisecond)
+        The time added on every call, in nanoseconds.
+
+    Returns
+    -------
+    Callable[[], int]
+        A callable that returns the next time, in nanoseconds since the epoch, like `time.time_ns`.
+    """
+    return itertools.count(start_ns, step_ns).__next__
+
+
+class FixtureCuid(Cuid):
+    def __init__(  # noqa: PLR0913 (too many arguments) # pylint: disable=too-many-arguments
+        self: FixtureCuid,
+        seed: Union[int, str] = 0,
+        length: int = DEFAULT_LENGTH,
+        clock: Optional[Callable[[], int]] = None,
+        fingerprint: str = FIXTURE_FINGERPRINT,
+        *,
+        sortable: bool = False,
+        metrics: bool = False,
+    ) -> None:
+        """Initialization function for the FixtureCuid class that generates deterministic, CUID-shaped strings for
+        tests. NEVER use it in production, its strings are predictable.
+
+        The strings have the format of those of a `Cuid` with the same length and `sortable` flag, and pass
+        `is_cuid`, but they are not hashed, which is several times faster. Their characters are drawn from a
+        `SeededEntropyPool`, except for the last `MIXED_DIGITS` (4) digits, which encode the time of the clock plus
+        the counter, so that both change the strings as they change those of a `Cuid`. `generate_many(n)` and `n`
+        calls to `generate()` draw from the pool in different orders, so only the same sequence of calls gives the
+        same strings.
+
+        Parameters
+        ----------
+        seed : int | str, default=0
+            Generators with the same seed and fingerprint generate the same strings.
+        length : int, default=DEFAULT_LENGTH (24)
+            The default length of the generated strings. See `Cuid`.
+        clock : Callable[[], int], optional
+            Returns the time in nanoseconds since the epoch, in place of `time.time_ns`. It is read once per string,
+            for its last digits and the prefix of sortable strings. If it is not provided, the time is always
+            `FIXTURE_TIME_NS`. See `step_clock`.
+        fingerprint : str, default=FIXTURE_FINGERPRINT
+            Stands in for the fingerprint of a host: generators with the same seed and different fingerprints
+            generate different strings.
+        sortable : bool, default=False
+            Whether every string starts with the time of the clock. See `Cuid`.
+        metrics : bool, default=False
+            Whether to collect the metrics reported by `stats()`. See `Cuid`.
+
+        Raises
+        ------
+        ValueError
+            If the length parameter is greater than `MAXIMUM_LENGTH` (98 characters).
+            If the generator is sortable, and the length parameter is less than `SORTABLE_MINIMUM_LENGTH` (16).
+        """
+
+        def random_generator() -> Random:
+            return SeededEntropyPool(f"{seed}/{fingerprint}")
+
+        def fixed_fingerprint(random_generator: Random) -> str:  # noqa: ARG001 (unused argument)
+            return fingerprint
+
+        super().__init__(
+            random_generator=random_generator,
+            length=length,
+            fingerprint=fixed_fingerprint,
+            metrics=metrics,
+            sortable=sortable,
+        )
+        self._clock: Callable[[], int] = clock or (lambda: FIXTURE_TIME_NS)
+
+    def generate(self: FixtureCuid, length: Optional[int] = None) -> str:
+        """Generates a deterministic, CUID-shaped string with a specified length. See `Cuid.generate`."""
+        return self.generate_many(1, length)[0]
+
+    def generate_many(self: FixtureCuid, count: int, length: Optional[int] = None) -> list[str]:
+        """Generates a batch of deterministic, CUID-shaped strings with a specified length. See
+        `Cuid.generate_many`.
+        """
+        length = length or self._length
+        check_length(length)
+
+        if self._sortable:
+            check_sortable_length(length)
+
+        if count < 0:
+            msg = "Cannot generate a negative number of CUIDs."
+            raise ValueError(msg)
+
+        if not count:
+            return []
+
+        start: float = time.perf_counter() if self._metrics is not None else 0.0
+        pool: EntropyPool = self._random  # type: ignore[assignment]
+        cuids: list[str]
+        # Every string is a sortable prefix or a letter, followed by `body_length` digits, which may be none.
+        body_length: int = length - SORTABLE_PREFIX_LENGTH if self._sortable else length - 1
+        if not body_length:
+            cuids = list(pool.lowercase_letters(count))
+        else:
+            heads: Iterable[str] = itertools.repeat("", count) if self._sortable else pool.lowercase_letters(count)
+            # The last digits are the time plus the counter, as the hash of a `Cuid` changes with both.
+            window: int = min(body_length, MIXED_DIGITS)
+            drawn_length: int = body_length - window
+            digits: str = pool.base36_digits(drawn_length * count) if drawn_length else ""
+
+            # Hoist every attribute and global lookup out of the loop.
+            sortable: bool = self._sortable
+            clock: Callable[[], int] = self._clock
+            counter: Callable[[], int] = self._counter
+            pairs: tuple[str, ...] = _BASE36_PAIRS
+            modulus: int = utils.BASE36_POWERS[window]
+            cut: int = MIXED_DIGITS - window
+
+            cuids = []
+            append = cuids.append
+            for head, offset in zip(heads, itertools.count(0, drawn_length)):
+                now: int = clock()
+                mixed: int = (now + counter()) % modulus
+                prefix: str = sortable_prefix(now) if sortable else head
+                tail: str = pairs[mixed // 1296] + pairs[mixed % 1296]
+                append((prefix + digits[offset : offset + drawn_length] + tail[cut:])[:length])
+
+        if self._metrics is not None:
+            self._metrics.record(count, start)
+        return cuids
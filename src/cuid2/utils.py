@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import itertools
 import os
-import socket
-import string
+from hashlib import blake2b, shake_256
 from math import floor
-from typing import TYPE_CHECKING, Callable, Final, Optional
+
+from cuid2 import profiling
+from cuid2.entropy import EntropyPool
 
 try:
     from hashlib import sha3_512 as sha512
@@ -16,13 +18,38 @@ except ImportError:
 
 
 BIG_LENGTH: Final = 32
+# Powers of 36, `BASE36_POWERS[n] == 36**n`, up to the first above a SHA3-512 digest. A number has `n` base36 digits
+# when `BASE36_POWERS[n - 1] <= number < BASE36_POWERS[n]`, which counts the digits of a hash without encoding it.
+BASE36_POWERS: Final[tuple[int, ...]] = tuple(36**exponent for exponent in range(101))
+
+# Spelled out rather than taken from the `string` module, whose import pulls in `re` and `enum`.
+LOWERCASE_ALPHABET: Final = "abcdefghijklmnopqrstuvwxyz"
+_BASE36_ALPHABET: Final = "0123456789" + LOWERCASE_ALPHABET
+# Every two-digit base36 string, indexed by its value, so that two digits are emitted per lookup.
+_BASE36_PAIRS: Final = tuple(high + low for high in _BASE36_ALPHABET for low in _BASE36_ALPHABET)
+# 36**5 still fits in a single 30-bit CPython digit, so dividing a bignum by it stays on the fast path
+# while peeling off five base36 digits at a time.
+_BASE36_CHUNK: Final = 36**5
+# The largest hashes whose digits are counted with `BASE36_POWERS`, the size of a SHA3-512 digest.
+_MAXIMUM_HASH_BITS: Final = 512
+# The values of the four low digits that `create_base36_encoder` encodes on every call, with two pair lookups.
+_BASE36_LOW: Final = 36**4
+
+# The process ID, the default fingerprint data of that process, and a hash object already fed with it.
+_process_fingerprint: Optional[tuple[int, str, _Hash]] = None
 
 
+TYPE_CHECKING = False
+
 if TYPE_CHECKING:
     from hashlib import _Hash
+    from typing import Callable, Final, Optional
 
     from _random import Random
 
+    # Hashes data, given the number of base36 characters of the hash the caller uses, and returns the digest.
+    HashEngine = Callable[[bytes, int], bytes]
+
 
 def create_counter(count: int) -> Callable[[], int]:
     """Creates a counter that returns an incremented value each time it is called.
@@ -35,20 +62,107 @@ def create_counter(count: int) -> Callable[[], int]:
     Returns
     -------
     Callable[[], int]
-        Closure function `counter` that takes no arguments and returns an integer. The closure function keeps track
-        of a count variable that is initialized with the value passed as an argument to `create_counter`. Each time
-        the closure function is called, it increments the count variable and returns its new value.
+        Callable that takes no arguments and returns an integer. The callable keeps track of a count that is
+        initialized with the value passed as an argument to `create_counter`. Each time the callable is called,
+        it increments the count and returns its new value. The increment happens in a single C call, so threads that
+        share a counter never receive the same value on interpreters with a global interpreter lock. On free-threaded
+        builds, the increment is not atomic and threads must not share a counter: `ShardedCuid` gives each thread its
+        own.
+    """
+    return itertools.count(count + 1).__next__
+
+
+def sha3_512_digest(data: bytes, length: int) -> bytes:  # noqa: ARG001 (unused argument)
+    """The default hash engine: SHA3-512, or SHA-512 where SHA3 is not available.
+
+    SHA3-512 is the hash of the reference CUID2 implementation. It is a NIST standard, and its sponge construction is
+    not subject to length extension, so it is the conservative choice: prefer it unless hashing is a measured
+    bottleneck.
+
+    Parameters
+    ----------
+    data : bytes
+        The data to hash.
+    length : int
+        The number of base36 characters of the hash used by the caller. Unused, the digest is always 512 bits.
+
+    Returns
+    -------
+    bytes
+        The 64 bytes of the digest.
+    """
+    return sha512(data).digest()
+
+
+def blake2b_digest(data: bytes, length: int) -> bytes:  # noqa: ARG001 (unused argument)
+    """A hash engine using BLAKE2b-512, usually faster than SHA3-512 in software.
+
+    BLAKE2b is a SHA-3 finalist whose security margin is comparable to that of SHA3, without length extension
+    attacks, and with the same 512-bit output. CUIDs generated with it are as collision-resistant as with SHA3-512,
+    but differ from those of the reference implementation for the same inputs.
+
+    Parameters
+    ----------
+    data : bytes
+        The data to hash.
+    length : int
+        The number of base36 characters of the hash used by the caller. Unused, the digest is always 512 bits.
+
+    Returns
+    -------
+    bytes
+        The 64 bytes of the digest.
+    """
+    return blake2b(data).digest()
+
+
+def shake_256_digest(data: bytes, length: int) -> bytes:
+    """A hash engine using SHAKE-256, an extendable-output function of the SHA3 family, with an output size matched
+    to the number of characters used.
+
+    The output keeps 64 bits more than the `length + 1` base36 digits that are read from the hash (see
+    `create_hash` and `Cuid.generate`), so the digits that are kept are unbiased, and the hash is shorter than
+    `length + 1` digits with a probability below 2**-64. As the rest of a long hash is discarded anyway, a CUID is as
+    hard to predict or collide as with SHA3-512. The smaller output mostly saves the base36 encoding; SHAKE-256 is
+    computed with the same permutation as SHA3-512, at a slightly higher rate.
+
+    Parameters
+    ----------
+    data : bytes
+        The data to hash.
+    length : int
+        The number of base36 characters of the hash used by the caller.
+
+    Returns
+    -------
+    bytes
+        The digest, of `shake_256_size(length)` bytes.
     """
+    size: int = _SHAKE_256_SIZES[length] if length < len(_SHAKE_256_SIZES) else shake_256_size(length)
+    return shake_256(data).digest(size)
+
+
+def shake_256_size(length: int) -> int:
+    """Returns the number of bytes of the `shake_256_digest` of a hash of which `length` characters are used."""
+    return ((36 ** (length + 1) - 1).bit_length() + 64 + 7) // 8
+
+
+_SHAKE_256_SIZES: Final = tuple(shake_256_size(length) for length in range(99))
 
-    def counter() -> int:
-        nonlocal count
-        count += 1
-        return count
 
-    return counter
+# The built-in hash engines, by name.
+HASH_ENGINES: Final[dict[str, HashEngine]] = {
+    "sha3_512": sha3_512_digest,
+    "blake2b": blake2b_digest,
+    "shake_256": shake_256_digest,
+}
 
 
-def create_fingerprint(random_generator: Random, fingerprint_data: Optional[str] = "") -> str:
+def create_fingerprint(
+    random_generator: Random,
+    fingerprint_data: Optional[str] = "",
+    hash_engine: HashEngine = sha3_512_digest,
+) -> str:
     """Creates a fingerprint, by default combining process ID, hostname, and environment variables
     with entropy and then hashing the result.
 
@@ -58,7 +172,10 @@ def create_fingerprint(random_generator: Random, fingerprint_data: Optional[str]
         Used as the base generator to generate some entropy.
     fingerprint_data : str, optional
         An optional parameter that contains data to be included in the fingerprint.
-        If it is not provided, the function combines process ID, hostname, and environment variables
+        If it is not provided, the function combines process ID, hostname, and environment variables. Those are only
+        read and hashed once per process ID, and fresh entropy is still hashed into every fingerprint.
+    hash_engine : "HashEngine", default=sha3_512_digest
+        The hash function used to hash the fingerprint, see `create_hash`.
 
     Returns
     -------
@@ -67,15 +184,51 @@ def create_fingerprint(random_generator: Random, fingerprint_data: Optional[str]
         entropy string.
         The length of the returned string is trimmed to the constant `BIG_LENGTH` (32 characters).
     """
+    stopwatch: profiling.Stopwatch = profiling.stopwatch("create_fingerprint")
+    if not fingerprint_data and hash_engine is sha3_512_digest:
+        # Continuing the cached hash of the process data with the entropy gives the same digest as hashing their
+        # concatenation, without reading the hostname and environment or hashing them again.
+        hashed_value: _Hash = _process_data()[1].copy()
+        stopwatch.lap("process_data")
+        entropy: str = create_entropy(random_generator, BIG_LENGTH)
+        stopwatch.lap("create_entropy")
+        hashed_value.update(entropy.encode())
+        digest: bytes = hashed_value.digest()
+        stopwatch.lap("hash")
+        fingerprint_hash: str = base36_encode_prefix(int.from_bytes(digest, byteorder="big"), BIG_LENGTH + 1)[1:]
+        stopwatch.lap("base36_encode")
+        stopwatch.stop()
+        return fingerprint_hash
+
     if not fingerprint_data:
-        process_id: int = os.getpid()
+        fingerprint_data = _process_data()[0]
+        stopwatch.lap("process_data")
+
+    fingerprint: str = str(fingerprint_data) + create_entropy(random_generator, BIG_LENGTH)
+    stopwatch.lap("create_entropy")
+    fingerprint = create_hash(fingerprint, hash_engine, BIG_LENGTH, truncate=True)
+    stopwatch.lap("create_hash")
+    stopwatch.stop()
+    return fingerprint
+
+
+def _process_data() -> tuple[str, _Hash]:
+    """Returns the default fingerprint data, the process ID, hostname, and environment variable names, along with a
+    SHA3 hash object fed with it. Both are only computed once per process ID.
+    """
+    global _process_fingerprint  # noqa: PLW0603 (global statement) # pylint: disable=global-statement
+    process_id: int = os.getpid()
+    cached: Optional[tuple[int, str, _Hash]] = _process_fingerprint
+    if cached is None or cached[0] != process_id:
+        import socket  # pylint: disable=import-outside-toplevel
+
         hostname: str = socket.gethostname()
         env_variables: str = "".join(os.environ.keys())
+        fingerprint_data: str = str(process_id) + hostname + env_variables
+        cached = (process_id, fingerprint_data, sha512(fingerprint_data.encode()))
+        _process_fingerprint = cached
 
-        fingerprint_data: str = str(process_id) + hostname + env_variables  # type: ignore[no-redef]
-
-    fingerprint: str = str(fingerprint_data) + create_entropy(random_generator, BIG_LENGTH)
-    return create_hash(fingerprint)[0:BIG_LENGTH]
+    return cached[1], cached[2]
 
 
 def create_entropy(random_generator: Random, length: int = 4) -> str:
@@ -104,6 +257,9 @@ def create_entropy(random_generator: Random, length: int = 4) -> str:
         msg = "Cannot create entropy without a length >= 1."
         raise ValueError(msg)
 
+    if isinstance(random_generator, EntropyPool):
+        return random_generator.base36_digits(length)
+
     entropy: str = ""
 
     while len(entropy) < length:
@@ -112,7 +268,13 @@ def create_entropy(random_generator: Random, length: int = 4) -> str:
     return entropy
 
 
-def create_hash(data: str = "") -> str:
+def create_hash(
+    data: str = "",
+    hash_engine: HashEngine = sha3_512_digest,
+    length: int = 98,
+    *,
+    truncate: bool = False,
+) -> str:
     """Creates a hash value for a given string using the SHA-512 algorithm (prefers SHA3) and returns
     it in base36 encoding format after dropping the first character.
 
@@ -121,6 +283,16 @@ def create_hash(data: str = "") -> str:
     data : str, default=""
         Data to be hashed. It is an optional parameter with a default value of an empty string.
         If no value is provided for `data`, an empty string will be hashed.
+    hash_engine : "HashEngine", default=sha3_512_digest
+        A callable that takes the UTF-8 encoded data and `length`, and returns the digest. See `HASH_ENGINES` for the
+        built-in engines.
+    length : int, default=98
+        The number of characters of the returned string that the caller uses, which engines with a variable output
+        size, such as `shake_256_digest`, use to size their digest.
+    truncate : bool, default=False
+        Whether to only return the first `length` characters, the same as `create_hash(...)[:length]`. Only the
+        leading base36 digits of the hash that are returned are encoded, which is most of the time of encoding a hash
+        for short lengths.
 
     Returns
     -------
@@ -128,11 +300,12 @@ def create_hash(data: str = "") -> str:
         Base36 encoding of the SHA-512 hash of the input string `data`, with the first character dropped.
 
     """
-    hashed_value: _Hash = sha512(data.encode())
-    hashed_int: int = int.from_bytes(hashed_value.digest(), byteorder="big")
+    digest: bytes = hash_engine(data.encode(), length)
 
     # Drop the first character because it will bias the histogram to the left.
-    return base36_encode(hashed_int)[1:]
+    if truncate:
+        return base36_encode_prefix(int.from_bytes(digest, byteorder="big"), length + 1)[1:]
+    return base36_encode_bytes(digest)[1:]
 
 
 def create_letter(random_generator: Random) -> str:
@@ -148,7 +321,10 @@ def create_letter(random_generator: Random) -> str:
     str
         a randomly generated lowercase letter from the English alphabet.
     """
-    alphabet: str = string.ascii_lowercase
+    if isinstance(random_generator, EntropyPool):
+        return random_generator.lowercase_letters(1)
+
+    alphabet: str = LOWERCASE_ALPHABET
     return alphabet[floor(random_generator.random() * len(alphabet))]
 
 
@@ -176,12 +352,106 @@ def base36_encode(number: int) -> str:
         msg = "Cannot encode negative integers."
         raise ValueError(msg)
 
-    encoded_string: str = ""
-    alphabet: str = string.digits + string.ascii_lowercase
-    alphabet_length: int = len(alphabet)
+    alphabet: str = _BASE36_ALPHABET
+    pairs: tuple[str, ...] = _BASE36_PAIRS
+
+    # Collect fixed-width chunks of five digits, least significant first, and join them once at the end
+    # instead of prepending to a string on every step.
+    chunks: list[str] = []
+    append = chunks.append
+    while number >= _BASE36_CHUNK:
+        number, chunk = divmod(number, _BASE36_CHUNK)
+        append(pairs[chunk // 46656] + pairs[chunk // 36 % 1296] + alphabet[chunk % 36])
+
+    # The most significant chunk is not zero-padded.
+    while number >= 1296:  # noqa: PLR2004 (magic value)
+        number, pair = divmod(number, 1296)
+        append(pairs[pair])
+    append(pairs[number] if number >= 36 else alphabet[number])  # noqa: PLR2004 (magic value)
+
+    chunks.reverse()
+    return "".join(chunks)
+
+
+def base36_encode_prefix(number: int, digits: int) -> str:
+    """Encodes the leading digits of a positive integer into a base36 string.
+
+    Parameters
+    ----------
+    number : int
+        Integer whose leading digits are encoded, such as a hash digest.
+    digits : int
+        The number of leading base36 digits to encode.
+
+    Returns
+    -------
+    str
+        The same string as `base36_encode(number)[:digits]`. Up to 512 bits, the number is divided by the power of 36
+        that drops the other digits instead of encoding them.
+
+    Raises
+    ------
+    ValueError
+        If the input integer is negative.
+    """
+    bit_length: int = number.bit_length()
+    if number < 0 or digits < 1 or bit_length > _MAXIMUM_HASH_BITS:
+        return base36_encode(number)[:digits]
+
+    # A lower bound of the number of base36 digits, from the bit length and a slight underestimate of log36(2), which
+    # is then raised to the exact count, usually by a single comparison.
+    number_digits: int = max((bit_length - 1) * 193426 // 1000000 + 1, 1)
+    while number >= BASE36_POWERS[number_digits]:
+        number_digits += 1
+
+    dropped_digits: int = number_digits - digits
+    if dropped_digits <= 0:
+        return base36_encode(number)
+    return base36_encode(number // BASE36_POWERS[dropped_digits])[:digits]
+
+
+def create_base36_encoder() -> Callable[[int], str]:
+    """Creates an encoder that returns the same strings as `base36_encode`, for values that change slowly, such as a
+    counter or a clock.
+
+    Returns
+    -------
+    Callable[[int], str]
+        Callable that takes a positive integer and returns its base36 encoding. The encoding of all but the four low
+        digits of the last value is kept, and only the four low digits are encoded again while the high digits do not
+        change: for 36**4 (about 1.7 million) increments of a counter, or 1.7 ms of `time.time_ns`. Encoders can be
+        shared between threads.
+    """
+    # A single tuple, so that threads always read a value and its encoding together.
+    cache: list[tuple[int, str]] = [(0, "")]
+    pairs: tuple[str, ...] = _BASE36_PAIRS
+
+    def encode(number: int) -> str:
+        high, low = divmod(number, _BASE36_LOW)
+        if not high:
+            return base36_encode(number)
+
+        cached: tuple[int, str] = cache[0]
+        if cached[0] != high:
+            cached = (high, base36_encode(high))
+            cache[0] = cached
+        return cached[1] + pairs[low // 1296] + pairs[low % 1296]
+
+    return encode
 
-    while number != 0:
-        number, mod = divmod(number, alphabet_length)
-        encoded_string = alphabet[mod] + encoded_string
 
-    return encoded_string or "0"
+def base36_encode_bytes(data: bytes) -> str:
+    """Encodes a big-endian byte string, such as a hash digest, into a base36 string.
+
+    Parameters
+    ----------
+    data : bytes
+        Bytes to be interpreted as a big-endian unsigned integer and encoded as a base36 string.
+
+    Returns
+    -------
+    str
+        A string that represents the base36 encoded input bytes.
+        If the input is empty or contains only zero bytes, the function returns the string "0".
+    """
+    return base36_encode(int.from_bytes(data, byteorder="big"))
@@ -0,0 +1,129 @@
+"""Validation of CUIDs, one at a time or in bulk."""
+
+from __future__ import annotations
+
+from operator import itemgetter
+
+from cuid2.generator import MAXIMUM_LENGTH
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from typing import Final, Union
+
+# The number of values checked at once by `validate_many`. Values are only checked one by one within a chunk that
+# contains a malformed value.
+CHUNK_SIZE: Final = 4096
+
+MIN_LENGTH: Final = 2
+
+_FIRST_CHARACTER: Final = itemgetter(0)
+
+
+def is_cuid(value: object, min_length: int = MIN_LENGTH, max_length: int = MAXIMUM_LENGTH) -> bool:
+    """Checks whether a value is a well-formed CUID: a lowercase letter followed by lowercase base36 digits.
+
+    Parameters
+    ----------
+    value : object
+        The value to check, usually a str. ASCII bytes are checked the same way, and any other type is rejected.
+    min_length : int, default=MIN_LENGTH (2)
+        The minimum accepted length.
+    max_length : int, default=MAXIMUM_LENGTH (98)
+        The maximum accepted length.
+
+    Returns
+    -------
+    bool
+        True if the value is a CUID of `min_length` to `max_length` characters.
+    """
+    if not isinstance(value, (str, bytes)):
+        return False
+
+    # `isalnum` and `islower` reject uppercase letters, whitespace, signs and underscores, and `isascii` rejects
+    # non-ASCII digits and letters.
+    return (
+        min_length <= len(value) <= max_length
+        and value.isascii()
+        and value.isalnum()
+        and value.islower()
+        and value[:1].isalpha()
+    )
+
+
+def _are_cuids(values: Sequence[Union[str, bytes]], min_length: int, max_length: int) -> bool:
+    # The checks of `is_cuid`, applied to every value at once with a few C-level passes. Values must all be str, or
+    # all be bytes.
+    if not values:
+        return True
+
+    lengths: list[int] = list(map(len, values))
+    if min(lengths) < max(1, min_length) or max(lengths) > max_length:
+        return False
+
+    joined: bytes
+    letters: bytes
+    if isinstance(values[0], str):
+        joined_text: str = "".join(values)  # type: ignore[arg-type]
+        if not joined_text.isascii():
+            return False
+        # The bytes predicates are much faster than the str ones, which look up every character in the Unicode
+        # database.
+        joined = joined_text.encode("ascii")
+        letters = "".join(map(_FIRST_CHARACTER, values)).encode("ascii")  # type: ignore[arg-type]
+    else:
+        joined = b"".join(values)  # type: ignore[arg-type]
+        letters = bytes(map(_FIRST_CHARACTER, values))  # type: ignore[arg-type]
+    return joined.isalnum() and joined.islower() and letters.isalpha()
+
+
+def _lines(buffer: Union[bytes, bytearray, memoryview]) -> list[bytes]:
+    lines: list[bytes] = bytes(buffer).split(b"\n")
+    if lines[-1] == b"":
+        # A trailing newline does not start another value.
+        lines.pop()
+    return lines
+
+
+def validate_many(
+    values: Union[Iterable[Union[str, bytes]], bytes, bytearray, memoryview],
+    min_length: int = MIN_LENGTH,
+    max_length: int = MAXIMUM_LENGTH,
+) -> list[int]:
+    """Checks many values at once, and returns the indexes of the values that are not well-formed CUIDs.
+
+    Values are checked a chunk at a time, with a few passes over the whole chunk in C, so that validating batches of
+    mostly well-formed CUIDs costs a small fraction of calling `is_cuid` on every value.
+
+    Parameters
+    ----------
+    values : Iterable[str | bytes] | bytes | bytearray | memoryview
+        The values to check, or a buffer of newline-delimited values, such as the contents of a file with one CUID
+        per line. A trailing newline is ignored, and carriage returns are not stripped.
+    min_length : int, default=MIN_LENGTH (2)
+        The minimum accepted length.
+    max_length : int, default=MAXIMUM_LENGTH (98)
+        The maximum accepted length.
+
+    Returns
+    -------
+    list[int]
+        The indexes, in increasing order, of the values (or lines) that are not CUIDs of `min_length` to
+        `max_length` characters. An empty list means that every value is a CUID.
+    """
+    items: Sequence[object]
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        items = _lines(values) if values else []
+    else:
+        items = values if isinstance(values, list) else list(values)
+
+    failures: list[int] = []
+    for start in range(0, len(items), CHUNK_SIZE):
+        chunk: Sequence[object] = items[start : start + CHUNK_SIZE]
+        kinds: set[type] = set(map(type, chunk))
+        if kinds in ({str}, {bytes}) and _are_cuids(chunk, min_length, max_length):  # type: ignore[arg-type]
+            continue
+
+        failures.extend(start + index for index, item in enumerate(chunk) if not is_cuid(item, min_length, max_length))
+    return failures
@@ -0,0 +1,231 @@
+"""Vectorized bulk generation of CUIDs into NumPy arrays.
+
+NumPy is an optional dependency of cuid2, and is only imported when `generate_array` is first called.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from cuid2 import utils
+from cuid2.entropy import EntropyPool
+from cuid2.generator import DEFAULT_LENGTH, MAXIMUM_LENGTH, Cuid
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Any, Final, Optional
+
+    import numpy as np
+    import numpy.typing as npt
+
+# The number of CUIDs generated at a time, to bound the memory used by intermediate arrays.
+CHUNK_SIZE: Final = 65_536
+
+_BASE36_ALPHABET: Final = b"0123456789abcdefghijklmnopqrstuvwxyz"
+_LETTER_ALPHABET: Final = b"abcdefghijklmnopqrstuvwxyz"
+
+# Six base36 digits are extracted per step of the long division over 32-bit limbs, since 36**6 < 2**32.
+_DIGITS_PER_STEP: Final = 6
+
+
+class _BlockCounter:
+    """A thread-safe counter that can also reserve a block of consecutive values at once."""
+
+    def __init__(self: _BlockCounter, count: int) -> None:
+        self._count: int = count
+        self._lock: threading.Lock = threading.Lock()
+
+    def __call__(self: _BlockCounter) -> int:
+        return self.reserve(1)
+
+    def reserve(self: _BlockCounter, size: int) -> int:
+        """Reserves `size` consecutive values, and returns the first one."""
+        with self._lock:
+            first: int = self._count + 1
+            self._count += size
+            return first
+
+
+_cuid: Optional[Cuid] = None
+_cuid_lock: threading.Lock = threading.Lock()
+
+
+def _default_cuid() -> Cuid:
+    global _cuid  # noqa: PLW0603 (global statement) # pylint: disable=global-statement
+    with _cuid_lock:
+        if _cuid is None:
+            # Like any Cuid, its counter and fingerprint are derived again after `os.fork`.
+            _cuid = Cuid(counter=_BlockCounter)
+        return _cuid
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+    except ImportError as error:
+        msg = "cuid2.vectorized requires NumPy, install it with `pip install numpy`."
+        raise ImportError(msg) from error
+    return np
+
+
+def _random_symbols(np: Any, pool: EntropyPool, count: int, alphabet: bytes) -> npt.NDArray[np.uint8]:
+    """Draws `count` unbiased symbols from `alphabet`, as ASCII codes, by rejection sampling random bytes."""
+    limit: int = 256 - 256 % len(alphabet)
+    table: npt.NDArray[np.uint8] = np.frombuffer(alphabet, dtype=np.uint8)
+    symbols: npt.NDArray[np.uint8] = np.empty(count, dtype=np.uint8)
+    filled: int = 0
+    while filled < count:
+        # Draw a few more bytes than expected to be needed, so that a second round is rarely required.
+        missing: int = count - filled
+        candidates: npt.NDArray[np.uint8] = np.frombuffer(pool.randbytes(missing * 256 // limit + 16), dtype=np.uint8)
+        accepted: npt.NDArray[np.uint8] = candidates[candidates < limit][:missing]
+        symbols[filled : filled + len(accepted)] = table[accepted % len(alphabet)]
+        filled += len(accepted)
+    return symbols
+
+
+def _base36_columns(np: Any, values: npt.NDArray[np.uint64], width: int) -> npt.NDArray[np.uint8]:
+    """Encodes unsigned integers as zero-padded base36 ASCII digits, one row per value."""
+    table: npt.NDArray[np.uint8] = np.frombuffer(_BASE36_ALPHABET, dtype=np.uint8)
+    digits: npt.NDArray[np.uint8] = np.empty((len(values), width), dtype=np.uint8)
+    remaining: npt.NDArray[np.uint64] = values.copy()
+    for column in range(width - 1, -1, -1):
+        digits[:, column] = table[remaining % 36]
+        remaining //= 36
+    return digits
+
+
+def _leading_digits(np: Any, quotients: bytes, count: int, quotient_bytes: int, width: int) -> npt.NDArray[np.uint8]:
+    """Extracts `width` zero-padded base36 digit values from fixed-width, big-endian unsigned integers, with a long
+    division over 32-bit limbs that is vectorized across rows.
+    """
+    limbs: npt.NDArray[np.uint64] = (
+        np.frombuffer(quotients, dtype=">u4").reshape(count, quotient_bytes // 4).astype(np.uint64)
+    )
+    divisor: int = 36**_DIGITS_PER_STEP
+    digits: npt.NDArray[np.uint8] = np.zeros((count, width), dtype=np.uint8)
+    column: int = width
+    while column > 0:
+        remainder: npt.NDArray[np.uint64] = np.zeros(count, dtype=np.uint64)
+        for limb in range(limbs.shape[1]):
+            current: npt.NDArray[np.uint64] = (remainder << np.uint64(32)) | limbs[:, limb]
+            limbs[:, limb] = current // np.uint64(divisor)
+            remainder = current % np.uint64(divisor)
+
+        for _ in range(min(_DIGITS_PER_STEP, column)):
+            column -= 1
+            digits[:, column] = remainder % np.uint64(36)
+            remainder //= np.uint64(36)
+    return digits
+
+
+def _generate_chunk(np: Any, cuid: Cuid, count: int, length: int) -> npt.NDArray[Any]:
+    pool: EntropyPool = cuid._random  # type: ignore[assignment] # noqa: SLF001 (private member accessed)
+    counter: _BlockCounter = cuid._counter  # type: ignore[assignment] # noqa: SLF001 (private member accessed)
+    fingerprint: bytes = cuid._fingerprint.encode()  # noqa: SLF001 (private member accessed)
+
+    letters: npt.NDArray[np.uint8] = _random_symbols(np, pool, count, _LETTER_ALPHABET)
+    salts: npt.NDArray[np.uint8] = _random_symbols(np, pool, count * length, _BASE36_ALPHABET).reshape(count, length)
+    # A single clock read per chunk: every CUID of a chunk still has a distinct counter and salt.
+    base36_time: bytes = utils.base36_encode(time.time_ns()).encode()
+    first_count: int = counter.reserve(count)
+
+    # The counter is encoded without padding, so the rows are built separately for every run of counter values that
+    # have the same number of base36 digits.
+    hash_inputs: list[bytes] = []
+    start: int = 0
+    while start < count:
+        first_value: int = first_count + start
+        width: int = len(utils.base36_encode(first_value))
+        stop: int = min(count, utils.BASE36_POWERS[width] - first_count)
+        counts: npt.NDArray[np.uint64] = np.arange(first_value, first_count + stop, dtype=np.uint64)
+
+        row_length: int = len(base36_time) + length + width + len(fingerprint)
+        rows: npt.NDArray[np.uint8] = np.empty((stop - start, row_length), dtype=np.uint8)
+        rows[:, : len(base36_time)] = np.frombuffer(base36_time, dtype=np.uint8)
+        rows[:, len(base36_time) : len(base36_time) + length] = salts[start:stop]
+        rows[:, len(base36_time) + length : len(base36_time) + length + width] = _base36_columns(np, counts, width)
+        rows[:, len(base36_time) + length + width :] = np.frombuffer(fingerprint, dtype=np.uint8)
+
+        data: memoryview = memoryview(rows.tobytes())
+        hash_inputs.extend(data[offset : offset + row_length] for offset in range(0, len(data), row_length))
+        start = stop
+
+    # Only the leading `length + 1` digits of each hash are kept by `Cuid.generate`. Each hash is reduced to those
+    # digits with a single bignum division, and the digits themselves are extracted in bulk.
+    digit_count: int = length + 1
+    quotient_bytes: int = -(-(utils.BASE36_POWERS[digit_count] - 1).bit_length() // 32) * 4
+    powers: tuple[int, ...] = utils.BASE36_POWERS
+    sha512 = utils.sha512
+    quotients: bytearray = bytearray(count * quotient_bytes)
+    shortfall: npt.NDArray[np.intp] = np.zeros(count, dtype=np.intp)
+    for row, hash_input in enumerate(hash_inputs):
+        hashed_int: int = int.from_bytes(sha512(hash_input).digest(), byteorder="big")
+        digits: int = len(powers)
+        while digits > 1 and hashed_int < powers[digits - 1]:
+            digits -= 1
+
+        if digits > digit_count:
+            hashed_int //= powers[digits - digit_count]
+        else:
+            shortfall[row] = digit_count - digits
+        quotients[row * quotient_bytes : (row + 1) * quotient_bytes] = hashed_int.to_bytes(quotient_bytes, "big")
+
+    leading: npt.NDArray[np.uint8] = _leading_digits(np, bytes(quotients), count, quotient_bytes, digit_count)
+
+    # Skip the two dropped digits, after any zero padding of hashes with fewer than `length + 1` digits. Those rare
+    # CUIDs are shorter than `length`, exactly like the output of `Cuid.generate`, and are padded with null bytes.
+    columns: npt.NDArray[np.intp] = shortfall[:, None] + 2 + np.arange(length - 1)
+    in_range: npt.NDArray[np.bool_] = columns < digit_count
+    body: npt.NDArray[np.uint8] = np.take_along_axis(leading, np.minimum(columns, digit_count - 1), axis=1)
+
+    output: npt.NDArray[np.uint8] = np.empty((count, length), dtype=np.uint8)
+    output[:, 0] = letters
+    output[:, 1:] = np.where(in_range, np.frombuffer(_BASE36_ALPHABET, dtype=np.uint8)[body], 0)
+    return output.view(f"S{length}").reshape(count)
+
+
+def generate_array(count: int, length: int = DEFAULT_LENGTH) -> npt.NDArray[Any]:
+    """Generates a NumPy array of universally unique, base36 encoded byte strings.
+
+    The entropy draws, the timestamp and counter encoding, and the base36 digit extraction are vectorized, and every
+    CUID is still hashed individually with SHA3. The CUIDs are format-compatible with `Cuid.generate()`, and come
+    from a process-wide generator whose counter and fingerprint are derived again after `os.fork`.
+
+    Parameters
+    ----------
+    count : int
+        The number of CUIDs to generate.
+    length : int, default=DEFAULT_LENGTH (24)
+        The length of the generated CUIDs.
+        A length value greater than `MAXIMUM_LENGTH` (98 characters) will raise a ValueError.
+
+    Returns
+    -------
+    numpy.ndarray
+        A one-dimensional array of `count` fixed-width `S<length>` byte strings.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    ValueError
+        If the length parameter is less than 1, or greater than `MAXIMUM_LENGTH` (98 characters).
+        If the count parameter is negative.
+    """
+    if not 1 <= length <= MAXIMUM_LENGTH:
+        msg = "Length must be between 1 and 98 characters."
+        raise ValueError(msg)
+
+    if count < 0:
+        msg = "Cannot generate a negative number of CUIDs."
+        raise ValueError(msg)
+
+    np = _import_numpy()
+    cuid: Cuid = _default_cuid()
+    chunks: list[npt.NDArray[Any]] = [
+        _generate_chunk(np, cuid, min(CHUNK_SIZE, count - start), length) for start in range(0, count, CHUNK_SIZE)
+    ]
+    return np.concatenate(chunks) if chunks else np.empty(0, dtype=f"S{length}")